@@ -0,0 +1,355 @@
+"""
+Benchmarks de carregamento, análises e pré-processamento dos dados de jogos.
+
+Para cada tamanho de catálogo sintético (veja `gerador_catalogo`), mede o
+tempo e o pico de memória alocada (via `tracemalloc`) de:
+
+- `DadosJogos.carregar_dados`, sem e com o cache binário;
+- a criação do índice de nomes e as buscas exata, por prefixo e aproximada;
+- cada método de análise de `AnalisadorJogos` e a execução das análises
+  em paralelo;
+- a leitura do CSV com pandas (completa e com `load_raw_data`), `preprocess_data`,
+  `save_processed_data` e a releitura dos dados processados em CSV e no
+  formato colunar (completa e só com as partições de 2018 a 2022), além do
+  pré-processamento em blocos direto do CSV bruto (`preprocess_csv`);
+- o top 10 do Metacritic, ordenando tudo e com `top_k`;
+- o cálculo do cubo de agregados (`build_cube`), uma consulta a ele e a
+  gravação dos gráficos em PNG e SVG (`render_charts`), desenhando todos e
+  sem mudanças nos dados;
+- o gráfico de preço x proporção de avaliações positivas de todos os jogos,
+  como dispersão e como grade de densidade (`plot_density`);
+- as estatísticas das cinco publicadoras com mais jogos pagos, filtrando
+  cada uma e com `company_stats` para todas as publicadoras;
+- o relatório em lote com as análises das duas fases (`gerar_relatorio`).
+
+Os resultados podem ser gravados como linha de base; nas execuções
+seguintes, qualquer medida que piore além do limite configurado em relação
+à linha de base faz o programa terminar com código de saída 1.
+
+Uso:
+    python -m benchmarks.executar_benchmarks --tamanhos 10k 100k --salvar-base
+    python -m benchmarks.executar_benchmarks --tamanhos 10k 100k
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from benchmarks.gerador_catalogo import TAMANHOS, caminho_catalogo
+from src.fase1.acumuladores import ANALISES_PADRAO
+from src.fase1.analisador_jogos import AnalisadorJogos
+from src.fase1.busca_nomes import IndiceNomes
+from src.fase1.dados_jogos import DadosJogos
+
+try:
+    import pandas as pd
+    from src.fase2.cubo import build_cube
+    from src.fase2.empresas import company_stats
+    from src.fase2.ranking import top_k
+    from src.fase2.preprocessamento import (PREPROCESS_COLUMNS, load_processed_data, load_raw_data, preprocess_csv,
+                                            preprocess_data, save_processed_data)
+    from src.relatorio import gerar_relatorio
+except ImportError:  # pragma: no cover - depende do ambiente
+    pd = None
+
+try:
+    from matplotlib.figure import Figure
+    from src.fase2.visualizacao import plot_density, render_charts
+except ImportError:  # pragma: no cover - depende do ambiente
+    render_charts = None
+
+# Arquivo padrão da linha de base
+ARQUIVO_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'linha_base.json')
+
+# Piora relativa tolerada antes de uma medida ser considerada regressão
+LIMITE_REGRESSAO = 0.25
+
+# Diferenças absolutas abaixo destas são tratadas como ruído de medição
+TOLERANCIA_SEGUNDOS = 0.02
+TOLERANCIA_MEMORIA_MB = 1.0
+
+Caso = Tuple[str, Callable[[], Any]]
+
+
+def medir(funcao: Callable[[], Any], repeticoes: int = 1, memoria: bool = True) -> Dict[str, float]:
+    """
+    Mede o tempo e o pico de memória de uma função.
+
+    O tempo é o menor de `repeticoes` execuções sem `tracemalloc` (que deixa
+    o código mais lento); o pico de memória vem de uma execução separada com
+    `tracemalloc` ativo.
+
+    Args:
+        funcao (Callable): Função sem argumentos a ser medida.
+        repeticoes (int, opcional): Número de execuções cronometradas.
+        memoria (bool, opcional): Se False, não mede a memória.
+
+    Returns:
+        Dict[str, float]: 'segundos' e, se medido, 'pico_memoria_mb'.
+    """
+    tempos = []
+    for _ in range(max(1, repeticoes)):
+        gc.collect()
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    medida = {'segundos': round(min(tempos), 4)}
+
+    if memoria:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            funcao()
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        medida['pico_memoria_mb'] = round(pico / (1024 * 1024), 2)
+    return medida
+
+
+def _casos_fase1(caminho: str) -> Iterator[Caso]:
+    """Casos de carregamento e de análise com as classes da fase 1."""
+    yield 'carregar_dados', lambda: DadosJogos().carregar_dados(caminho, usar_cache=False)
+
+    # Garante que o cache exista antes de medir a carga a partir dele
+    DadosJogos().carregar_dados(caminho, usar_cache=True)
+    yield 'carregar_dados_cache', lambda: DadosJogos().carregar_dados(caminho, usar_cache=True)
+
+    dados = DadosJogos()
+    dados.carregar_dados(caminho, usar_cache=True)
+    nome = dados.tabela.nomes[len(dados.tabela) // 2]
+    yield 'indice_nomes', lambda: IndiceNomes(dados.tabela.nomes, dados.tabela.app_ids)
+    indice = dados.indice_nomes()
+    yield 'busca_nome_exata', lambda: indice.exato(nome)
+    yield 'busca_nome_prefixo', lambda: indice.prefixo(nome[:4])
+    yield 'busca_nome_aproximada', lambda: indice.aproximado(nome[1:])
+
+    analisador = AnalisadorJogos()
+    analisador.carregar_dados(caminho, usar_cache=True)
+    yield 'analisar_gratuitos_vs_pagos', analisador.analisar_gratuitos_vs_pagos
+    yield 'analisar_ano_com_mais_lancamentos', analisador.analisar_ano_com_mais_lancamentos
+    yield 'analisar_generos_por_faixa_preco', analisador.analisar_generos_por_faixa_preco
+    yield 'obter_estatisticas_preco_por_genero', analisador.obter_estatisticas_preco_por_genero
+    yield 'estimar_estatisticas_preco', analisador.estimar_estatisticas_preco
+    yield 'executar_analises_4_processos', lambda: analisador.executar_analises(ANALISES_PADRAO, processos=4)
+
+
+def _casos_fase2(caminho: str, diretorio_saida: str) -> Iterator[Caso]:
+    """Casos de leitura e pré-processamento com pandas da fase 2."""
+    yield 'ler_csv_pandas', lambda: pd.read_csv(caminho)
+    yield 'load_raw_data_colunas_preprocess', lambda: load_raw_data(caminho, columns=PREPROCESS_COLUMNS)
+
+    bruto = pd.read_csv(caminho)
+    yield 'preprocess_data', lambda: preprocess_data(bruto)
+
+    processado = preprocess_data(bruto)
+    del bruto
+    saida = os.path.join(diretorio_saida, 'processado.csv')
+    yield 'save_processed_data', lambda: save_processed_data(processado, saida)
+
+    metacritic = processado.dropna(subset=['metacritic_score'])
+    yield 'top10_metacritic_ordenacao', lambda: metacritic.sort_values(
+        ['metacritic_score', 'release_date'], ascending=[False, True]).drop_duplicates(subset=['name']).head(10)
+    yield 'top10_metacritic_top_k', lambda: top_k(metacritic, 10, by=['metacritic_score', 'release_date'],
+                                                  ascending=[False, True], distinct='name')
+    del metacritic
+
+    pagos = processado[processado['is_paid']]
+
+    def publicadoras_filtrando():
+        estatisticas = []
+        for publicadora in pagos['publisher'].value_counts().head(5).index:
+            jogos = pagos[pagos['publisher'] == publicadora]
+            estatisticas.append((publicadora, len(jogos), jogos['positive'].mean(), jogos['positive'].median()))
+        return estatisticas
+
+    yield 'top5_publicadoras_filtrando', publicadoras_filtrando
+    yield 'company_stats_publicadoras', lambda: company_stats(pagos, 'publisher')
+    del pagos
+
+    yield 'build_cube', lambda: build_cube(processado)
+    cubo = build_cube(processado)
+    yield 'cube_linux_por_ano', lambda: cubo.share('supports_linux', by=['release_year'],
+                                                   where={'release_year': range(2018, 2023)})
+    if render_charts is not None:
+        graficos = os.path.join(diretorio_saida, 'graficos')
+        yield 'render_charts', lambda: render_charts(cubo, graficos, force=True)
+        yield 'render_charts_sem_mudancas', lambda: render_charts(cubo, graficos)
+
+        avaliacoes = processado['positive'] + processado['negative']
+        proporcao = processado['positive'] / avaliacoes.where(avaliacoes > 0)
+
+        def desenhar(plotar):
+            eixos = Figure().add_subplot()
+            plotar(eixos)
+            eixos.figure.savefig(io.BytesIO(), format='png')
+
+        yield 'scatter_preco_avaliacoes', lambda: desenhar(
+            lambda eixos: eixos.scatter(processado['price'], proporcao, s=2))
+        yield 'plot_density_preco_avaliacoes', lambda: desenhar(
+            lambda eixos: plot_density(processado['price'], proporcao, log_x=True, ax=eixos))
+
+    colunar = os.path.join(diretorio_saida, 'processado')
+    yield 'save_processed_data_colunar', lambda: save_processed_data(processado, colunar)
+    yield 'load_processed_data_csv', lambda: pd.read_csv(saida)
+    yield 'load_processed_data_colunar', lambda: load_processed_data(colunar)
+    yield 'load_processed_data_linux_2018_2022', lambda: load_processed_data(
+        colunar, columns=['release_year', 'supports_linux'], partitions=range(2018, 2023))
+    del processado
+
+    em_blocos = os.path.join(diretorio_saida, 'em_blocos.csv')
+    yield 'preprocess_csv_em_blocos', lambda: preprocess_csv(caminho, em_blocos, columns=PREPROCESS_COLUMNS)
+    yield 'gerar_relatorio', lambda: gerar_relatorio(caminho)
+
+
+def executar(tamanhos: List[int], repeticoes: int = 1, memoria: bool = True,
+             diretorio_dados: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Executa todos os casos para cada tamanho de catálogo.
+
+    Args:
+        tamanhos (List[int]): Números de jogos dos catálogos.
+        repeticoes (int, opcional): Execuções cronometradas por caso.
+        memoria (bool, opcional): Se False, não mede a memória.
+        diretorio_dados (str, opcional): Onde os catálogos são gerados e guardados.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, float]]]: Medidas de cada caso, por tamanho.
+    """
+    resultados = {}
+    for tamanho in tamanhos:
+        caminho = caminho_catalogo(tamanho, diretorio=diretorio_dados)
+        medidas = resultados[str(tamanho)] = {}
+        with tempfile.TemporaryDirectory() as diretorio_saida:
+            casos = [_casos_fase1(caminho)]
+            if pd is not None:
+                casos.append(_casos_fase2(caminho, diretorio_saida))
+            terminal = sys.stdout
+            # As mensagens dos métodos medidos não fazem parte do relatório
+            with contextlib.redirect_stdout(io.StringIO()):
+                for gerador_casos in casos:
+                    for nome, funcao in gerador_casos:
+                        medidas[nome] = medir(funcao, repeticoes, memoria)
+                        print(f"{tamanho:>10} {nome:<38} {_formatar(medidas[nome])}", file=terminal, flush=True)
+    return resultados
+
+
+def _formatar(medida: Dict[str, float]) -> str:
+    """Formata uma medida para exibição."""
+    texto = f"{medida['segundos']:>10.4f} s"
+    if 'pico_memoria_mb' in medida:
+        texto += f" {medida['pico_memoria_mb']:>10.2f} MB"
+    return texto
+
+
+def comparar(resultados: Dict[str, Dict[str, Dict[str, float]]],
+             base: Dict[str, Dict[str, Dict[str, float]]],
+             limite: float = LIMITE_REGRESSAO) -> List[str]:
+    """
+    Compara os resultados com a linha de base.
+
+    Args:
+        resultados: Medidas atuais, como retornadas por `executar`.
+        base: Medidas da linha de base.
+        limite (float, opcional): Piora relativa tolerada (0,25 = 25%).
+
+    Returns:
+        List[str]: Descrição de cada regressão encontrada (vazia se nenhuma).
+    """
+    regressoes = []
+    tolerancias = {'segundos': TOLERANCIA_SEGUNDOS, 'pico_memoria_mb': TOLERANCIA_MEMORIA_MB}
+    for tamanho, medidas in resultados.items():
+        for nome, medida in medidas.items():
+            anterior = base.get(tamanho, {}).get(nome)
+            if not anterior:
+                continue
+            for chave, tolerancia in tolerancias.items():
+                if chave not in medida or chave not in anterior:
+                    continue
+                atual, referencia = medida[chave], anterior[chave]
+                if atual > referencia * (1 + limite) and atual - referencia > tolerancia:
+                    aumento = f"+{(atual / referencia - 1) * 100:.0f}%" if referencia else "novo"
+                    regressoes.append(f"{nome} ({tamanho} jogos): {chave} passou de {referencia} "
+                                      f"para {atual} ({aumento})")
+    return regressoes
+
+
+def _ler_base(caminho: str) -> Dict[str, Any]:
+    """Lê o arquivo de linha de base, ou retorna uma base vazia se ele não existir."""
+    if not os.path.exists(caminho):
+        return {'resultados': {}}
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        return json.load(arquivo)
+
+
+def _salvar_base(caminho: str, resultados: Dict[str, Any], anterior: Dict[str, Any]) -> None:
+    """Grava a linha de base, preservando os tamanhos que não foram medidos agora."""
+    base = dict(anterior.get('resultados', {}))
+    base.update(resultados)
+    conteudo = {
+        'ambiente': {
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'processador': platform.processor() or platform.machine(),
+        },
+        'resultados': base,
+    }
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(conteudo, arquivo, indent=2, ensure_ascii=False)
+
+
+def _ler_tamanho(texto: str) -> int:
+    """Converte '10k', '1m' ou um número em quantidade de jogos."""
+    return TAMANHOS.get(texto.lower()) or int(texto)
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """Executa os benchmarks a partir da linha de comando e retorna o código de saída."""
+    parser = argparse.ArgumentParser(description="Benchmarks dos dados de jogos da Steam.")
+    parser.add_argument('--tamanhos', nargs='+', default=['10k', '100k'],
+                        help=f"Tamanhos dos catálogos ({', '.join(TAMANHOS)} ou um número)")
+    parser.add_argument('--repeticoes', type=int, default=3, help="Execuções cronometradas por caso")
+    parser.add_argument('--sem-memoria', action='store_true', help="Não mede o pico de memória")
+    parser.add_argument('--base', default=ARQUIVO_BASE, help="Arquivo JSON da linha de base")
+    parser.add_argument('--salvar-base', action='store_true', help="Grava os resultados como nova linha de base")
+    parser.add_argument('--limite', type=float, default=LIMITE_REGRESSAO,
+                        help="Piora relativa tolerada antes de falhar (0.25 = 25%%)")
+    parser.add_argument('--saida', help="Arquivo JSON onde gravar os resultados desta execução")
+    parser.add_argument('--dados', help="Diretório onde os catálogos sintéticos são guardados")
+    opcoes = parser.parse_args(argumentos)
+
+    if pd is None:
+        print("Aviso: pandas não está instalado; os casos da fase 2 serão ignorados.")
+
+    tamanhos = [_ler_tamanho(tamanho) for tamanho in opcoes.tamanhos]
+    resultados = executar(tamanhos, opcoes.repeticoes, not opcoes.sem_memoria, opcoes.dados)
+
+    if opcoes.saida:
+        with open(opcoes.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultados, arquivo, indent=2)
+
+    base = _ler_base(opcoes.base)
+    if opcoes.salvar_base:
+        _salvar_base(opcoes.base, resultados, base)
+        print(f"Linha de base salva em {opcoes.base}")
+        return 0
+
+    regressoes = comparar(resultados, base.get('resultados', {}), opcoes.limite)
+    for regressao in regressoes:
+        print(f"Regressão: {regressao}")
+    if not base.get('resultados'):
+        print(f"Nenhuma linha de base em {opcoes.base}; use --salvar-base para criá-la.")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
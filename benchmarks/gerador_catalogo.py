@@ -0,0 +1,206 @@
+"""
+Gerador determinístico de catálogos sintéticos no formato do CSV da Steam.
+
+Os arquivos gerados têm as mesmas 39 colunas de `data/raw/steam_games.csv`,
+com listas de gêneros e categorias separadas por vírgula, desenvolvedores e
+publicadoras separados por ponto e vírgula, datas em vários formatos, listas
+de URLs em Screenshots e Movies e textos com vírgulas, aspas e quebras de
+linha. A mesma semente sempre produz o mesmo arquivo, byte a byte.
+
+Uso:
+    python -m benchmarks.gerador_catalogo 100000 catalogo.csv
+"""
+
+import argparse
+import csv
+import os
+import random
+from itertools import accumulate
+from typing import List, Optional
+
+COLUNAS = [
+    'AppID', 'Name', 'Release date', 'Estimated owners', 'Peak CCU', 'Required age', 'Price',
+    'DLC count', 'About the game', 'Supported languages', 'Full audio languages', 'Reviews',
+    'Header image', 'Website', 'Support url', 'Support email', 'Windows', 'Mac', 'Linux',
+    'Metacritic score', 'Metacritic url', 'User score', 'Positive', 'Negative', 'Score rank',
+    'Achievements', 'Recommendations', 'Notes', 'Average playtime forever',
+    'Average playtime two weeks', 'Median playtime forever', 'Median playtime two weeks',
+    'Developers', 'Publishers', 'Categories', 'Genres', 'Tags', 'Screenshots', 'Movies',
+]
+
+# Tamanhos de catálogo usados nos benchmarks, pelo nome
+TAMANHOS = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000,
+}
+
+# Diretório onde os catálogos gerados para os benchmarks são guardados
+DIRETORIO_DADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dados')
+
+SEMENTE_PADRAO = 42
+
+GENEROS = [
+    'Indie', 'Casual', 'Action', 'Adventure', 'Simulation', 'Strategy', 'RPG', 'Early Access',
+    'Free to Play', 'Sports', 'Racing', 'Massively Multiplayer', 'Education', 'Utilities',
+    'Design & Illustration', 'Animation & Modeling', 'Violent', 'Gore', 'Nudity',
+]
+
+CATEGORIAS = [
+    'Single-player', 'Steam Achievements', 'Steam Cloud', 'Full controller support',
+    'Multi-player', 'Partial Controller Support', 'Steam Trading Cards', 'PvP', 'Co-op',
+    'Online PvP', 'Steam Leaderboards', 'Remote Play Together', 'Shared/Split Screen',
+    'Family Sharing', 'In-App Purchases', 'Includes level editor', 'VR Support',
+]
+
+PALAVRAS_NOME = [
+    'Dark', 'Quest', 'Legends', 'Space', 'Pixel', 'Dungeon', 'Heroes', 'Simulator', 'Tales',
+    'Shadow', 'Kingdom', 'Zombie', 'Racing', 'Puzzle', 'Empire', 'Soul', 'Café', 'Star',
+    'Knight', 'Tycoon', 'Farm', 'Survival', 'Odyssey', 'Ninja', 'Robot', 'Dragon', 'Hotel',
+]
+
+MESES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+PRECOS = ['0', '0.49', '0.99', '1.99', '2.99', '4.99', '6.99', '9.99', '12.99', '14.99',
+          '19.99', '24.99', '29.99', '39.99', '49.99', '59.99', '69.99', '99.99']
+PESOS_PRECOS = [18, 3, 10, 8, 6, 12, 4, 10, 4, 7, 6, 3, 3, 2, 1, 1, 1, 0.5]
+
+DONOS = ['0 - 20000', '20000 - 50000', '50000 - 100000', '100000 - 200000',
+         '200000 - 500000', '500000 - 1000000', '1000000 - 2000000', '2000000 - 5000000']
+PESOS_DONOS = [60, 12, 8, 7, 6, 4, 2, 1]
+
+IDIOMAS = ["['English']", "['English', 'French', 'German']", "['English', 'Simplified Chinese']",
+           "['English', 'Russian', 'Spanish - Spain', 'Portuguese - Brazil']"]
+
+SOBRE = [
+    'A short game about things.',
+    'Explore, fight and build in a world full of secrets.',
+    'Um jogo de "aventura" com\nvárias linhas de descrição, vírgulas e aspas.',
+    'The sequel to the award-winning "Quest".\r\nNow with co-op!',
+]
+
+
+def _pesos_zipf(quantidade: int, expoente: float = 1.1) -> List[float]:
+    """Pesos cumulativos de uma distribuição de Zipf sobre `quantidade` itens."""
+    return list(accumulate(1 / (posicao + 1) ** expoente for posicao in range(quantidade)))
+
+
+def _formatar_data(gerador: random.Random, ano: int) -> str:
+    """Gera uma data de lançamento em um dos formatos encontrados no CSV real."""
+    sorteio = gerador.random()
+    if sorteio < 0.86:
+        return f"{MESES[gerador.randrange(12)]} {gerador.randint(1, 28)}, {ano}"
+    if sorteio < 0.93:
+        return f"{MESES[gerador.randrange(12)]} {ano}"
+    if sorteio < 0.97:
+        return f"{gerador.randint(1, 28)} {MESES[gerador.randrange(12)]}, {ano}"
+    if sorteio < 0.99:
+        return f"{ano}-{gerador.randint(1, 12):02d}-{gerador.randint(1, 28):02d}"
+    return 'Coming soon'
+
+
+def gerar_catalogo(caminho_arquivo: str, linhas: int, semente: int = SEMENTE_PADRAO) -> None:
+    """
+    Gera um catálogo sintético da Steam em um arquivo CSV.
+
+    Args:
+        caminho_arquivo (str): Caminho do CSV a ser criado.
+        linhas (int): Número de jogos do catálogo.
+        semente (int, opcional): Semente do gerador; a mesma semente gera o mesmo arquivo.
+    """
+    gerador = random.Random(semente)
+    anos = list(range(1997, 2025))
+    pesos_anos = list(accumulate((ano - 1990) ** 2 for ano in anos))
+    pesos_generos = _pesos_zipf(len(GENEROS), 0.8)
+    pesos_categorias = _pesos_zipf(len(CATEGORIAS), 0.7)
+    # Publicadoras e desenvolvedores seguem uma cauda longa, como no catálogo real
+    num_publicadoras = max(10, linhas // 4)
+    num_desenvolvedores = max(10, linhas // 3)
+    pesos_publicadoras = _pesos_zipf(num_publicadoras)
+    pesos_desenvolvedores = _pesos_zipf(num_desenvolvedores)
+
+    escolher = gerador.choices
+    diretorio = os.path.dirname(caminho_arquivo)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    temporario = f"{caminho_arquivo}.{os.getpid()}.tmp"
+    with open(temporario, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(COLUNAS)
+        for indice in range(linhas):
+            app_id = 10 + indice * 10
+            ano = escolher(anos, cum_weights=pesos_anos)[0]
+            preco = escolher(PRECOS, weights=PESOS_PRECOS)[0]
+            nome = ' '.join(gerador.sample(PALAVRAS_NOME, gerador.randint(1, 3)))
+            if gerador.random() < 0.6:
+                nome = f"{nome} {gerador.randint(2, 9)}"
+            if gerador.random() < 0.02:
+                nome = f'{nome}: "Edição", Especial'
+
+            generos = sorted(set(escolher(GENEROS, cum_weights=pesos_generos, k=gerador.randint(1, 4))),
+                             key=GENEROS.index)
+            categorias = sorted(set(escolher(CATEGORIAS, cum_weights=pesos_categorias, k=gerador.randint(0, 6))),
+                                key=CATEGORIAS.index)
+            publicadoras = [f"Publisher {numero}" for numero in
+                            escolher(range(num_publicadoras), cum_weights=pesos_publicadoras, k=gerador.randint(0, 2))]
+            desenvolvedores = [f"Studio {numero}" for numero in
+                               escolher(range(num_desenvolvedores), cum_weights=pesos_desenvolvedores,
+                                        k=gerador.randint(1, 2))]
+            positivas = int(gerador.paretovariate(0.9)) - 1
+            negativas = int(positivas * gerador.random() * 0.4)
+            metacritic = gerador.randint(40, 97) if gerador.random() < 0.05 else 0
+            screenshots = ','.join(f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/ss_{numero}.jpg"
+                                   for numero in range(gerador.randint(0, 20)))
+            filmes = ','.join(f"http://cdn.akamai.steamstatic.com/steam/apps/{app_id}/movie{numero}.mp4"
+                              for numero in range(gerador.choice([0, 1, 1, 1, 2, 3])))
+
+            escritor.writerow([
+                app_id, nome, _formatar_data(gerador, ano), escolher(DONOS, weights=PESOS_DONOS)[0],
+                positivas // 50, gerador.choice([0, 0, 0, 0, 13, 17, 18]), preco,
+                int(gerador.expovariate(1.5)), gerador.choice(SOBRE), gerador.choice(IDIOMAS), '[]',
+                '', f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/header.jpg", '', '', '',
+                'True', gerador.choice(['True', 'False', 'False', 'False']),
+                gerador.choice(['True', 'False', 'False', 'False', 'False']),
+                metacritic, '', 0, positivas, negativas, '', gerador.choice([0, 0, 12, 30]),
+                positivas // 10, '', int(gerador.expovariate(0.01)), 0, 0, 0,
+                ';'.join(desenvolvedores), ';'.join(publicadoras), ','.join(categorias),
+                ','.join(generos), ','.join(generos[:2]), screenshots, filmes,
+            ])
+    os.replace(temporario, caminho_arquivo)
+
+
+def caminho_catalogo(linhas: int, semente: int = SEMENTE_PADRAO,
+                     diretorio: Optional[str] = None) -> str:
+    """
+    Retorna o caminho de um catálogo sintético, gerando-o se ainda não existir.
+
+    Args:
+        linhas (int): Número de jogos do catálogo.
+        semente (int, opcional): Semente do gerador.
+        diretorio (str, opcional): Diretório dos catálogos. Se omitido, usa `DIRETORIO_DADOS`.
+
+    Returns:
+        str: Caminho do CSV gerado.
+    """
+    caminho = os.path.join(diretorio or DIRETORIO_DADOS, f"catalogo_{linhas}_{semente}.csv")
+    if not os.path.exists(caminho):
+        gerar_catalogo(caminho, linhas, semente)
+    return caminho
+
+
+def main() -> None:
+    """Gera um catálogo a partir da linha de comando."""
+    parser = argparse.ArgumentParser(description="Gera um catálogo sintético no formato do CSV da Steam.")
+    parser.add_argument('linhas', help=f"Número de jogos ou um dos tamanhos: {', '.join(TAMANHOS)}")
+    parser.add_argument('saida', help="Caminho do CSV a ser criado")
+    parser.add_argument('--semente', type=int, default=SEMENTE_PADRAO, help="Semente do gerador")
+    argumentos = parser.parse_args()
+
+    linhas = TAMANHOS.get(argumentos.linhas.lower()) or int(argumentos.linhas)
+    gerar_catalogo(argumentos.saida, linhas, argumentos.semente)
+    print(f"Catálogo de {linhas} jogos salvo em {argumentos.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,643 @@
+"""
+Módulo com os acumuladores usados nas análises de jogos.
+
+Cada análise de `AnalisadorJogos` é expressa como um acumulador que recebe
+intervalos de linhas de uma `TabelaJogos` e, ao final, produz o mesmo
+resultado do método correspondente. Vários acumuladores podem ser
+alimentados pela mesma varredura dos dados com a função `varrer`, ou por
+fatias da tabela processadas em paralelo com `varrer_paralelo`, cujos
+resultados parciais são juntados com `combinar`.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from multiprocessing import get_start_method
+from operator import sub
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from src.fase1.dados_jogos import ErroDadosJogos, TabelaJogos
+from src.fase1.esbocos import K_PADRAO, ContadorDistintos, EsbocoQuantis
+
+# Número de linhas entregues a cada acumulador por vez durante a varredura
+TAMANHO_BLOCO = 65_536
+
+# Quantis de preço estimados pelos acumuladores aproximados
+QUANTIS_PADRAO = (0.25, 0.5, 0.75, 0.9)
+
+
+class FaixasPreco:
+    """
+    Faixas de preço contíguas, definidas por seus limites superiores.
+
+    A faixa `0` vai de `preco_minimo` até `limites[0]`; a faixa `i` vai de
+    `limites[i - 1]` (exclusive) até `limites[i]` (inclusive); a última faixa
+    contém todos os preços acima de `limites[-1]`. Não há lacunas entre as
+    faixas, e a faixa de um preço é encontrada por busca binária.
+
+    Atributos:
+        limites (List[float]): Limites superiores das faixas, em ordem crescente.
+        rotulos (List[str]): Rótulo de cada faixa (um a mais que os limites).
+        preco_minimo (float): Menor preço aceito; preços abaixo dele são ignorados.
+    """
+
+    def __init__(self, limites: Sequence[float], rotulos: Optional[Sequence[str]] = None,
+                 preco_minimo: float = 0.0):
+        """
+        Inicializa as faixas de preço.
+
+        Args:
+            limites (Sequence[float]): Limites superiores das faixas, em ordem crescente.
+            rotulos (Sequence[str], opcional): Rótulos das faixas. Se omitido, são
+                                             gerados a partir dos limites.
+            preco_minimo (float, opcional): Menor preço aceito.
+
+        Raises:
+            ErroDadosJogos: Se os limites não forem crescentes ou se o número de
+                            rótulos não corresponder ao número de faixas.
+        """
+        self.limites = [float(limite) for limite in limites]
+        if any(a >= b for a, b in zip(self.limites, self.limites[1:])):
+            raise ErroDadosJogos("Os limites das faixas de preço devem ser estritamente crescentes.")
+        if rotulos is None:
+            rotulos = self._gerar_rotulos(preco_minimo, self.limites)
+        if len(rotulos) != len(self.limites) + 1:
+            raise ErroDadosJogos(f"São necessários {len(self.limites) + 1} rótulos para {len(self.limites)} limites.")
+        self.rotulos = list(rotulos)
+        self.preco_minimo = preco_minimo
+
+    @staticmethod
+    def _gerar_rotulos(preco_minimo: float, limites: List[float]) -> List[str]:
+        """Gera rótulos no formato 'R$a-b' a partir dos limites."""
+        bordas = [preco_minimo] + limites
+        rotulos = [f"R${a:g}" if a == b else f"R${a:g}-{b:g}" for a, b in zip(bordas, bordas[1:])]
+        return rotulos + [f"Acima de R${bordas[-1]:g}"]
+
+    def indice(self, preco: float) -> Optional[int]:
+        """
+        Retorna a faixa de um preço.
+
+        Args:
+            preco (float): Preço do jogo.
+
+        Returns:
+            int ou None: O índice da faixa, ou None se o preço for inválido ou
+            menor que `preco_minimo`.
+        """
+        return bisect_left(self.limites, preco) if preco >= self.preco_minimo else None
+
+    def indices(self, precos: Iterable[float]) -> List[int]:
+        """
+        Retorna as faixas de vários preços de uma só vez.
+
+        Args:
+            precos (Iterable[float]): Preços dos jogos.
+
+        Returns:
+            List[int]: O índice da faixa de cada preço, ou -1 para preços inválidos.
+        """
+        limites, minimo = self.limites, self.preco_minimo
+        return [bisect_left(limites, preco) if preco >= minimo else -1 for preco in precos]
+
+    def __len__(self) -> int:
+        """Retorna o número de faixas."""
+        return len(self.rotulos)
+
+
+# Faixas de preço usadas na distribuição de gêneros
+FAIXAS_PRECO = FaixasPreco(
+    [0, 10, 30, 60],
+    ["Gratuito", "Até R$10", "R$10-30", "R$30-60", "Acima de R$60"]
+)
+
+
+class Acumulador:
+    """
+    Classe base dos acumuladores de análise.
+
+    Subclasses devem implementar `adicionar_intervalo`, que consome um
+    intervalo de linhas da tabela, e `resultado`, que produz o resultado
+    final da análise a partir do que foi acumulado. Para a varredura em
+    paralelo, implementam também `combinar`, que junta a este acumulador o
+    que outro acumulou nas linhas seguintes da mesma tabela, e `vazio`, se
+    o construtor recebe parâmetros.
+    """
+
+    def vazio(self) -> 'Acumulador':
+        """Retorna um acumulador vazio com a mesma configuração deste."""
+        return type(self)()
+
+    def combinar(self, outro: 'Acumulador') -> None:
+        """
+        Junta a este acumulador o que outro acumulou.
+
+        O outro acumulador deve ter sido alimentado com linhas da mesma tabela
+        (ou de uma cópia dela) posteriores às deste, de modo que o resultado
+        seja o mesmo de uma única varredura das linhas de ambos, em ordem.
+
+        Args:
+            outro (Acumulador): Acumulador do mesmo tipo e configuração.
+        """
+        raise NotImplementedError
+
+    def adicionar_intervalo(self, tabela: TabelaJogos, inicio: int, fim: int) -> None:
+        """
+        Acumula as linhas `inicio` (inclusive) a `fim` (exclusive) da tabela.
+
+        Args:
+            tabela (TabelaJogos): Tabela com os dados dos jogos.
+            inicio (int): Índice da primeira linha do intervalo.
+            fim (int): Índice seguinte ao da última linha do intervalo.
+        """
+        raise NotImplementedError
+
+    def resultado(self) -> Any:
+        """
+        Produz o resultado da análise com os dados acumulados até o momento.
+
+        Raises:
+            ErroDadosJogos: Se não houver dados suficientes para a análise.
+        """
+        raise NotImplementedError
+
+
+class AcumuladorGratuitosVsPagos(Acumulador):
+    """Acumula o percentual de jogos gratuitos versus pagos."""
+
+    def __init__(self):
+        """Inicializa os contadores zerados."""
+        self.total_jogos = 0
+        self.jogos_gratuitos = 0
+
+    def adicionar_intervalo(self, tabela: TabelaJogos, inicio: int, fim: int) -> None:
+        """Conta os jogos e os jogos gratuitos do intervalo."""
+        self.total_jogos += fim - inicio
+        self.jogos_gratuitos += tabela.precos[inicio:fim].count(0.0)
+
+    def combinar(self, outro: 'AcumuladorGratuitosVsPagos') -> None:
+        """Soma os contadores de outro acumulador."""
+        self.total_jogos += outro.total_jogos
+        self.jogos_gratuitos += outro.jogos_gratuitos
+
+    def resultado(self) -> Dict[str, float]:
+        """Retorna as porcentagens de jogos 'gratuitos' e 'pagos'."""
+        if not self.total_jogos:
+            raise ErroDadosJogos("Nenhum dado de jogo carregado.")
+
+        jogos_pagos = self.total_jogos - self.jogos_gratuitos
+        return {
+            'gratuitos': round((self.jogos_gratuitos / self.total_jogos) * 100, 2),
+            'pagos': round((jogos_pagos / self.total_jogos) * 100, 2)
+        }
+
+
+class AcumuladorAnoComMaisLancamentos(Acumulador):
+    """Acumula o número de lançamentos por ano."""
+
+    def __init__(self):
+        """Inicializa a contagem por ano vazia."""
+        self.contagem_anos = Counter()
+
+    def adicionar_intervalo(self, tabela: TabelaJogos, inicio: int, fim: int) -> None:
+        """Conta os lançamentos de cada ano no intervalo."""
+        self.contagem_anos.update(tabela.anos[inicio:fim])
+
+    def combinar(self, outro: 'AcumuladorAnoComMaisLancamentos') -> None:
+        """Soma as contagens por ano, preservando a ordem em que os anos apareceram."""
+        self.contagem_anos.update(outro.contagem_anos)
+
+    def resultado(self) -> Tuple[Union[int, List[int]], int]:
+        """Retorna o ano (ou anos, em caso de empate) com mais lançamentos e a contagem."""
+        contagem_anos = {ano: contagem for ano, contagem in self.contagem_anos.items() if ano}
+        if not contagem_anos:
+            raise ErroDadosJogos("Nenhum ano de lançamento válido encontrado nos dados.")
+
+        max_lancamentos = max(contagem_anos.values())
+        anos_principais = [ano for ano, contagem in contagem_anos.items() if contagem == max_lancamentos]
+        if len(anos_principais) == 1:
+            return anos_principais[0], max_lancamentos
+        return sorted(anos_principais), max_lancamentos
+
+
+class AcumuladorGenerosPorFaixaPreco(Acumulador):
+    """
+    Acumula a contagem de gêneros em cada faixa de preço.
+
+    As contagens ficam em uma matriz densa de inteiros, com uma linha por
+    código de gênero e uma coluna por faixa de preço.
+
+    Atributos:
+        faixas (FaixasPreco): Faixas de preço usadas na contagem.
+        matriz (array): Contagens; a célula do gênero `g` na faixa `f` fica na
+                        posição `g * len(faixas) + f`.
+    """
+
+    def __init__(self, faixas: Optional[FaixasPreco] = None):
+        """
+        Inicializa as contagens vazias.
+
+        Args:
+            faixas (FaixasPreco, opcional): Faixas de preço. Se omitido, usa `FAIXAS_PRECO`.
+        """
+        self.faixas = faixas or FAIXAS_PRECO
+        self.termos = None
+        self.matriz = array('Q')
+        # Gêneros de cada faixa na ordem em que apareceram pela primeira vez
+        self._ordem: List[List[int]] = [[] for _ in range(len(self.faixas))]
+
+    def adicionar_intervalo(self, tabela: TabelaJogos, inicio: int, fim: int) -> None:
+        """Conta os gêneros de cada jogo do intervalo na faixa do seu preço."""
+        generos = tabela.generos
+        self.termos = generos.termos
+        codigo_vazio = generos.termos.codigo('')
+        codigos, deslocamentos = generos.codigos, generos.deslocamentos
+        num_faixas = len(self.faixas)
+
+        matriz = self.matriz
+        tamanho = len(generos.termos) * num_faixas
+        if len(matriz) < tamanho:
+            matriz.frombytes(bytes(matriz.itemsize * (tamanho - len(matriz))))
+        ordem = self._ordem
+
+        faixas_bloco = self.faixas.indices(tabela.precos[inicio:fim])
+        for indice, faixa in zip(range(inicio, fim), faixas_bloco):
+            if faixa < 0:
+                continue
+            for codigo in codigos[deslocamentos[indice]:deslocamentos[indice + 1]]:
+                if codigo == codigo_vazio:
+                    continue
+                posicao = codigo * num_faixas + faixa
+                if not matriz[posicao]:
+                    ordem[faixa].append(codigo)
+                matriz[posicao] += 1
+
+    def vazio(self) -> 'AcumuladorGenerosPorFaixaPreco':
+        """Retorna um acumulador vazio com as mesmas faixas."""
+        return AcumuladorGenerosPorFaixaPreco(self.faixas)
+
+    def combinar(self, outro: 'AcumuladorGenerosPorFaixaPreco') -> None:
+        """Soma as contagens de outro acumulador, acrescentando os gêneros novos de cada faixa."""
+        if outro.termos is None:
+            return
+        if self.termos is None or len(outro.termos) > len(self.termos):
+            self.termos = outro.termos
+        num_faixas = len(self.faixas)
+        matriz = self.matriz
+        tamanho = len(self.termos) * num_faixas
+        if len(matriz) < tamanho:
+            matriz.frombytes(bytes(matriz.itemsize * (tamanho - len(matriz))))
+        for faixa, codigos in enumerate(outro._ordem):
+            ordem = self._ordem[faixa]
+            for codigo in codigos:
+                posicao = codigo * num_faixas + faixa
+                if not matriz[posicao]:
+                    ordem.append(codigo)
+                matriz[posicao] += outro.matriz[posicao]
+
+    def resultado(self) -> Dict[str, Dict[str, int]]:
+        """Retorna, para cada faixa, os gêneros ordenados por contagem decrescente."""
+        num_faixas = len(self.faixas)
+        resultado = {}
+        for faixa, rotulo in enumerate(self.faixas.rotulos):
+            resultado[rotulo] = dict(sorted(
+                ((self.termos[codigo], self.matriz[codigo * num_faixas + faixa]) for codigo in self._ordem[faixa]),
+                key=lambda item: item[1],
+                reverse=True
+            ))
+        return resultado
+
+
+class AcumuladorEstatisticasPrecoPorGenero(Acumulador):
+    """
+    Acumula estatísticas de preço por gênero sem guardar a lista de preços.
+
+    Cada gênero guarda quantos jogos tem em cada preço distinto (os preços
+    se repetem muito). Total, máximo, mínimo e soma saem dessas contagens, e
+    a soma é calculada sempre na mesma ordem, de modo que o resultado não
+    depende da ordem nem da divisão das linhas entre acumuladores.
+    """
+
+    def __init__(self):
+        """Inicializa as estatísticas vazias."""
+        self.termos = None
+        # Número de jogos de cada par (código de gênero, preço)
+        self._contagens = Counter()
+
+    def adicionar_intervalo(self, tabela: TabelaJogos, inicio: int, fim: int) -> None:
+        """Conta os jogos de cada gênero em cada preço."""
+        generos = tabela.generos
+        self.termos = generos.termos
+        deslocamentos = generos.deslocamentos
+        # Repete o preço de cada linha uma vez por gênero da linha, sem laço em Python
+        generos_por_linha = map(sub, deslocamentos[inicio + 1:fim + 1], deslocamentos[inicio:fim])
+        precos = chain.from_iterable(map(repeat, tabela.precos[inicio:fim], generos_por_linha))
+        self._contagens.update(zip(generos.codigos[deslocamentos[inicio]:deslocamentos[fim]], precos))
+
+    def combinar(self, outro: 'AcumuladorEstatisticasPrecoPorGenero') -> None:
+        """Soma as contagens de preços de outro acumulador."""
+        if outro.termos is None:
+            return
+        if self.termos is None or len(outro.termos) > len(self.termos):
+            self.termos = outro.termos
+        self._contagens.update(outro._contagens)
+
+    def resultado(self) -> Dict[str, Dict[str, float]]:
+        """Retorna as estatísticas de cada gênero, ordenadas por preço médio decrescente."""
+        contagens_generos: Dict[int, Dict[float, int]] = {}
+        for (codigo, preco), quantidade in self._contagens.items():
+            contagens_generos.setdefault(codigo, {})[preco] = quantidade
+
+        resultado = {}
+        for codigo, contagens in contagens_generos.items():
+            if not self.termos[codigo]:
+                continue
+            total_jogos = sum(contagens.values())
+            soma = math.fsum(preco * quantidade for preco, quantidade in sorted(contagens.items()))
+            maximo = max(contagens)
+            minimo = min((preco for preco in contagens if preco > 0), default=None)
+            resultado[self.termos[codigo]] = {
+                'preco_medio': round(soma / total_jogos, 2),
+                'preco_maximo': maximo,
+                'preco_minimo': minimo if minimo is not None else 0,
+                'total_jogos': total_jogos
+            }
+
+        return dict(sorted(
+            resultado.items(),
+            key=lambda x: x[1]['preco_medio'],
+            reverse=True
+        ))
+
+
+class AcumuladorQuantisPreco(Acumulador):
+    """
+    Estima percentis de preço por grupo com um esboço de quantis por grupo.
+
+    A memória usada por grupo é limitada e não depende do número de jogos.
+    Os grupos são identificados pelo texto (gênero) ou pelo ano, e não pelos
+    códigos da tabela, de modo que o mesmo acumulador pode receber várias
+    tabelas diferentes, como os lotes de uma leitura em fluxo do CSV.
+    Subclasses definem os grupos de cada linha em `_grupos_linhas`.
+
+    Atributos:
+        quantis (Tuple[float, ...]): Quantis estimados, entre 0 e 1.
+        k (int): Parâmetro de precisão dos esboços.
+        esbocos (Dict[Any, EsbocoQuantis]): Esboço de cada grupo.
+    """
+
+    def __init__(self, quantis: Sequence[float] = QUANTIS_PADRAO, k: int = K_PADRAO, semente: int = 0):
+        """
+        Inicializa os esboços vazios.
+
+        Args:
+            quantis (Sequence[float], opcional): Quantis estimados.
+            k (int, opcional): Parâmetro de precisão dos esboços.
+            semente (int, opcional): Semente das compactações, para resultados reproduzíveis.
+        """
+        self.quantis = tuple(quantis)
+        self.k = k
+        self.semente = semente
+        self.esbocos: Dict[Any, EsbocoQuantis] = {}
+
+    def _grupos_linhas(self, tabela: TabelaJogos, inicio: int, fim: int) -> Iterable[Tuple[float, Iterable[Any]]]:
+        """Produz, para cada linha do intervalo, o preço e os grupos da linha."""
+        raise NotImplementedError
+
+    def adicionar_intervalo(self, tabela: TabelaJogos, inicio: int, fim: int) -> None:
+        """Adiciona o preço de cada jogo do intervalo ao esboço de cada um dos seus grupos."""
+        esbocos = self.esbocos
+        for preco, grupos in self._grupos_linhas(tabela, inicio, fim):
+            for grupo in grupos:
+                esboco = esbocos.get(grupo)
+                if esboco is None:
+                    esboco = esbocos[grupo] = EsbocoQuantis(self.k, self.semente)
+                esboco.adicionar(preco)
+
+    def vazio(self) -> 'AcumuladorQuantisPreco':
+        """Retorna um acumulador vazio com os mesmos quantis, k e semente."""
+        return type(self)(self.quantis, self.k, self.semente)
+
+    def combinar(self, outro: 'AcumuladorQuantisPreco') -> None:
+        """
+        Combina os esboços de cada grupo com os de outro acumulador.
+
+        Totais, mínimos e máximos continuam exatos; os percentis continuam
+        dentro do erro de posto, mas podem diferir dos de uma única varredura.
+        """
+        for grupo, esboco_outro in outro.esbocos.items():
+            esboco = self.esbocos.get(grupo)
+            if esboco is None:
+                esboco = self.esbocos[grupo] = EsbocoQuantis(self.k, self.semente)
+            esboco.combinar(esboco_outro)
+
+    def erro_posto(self) -> float:
+        """Retorna o erro de posto normalizado dos percentis estimados."""
+        return EsbocoQuantis(self.k).erro_posto()
+
+    def resultado(self) -> Dict[Any, Dict[str, float]]:
+        """
+        Retorna, para cada grupo, o total de jogos, os preços mínimo e máximo
+        (exatos) e os percentis estimados, com chaves como 'p50' e 'p90'.
+        """
+        resultado = {}
+        for grupo, esboco in self.esbocos.items():
+            estatisticas = {
+                'total_jogos': esboco.total,
+                'preco_minimo': esboco.minimo,
+                'preco_maximo': esboco.maximo,
+            }
+            for q, valor in zip(self.quantis, esboco.quantis(self.quantis)):
+                estatisticas[f"p{q * 100:g}"] = valor
+            resultado[grupo] = estatisticas
+        return resultado
+
+
+class AcumuladorQuantisPrecoPorGenero(AcumuladorQuantisPreco):
+    """Estima percentis de preço de cada gênero."""
+
+    def _grupos_linhas(self, tabela: TabelaJogos, inicio: int, fim: int) -> Iterable[Tuple[float, Iterable[Any]]]:
+        """Produz o preço e os gêneros (sem o gênero vazio) de cada linha."""
+        generos = tabela.generos
+        termos = generos.termos.valores
+        codigos, deslocamentos, precos = generos.codigos, generos.deslocamentos, tabela.precos
+        for indice in range(inicio, fim):
+            yield precos[indice], [termos[codigo] for codigo in codigos[deslocamentos[indice]:deslocamentos[indice + 1]]
+                                   if termos[codigo]]
+
+
+class AcumuladorQuantisPrecoPorAno(AcumuladorQuantisPreco):
+    """Estima percentis de preço dos jogos lançados em cada ano."""
+
+    def _grupos_linhas(self, tabela: TabelaJogos, inicio: int, fim: int) -> Iterable[Tuple[float, Iterable[Any]]]:
+        """Produz o preço e o ano (quando conhecido) de cada linha."""
+        for preco, ano in zip(tabela.precos[inicio:fim], tabela.anos[inicio:fim]):
+            yield preco, (ano,) if ano else ()
+
+    def resultado(self) -> Dict[Any, Dict[str, float]]:
+        """Retorna as estatísticas de cada ano, em ordem crescente de ano."""
+        return dict(sorted(super().resultado().items()))
+
+
+class AcumuladorDistintos(Acumulador):
+    """
+    Estima o número de publicadoras e de desenvolvedores distintos.
+
+    Usa um contador HyperLogLog por coluna, com memória fixa, e pode receber
+    várias tabelas diferentes (por exemplo, os lotes de uma leitura em fluxo).
+
+    Atributos:
+        contadores (Dict[str, ContadorDistintos]): Contador de cada coluna.
+    """
+
+    COLUNAS = ('publicadores', 'desenvolvedores')
+
+    def __init__(self):
+        """Inicializa os contadores vazios."""
+        self.contadores = {coluna: ContadorDistintos() for coluna in self.COLUNAS}
+
+    def adicionar_intervalo(self, tabela: TabelaJogos, inicio: int, fim: int) -> None:
+        """Registra os termos de cada coluna que aparecem no intervalo."""
+        for nome, contador in self.contadores.items():
+            coluna = getattr(tabela, nome)
+            termos = coluna.termos.valores
+            # Cada código é convertido em hash uma única vez por intervalo
+            for codigo in set(coluna.codigos[coluna.deslocamentos[inicio]:coluna.deslocamentos[fim]]):
+                if termos[codigo]:
+                    contador.adicionar(termos[codigo])
+
+    def combinar(self, outro: 'AcumuladorDistintos') -> None:
+        """Combina os contadores de cada coluna com os de outro acumulador."""
+        for nome, contador in self.contadores.items():
+            contador.combinar(outro.contadores[nome])
+
+    def erro_padrao(self) -> float:
+        """Retorna o erro padrão relativo das estimativas."""
+        return ContadorDistintos().erro_padrao()
+
+    def resultado(self) -> Dict[str, int]:
+        """Retorna o número estimado de valores distintos de cada coluna."""
+        return {nome: contador.estimar() for nome, contador in self.contadores.items()}
+
+
+# Acumuladores disponíveis, pelo nome da análise
+ACUMULADORES = {
+    'gratuitos_vs_pagos': AcumuladorGratuitosVsPagos,
+    'ano_com_mais_lancamentos': AcumuladorAnoComMaisLancamentos,
+    'generos_por_faixa_preco': AcumuladorGenerosPorFaixaPreco,
+    'estatisticas_preco_por_genero': AcumuladorEstatisticasPrecoPorGenero,
+    'quantis_preco_por_genero': AcumuladorQuantisPrecoPorGenero,
+    'quantis_preco_por_ano': AcumuladorQuantisPrecoPorAno,
+    'publicadores_desenvolvedores_distintos': AcumuladorDistintos,
+}
+
+# Análises exatas, mantidas por padrão entre atualizações dos dados
+ANALISES_PADRAO = (
+    'gratuitos_vs_pagos',
+    'ano_com_mais_lancamentos',
+    'generos_por_faixa_preco',
+    'estatisticas_preco_por_genero',
+)
+
+
+def criar_acumulador(nome: str) -> Acumulador:
+    """
+    Cria o acumulador de uma análise a partir do seu nome.
+
+    Args:
+        nome (str): Nome da análise (uma das chaves de `ACUMULADORES`).
+
+    Returns:
+        Acumulador: Um novo acumulador para a análise.
+
+    Raises:
+        ErroDadosJogos: Se a análise não existir.
+    """
+    try:
+        return ACUMULADORES[nome]()
+    except KeyError:
+        raise ErroDadosJogos(f"Análise desconhecida: {nome}. Disponíveis: {', '.join(ACUMULADORES)}")
+
+
+def varrer(tabela: TabelaJogos, acumuladores: Iterable[Acumulador], inicio: int = 0,
+           fim: Optional[int] = None, tamanho_bloco: int = TAMANHO_BLOCO) -> None:
+    """
+    Percorre a tabela uma única vez, entregando cada bloco a todos os acumuladores.
+
+    Args:
+        tabela (TabelaJogos): Tabela com os dados dos jogos.
+        acumuladores (Iterable[Acumulador]): Acumuladores a serem alimentados.
+        inicio (int, opcional): Primeira linha a ser percorrida.
+        fim (int, opcional): Linha seguinte à última a ser percorrida. Se omitido,
+                           percorre até o final da tabela.
+        tamanho_bloco (int, opcional): Número de linhas entregues por vez.
+    """
+    acumuladores = list(acumuladores)
+    fim = len(tabela) if fim is None else fim
+    for inicio_bloco in range(inicio, fim, tamanho_bloco):
+        fim_bloco = min(inicio_bloco + tamanho_bloco, fim)
+        for acumulador in acumuladores:
+            acumulador.adicionar_intervalo(tabela, inicio_bloco, fim_bloco)
+
+
+# Tabela herdada pelos processos de trabalho de `varrer_paralelo` quando criados com `fork`
+_tabela_processo: Optional[TabelaJogos] = None
+
+
+def _iniciar_processo(tabela: TabelaJogos) -> None:
+    """Guarda no processo de trabalho a tabela herdada do processo principal."""
+    global _tabela_processo
+    _tabela_processo = tabela
+
+
+def _varrer_fatia(acumuladores: List[Acumulador], fatia: Optional[TabelaJogos], inicio: int, fim: int,
+                  tamanho_bloco: int) -> List[Acumulador]:
+    """Alimenta acumuladores vazios com uma fatia (ou um intervalo da tabela herdada) e os retorna."""
+    varrer(_tabela_processo if fatia is None else fatia, acumuladores, inicio, fim, tamanho_bloco)
+    return acumuladores
+
+
+def varrer_paralelo(tabela: TabelaJogos, acumuladores: Iterable[Acumulador], processos: int,
+                    partes: Optional[int] = None, tamanho_bloco: int = TAMANHO_BLOCO) -> None:
+    """
+    Percorre a tabela em fatias processadas em paralelo e junta os resultados.
+
+    Cada fatia contígua de linhas é enviada apenas à tarefa que a processa
+    (`TabelaJogos.selecionar`) e alimenta cópias vazias dos acumuladores
+    (`vazio`); os resultados parciais são combinados na ordem das fatias
+    (`combinar`). Quando os processos são criados com `fork`, eles herdam a
+    tabela sem serializá-la e cada tarefa recebe só o seu intervalo. Para as
+    análises exatas o resultado é idêntico ao de `varrer`, inclusive na
+    ordem dos gêneros e no tratamento de empates.
+
+    Args:
+        tabela (TabelaJogos): Tabela com os dados dos jogos.
+        acumuladores (Iterable[Acumulador]): Acumuladores a serem alimentados.
+        processos (int): Número de processos; com 1 ou menos, usa `varrer`.
+        partes (int, opcional): Número de fatias. Se omitido, uma por processo.
+        tamanho_bloco (int, opcional): Número de linhas entregues por vez em cada fatia.
+    """
+    acumuladores = list(acumuladores)
+    total = len(tabela)
+    partes = min(partes or processos, total)
+    if processos <= 1 or partes <= 1:
+        varrer(tabela, acumuladores, tamanho_bloco=tamanho_bloco)
+        return
+
+    limites = [total * parte // partes for parte in range(partes + 1)]
+    if get_start_method() == 'fork':
+        opcoes = {'initializer': _iniciar_processo, 'initargs': (tabela,)}
+        tarefas = ((None, inicio, fim) for inicio, fim in zip(limites, limites[1:]))
+    else:
+        opcoes = {}
+        tarefas = ((tabela.selecionar(range(inicio, fim)), 0, fim - inicio)
+                   for inicio, fim in zip(limites, limites[1:]))
+    with ProcessPoolExecutor(max_workers=processos, **opcoes) as executor:
+        futuros = [executor.submit(_varrer_fatia, [acumulador.vazio() for acumulador in acumuladores],
+                                   fatia, inicio, fim, tamanho_bloco)
+                   for fatia, inicio, fim in tarefas]
+        for futuro in futuros:
+            for acumulador, parcial in zip(acumuladores, futuro.result()):
+                acumulador.combinar(parcial)
@@ -0,0 +1,166 @@
+"""
+Módulo para amostragem de jogos diretamente do arquivo CSV.
+
+Este módulo fornece amostragem por reservatório (em uma única passagem,
+sem carregar o arquivo na memória) e amostragem estratificada, em que cada
+estrato (por exemplo, ano de lançamento ou faixa de preço) é representado
+na amostra em proporção ao seu tamanho no arquivo.
+"""
+
+import csv
+import random
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from src.fase1.acumuladores import FAIXAS_PRECO
+from src.fase1.datas import ConversorDatas
+from src.fase1.dados_jogos import ErroDadosJogos
+
+
+class Reservatorio:
+    """
+    Amostra aleatória uniforme de tamanho fixo sobre um fluxo de itens.
+
+    Implementa o algoritmo R: os primeiros `tamanho` itens enchem o
+    reservatório e cada item seguinte substitui um item sorteado com
+    probabilidade `tamanho / itens_vistos`.
+
+    Atributos:
+        tamanho (int): Número máximo de itens mantidos.
+        itens (List[Any]): Itens atualmente no reservatório.
+        vistos (int): Número de itens oferecidos até o momento.
+    """
+
+    def __init__(self, tamanho: int, gerador: random.Random):
+        """
+        Inicializa um reservatório vazio.
+
+        Args:
+            tamanho (int): Número máximo de itens mantidos.
+            gerador (random.Random): Gerador de números aleatórios a ser usado.
+        """
+        self.tamanho = tamanho
+        self.itens: List[Any] = []
+        self.vistos = 0
+        self._gerador = gerador
+
+    def oferecer(self, item: Any) -> None:
+        """
+        Oferece um item ao reservatório.
+
+        Args:
+            item: Item do fluxo.
+        """
+        self.vistos += 1
+        if len(self.itens) < self.tamanho:
+            self.itens.append(item)
+            return
+        posicao = self._gerador.randrange(self.vistos)
+        if posicao < self.tamanho:
+            self.itens[posicao] = item
+
+
+def _estrato_ano(conversor: ConversorDatas) -> Callable[[Dict[str, str]], Hashable]:
+    """Cria uma função que retorna o ano de lançamento de uma linha."""
+    return lambda linha: conversor.converter(linha.get('Release date') or '')[0]
+
+
+def _estrato_faixa_preco(linha: Dict[str, str]) -> Hashable:
+    """Retorna o rótulo da faixa de preço de uma linha."""
+    try:
+        preco = float(linha.get('Price') or 0)
+    except ValueError:
+        return None
+    indice = FAIXAS_PRECO.indice(preco)
+    return FAIXAS_PRECO.rotulos[indice] if indice is not None else None
+
+
+def _criar_estrato(estratificar_por: Union[str, Callable[[Dict[str, str]], Hashable]]) -> Callable[[Dict[str, str]], Hashable]:
+    """Resolve o critério de estratificação em uma função sobre a linha do CSV."""
+    if callable(estratificar_por):
+        return estratificar_por
+    if estratificar_por == 'ano':
+        return _estrato_ano(ConversorDatas())
+    if estratificar_por == 'faixa_preco':
+        return _estrato_faixa_preco
+    raise ErroDadosJogos(f"Critério de estratificação desconhecido: {estratificar_por}. Use 'ano' ou 'faixa_preco'.")
+
+
+def _alocar_proporcionalmente(tamanho_amostra: int, tamanhos: Dict[Hashable, int]) -> Dict[Hashable, int]:
+    """
+    Divide o tamanho da amostra entre os estratos, em proporção ao tamanho de cada um.
+
+    Usa o método dos maiores restos, de modo que a soma das cotas é exatamente
+    `min(tamanho_amostra, total)` e nenhum estrato recebe mais itens do que tem.
+    """
+    total = sum(tamanhos.values())
+    tamanho_amostra = min(tamanho_amostra, total)
+    if not total:
+        return {estrato: 0 for estrato in tamanhos}
+
+    cotas = {estrato: (tamanho_amostra * n) // total for estrato, n in tamanhos.items()}
+    restos = sorted(tamanhos, key=lambda estrato: (tamanho_amostra * tamanhos[estrato]) % total, reverse=True)
+    faltam = tamanho_amostra - sum(cotas.values())
+    for estrato in restos:
+        if not faltam:
+            break
+        if cotas[estrato] < tamanhos[estrato]:
+            cotas[estrato] += 1
+            faltam -= 1
+    return cotas
+
+
+def amostrar_csv(caminho_origem: str, arquivo_saida: str, tamanho_amostra: int,
+                 semente: Optional[int] = None,
+                 estratificar_por: Union[None, str, Callable[[Dict[str, str]], Hashable]] = None) -> int:
+    """
+    Cria uma amostra aleatória de linhas de um CSV em uma única passagem.
+
+    O arquivo de origem é lido uma única vez e nunca é carregado inteiro na
+    memória: apenas as linhas candidatas à amostra ficam guardadas. As linhas
+    sorteadas são gravadas na ordem em que aparecem no arquivo original.
+
+    Na amostragem estratificada cada estrato mantém seu próprio reservatório
+    e, ao final, recebe uma cota da amostra proporcional ao seu tamanho.
+
+    Args:
+        caminho_origem (str): Caminho do CSV de origem.
+        arquivo_saida (str): Caminho para salvar o CSV da amostra.
+        tamanho_amostra (int): Número de linhas da amostra.
+        semente (int, opcional): Semente do gerador aleatório, para amostras reproduzíveis.
+        estratificar_por (str ou Callable, opcional): 'ano', 'faixa_preco' ou uma
+            função que recebe a linha do CSV (como dicionário) e retorna seu estrato.
+
+    Returns:
+        int: O número de linhas gravadas na amostra.
+
+    Raises:
+        ErroDadosJogos: Se o critério de estratificação for desconhecido.
+    """
+    gerador = random.Random(semente)
+    estrato = _criar_estrato(estratificar_por) if estratificar_por is not None else None
+    reservatorios: Dict[Hashable, Reservatorio] = {}
+
+    with open(caminho_origem, 'r', encoding='utf-8') as arquivo:
+        leitor = csv.DictReader(arquivo)
+        nomes_campos = leitor.fieldnames
+        for numero_linha, linha in enumerate(leitor):
+            chave = estrato(linha) if estrato else None
+            reservatorio = reservatorios.get(chave)
+            if reservatorio is None:
+                reservatorio = reservatorios[chave] = Reservatorio(tamanho_amostra, gerador)
+            reservatorio.oferecer((numero_linha, linha))
+
+    # Combina os reservatórios, respeitando a cota de cada estrato
+    cotas = _alocar_proporcionalmente(tamanho_amostra, {chave: r.vistos for chave, r in reservatorios.items()})
+    selecionadas: List[Tuple[int, Dict[str, str]]] = []
+    for chave, reservatorio in reservatorios.items():
+        selecionadas.extend(gerador.sample(reservatorio.itens, cotas[chave]))
+    selecionadas.sort(key=lambda item: item[0])
+
+    with open(arquivo_saida, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=nomes_campos)
+        escritor.writeheader()
+        for _, linha in selecionadas:
+            escritor.writerow(linha)
+
+    return len(selecionadas)
@@ -1,5 +1,12 @@
 from src.fase1.dados_jogos import DadosJogos, ErroDadosJogos, Jogo
-from typing import Dict, List, Tuple, Union, Optional, Any
+from src.fase1.acumuladores import (ANALISES_PADRAO, QUANTIS_PADRAO, Acumulador, AcumuladorDistintos,
+                                    AcumuladorGenerosPorFaixaPreco, AcumuladorQuantisPrecoPorAno,
+                                    AcumuladorQuantisPrecoPorGenero, FaixasPreco, criar_acumulador, varrer,
+                                    varrer_paralelo)
+from src.fase1.esbocos import K_PADRAO
+from src.fase1.indices import Predicado
+from src.instrumentacao import etapa
+from typing import Dict, Iterable, List, Sequence, Tuple, Union, Optional, Any
 
 
 class AnalisadorJogos:
@@ -11,131 +18,220 @@ class AnalisadorJogos:
     
     Atributos:
         dados (DadosJogos): Objeto contendo os dados dos jogos.
+        agregados (Dict[str, Acumulador]): Acumuladores mantidos atualizados a cada
+                                          carga ou atualização dos dados (veja
+                                          `manter_agregados`).
     """
     
-    def __init__(self, arquivo_dados: str = None):
+    def __init__(self, arquivo_dados: str = None, usar_cache: bool = True):
         """
         Inicializa um objeto AnalisadorJogos.
         
         Args:
             arquivo_dados (str, opcional): Caminho para o arquivo CSV com dados de jogos.
                                          Se fornecido, os dados são carregados imediatamente.
+            usar_cache (bool, opcional): Se True, usa o cache binário do CSV.
         """
-        self.dados = DadosJogos(arquivo_dados) if arquivo_dados else DadosJogos()
+        self.dados = DadosJogos(arquivo_dados, usar_cache) if arquivo_dados else DadosJogos()
+        self.agregados: Dict[str, Acumulador] = {}
     
-    def carregar_dados(self, caminho_arquivo: str) -> None:
+    def carregar_dados(self, caminho_arquivo: str, processos: int = 1, usar_cache: bool = True) -> None:
         """
         Carrega dados de jogos de um arquivo CSV.
         
         Args:
             caminho_arquivo (str): Caminho para o arquivo CSV.
+            processos (int, opcional): Número de processos usados na leitura e no
+                                     cálculo dos agregados mantidos.
+            usar_cache (bool, opcional): Se True, usa o cache binário do CSV.
         """
-        self.dados.carregar_dados(caminho_arquivo)
+        self.dados.carregar_dados(caminho_arquivo, processos, usar_cache)
+        if self.agregados:
+            self.manter_agregados(self.agregados, processos)
     
-    def criar_amostra(self, tamanho_amostra: int, arquivo_saida: str) -> None:
+    def carregar_registros(self, registros: Iterable[Dict[str, Any]], origem: str = 'registros',
+                           processos: int = 1) -> None:
+        """
+        Carrega jogos já lidos de outra fonte (veja `DadosJogos.carregar_registros`).
+        
+        Args:
+            registros (Iterable[Dict[str, Any]]): Jogos, com os campos de uma linha do CSV.
+            origem (str, opcional): Nome da origem dos dados, usado nos avisos.
+            processos (int, opcional): Número de processos do cálculo dos agregados mantidos.
+        """
+        self.dados.carregar_registros(registros, origem)
+        if self.agregados:
+            self.manter_agregados(self.agregados, processos)
+    
+    def manter_agregados(self, analises: Iterable[str] = ANALISES_PADRAO, processos: int = 1) -> None:
+        """
+        Passa a manter os resultados de algumas análises entre atualizações dos dados.
+        
+        Os acumuladores das análises são calculados uma vez sobre os dados
+        carregados e, depois disso, recebem apenas os jogos novos lidos por
+        `atualizar_dados`. As análises mantidas respondem a partir dos
+        acumuladores, sem percorrer a tabela novamente.
+        
+        Args:
+            analises (Iterable[str], opcional): Nomes das análises a manter. Se
+                omitido, mantém as análises exatas de `ANALISES_PADRAO`.
+            processos (int, opcional): Número de processos do cálculo inicial.
+            
+        Raises:
+            ErroDadosJogos: Se uma análise não existir.
+        """
+        self.agregados = {nome: criar_acumulador(nome) for nome in analises}
+        varrer_paralelo(self.dados.tabela, self.agregados.values(), processos)
+    
+    def atualizar_dados(self, processos: int = 1) -> int:
+        """
+        Lê os jogos acrescentados ao final do CSV e atualiza os agregados mantidos.
+        
+        Args:
+            processos (int, opcional): Número de processos usados se o arquivo
+                                     precisar ser recarregado por completo.
+            
+        Returns:
+            int: O número de jogos novos, ou o total de jogos se o arquivo foi
+            recarregado por completo.
+        """
+        primeiro_novo = self.dados.atualizar_dados(processos)
+        if self.agregados:
+            if primeiro_novo == 0:
+                self.manter_agregados(self.agregados, processos)
+            else:
+                varrer(self.dados.tabela, self.agregados.values(), primeiro_novo)
+        return len(self.dados.tabela) - primeiro_novo
+    
+    def criar_amostra(self, tamanho_amostra: int, arquivo_saida: str, semente: Optional[int] = None,
+                      estratificar_por: Optional[str] = None) -> None:
         """
         Cria uma amostra aleatória de jogos e a salva em um arquivo CSV.
         
         Args:
             tamanho_amostra (int): O número de jogos a serem incluídos na amostra.
             arquivo_saida (str): Caminho para salvar o arquivo CSV da amostra.
+            semente (int, opcional): Semente do gerador aleatório, para amostras reproduzíveis.
+            estratificar_por (str, opcional): 'ano' ou 'faixa_preco' para uma amostra estratificada.
         """
-        self.dados.criar_amostra(tamanho_amostra, arquivo_saida)
+        self.dados.criar_amostra(tamanho_amostra, arquivo_saida, semente, estratificar_por)
     
-    def analisar_gratuitos_vs_pagos(self) -> Dict[str, float]:
+    def executar_analises(self, analises: Union[Iterable[str], Dict[str, Acumulador]],
+                          filtro: Optional[Predicado] = None, processos: int = 1) -> Dict[str, Any]:
+        """
+        Executa várias análises em uma única varredura dos dados.
+        
+        Cada análise contribui com um acumulador, e todos são alimentados pelo
+        mesmo percurso da tabela de jogos. Os resultados são idênticos aos dos
+        métodos individuais correspondentes.
+        
+        Com mais de um processo, a tabela é dividida em fatias contíguas, cada
+        fatia é agregada em um processo separado e os resultados parciais são
+        combinados na ordem das fatias (veja `varrer_paralelo`). As análises
+        exatas produzem os mesmos resultados da execução em um só processo.
+        
+        Args:
+            analises (Iterable[str] ou Dict[str, Acumulador]): Nomes das análises a
+                executar ('gratuitos_vs_pagos', 'ano_com_mais_lancamentos',
+                'generos_por_faixa_preco' e 'estatisticas_preco_por_genero'), ou um
+                dicionário de acumuladores já configurados, pelo nome do resultado.
+                Um dicionário permite, por exemplo, contar várias configurações de
+                faixas de preço na mesma varredura.
+            filtro (Predicado, opcional): Consulta que seleciona os jogos analisados,
+                por exemplo `Termo('generos', 'RPG')`. As linhas são obtidas pelos
+                índices invertidos e só elas são percorridas.
+            processos (int, opcional): Número de processos da varredura.
+        
+        Returns:
+            Dict[str, Any]: Resultado de cada análise, pelo nome.
+            
+        Raises:
+            ErroDadosJogos: Se não houver dados carregados ou se uma análise não existir.
+        """
+        if not self.dados.tabela:
+            raise ErroDadosJogos("Nenhum dado de jogo carregado.")
+        
+        if filtro is not None:
+            with etapa('analise.filtro'):
+                tabela = self.dados.tabela.selecionar(self.dados.consultar(filtro))
+            agregados = {}
+        else:
+            tabela = self.dados.tabela
+            agregados = self.agregados
+        
+        if isinstance(analises, dict):
+            acumuladores = dict(analises)
+        else:
+            # Análises mantidas por `manter_agregados` não precisam de nova varredura
+            acumuladores = {nome: agregados.get(nome) or criar_acumulador(nome) for nome in analises}
+        novos = [acumulador for acumulador in acumuladores.values()
+                 if acumulador not in agregados.values()]
+        if novos:
+            nomes = '+'.join(nome for nome, acumulador in acumuladores.items() if acumulador in novos)
+            with etapa(f"analise.{nomes}", len(tabela)):
+                varrer_paralelo(tabela, novos, processos)
+        
+        return {nome: acumulador.resultado() for nome, acumulador in acumuladores.items()}
+    
+    def analisar_gratuitos_vs_pagos(self, processos: int = 1) -> Dict[str, float]:
         """
         Analisa o percentual de jogos gratuitos versus pagos.
         
+        Args:
+            processos (int, opcional): Número de processos da varredura.
+        
         Returns:
             Dict[str, float]: Dicionário com as porcentagens de jogos gratuitos e pagos.
         """
-        return self.dados.calcular_percentual_gratuitos_vs_pagos()
+        if 'gratuitos_vs_pagos' in self.agregados:
+            return self.agregados['gratuitos_vs_pagos'].resultado()
+        if processos > 1:
+            return self.executar_analises(['gratuitos_vs_pagos'], processos=processos)['gratuitos_vs_pagos']
+        with etapa('analise.gratuitos_vs_pagos', len(self.dados.tabela)):
+            return self.dados.calcular_percentual_gratuitos_vs_pagos()
     
-    def analisar_ano_com_mais_lancamentos(self) -> Tuple[Union[int, List[int]], int]:
+    def analisar_ano_com_mais_lancamentos(self, processos: int = 1) -> Tuple[Union[int, List[int]], int]:
         """
         Analisa qual ano teve mais lançamentos de jogos.
         
+        Args:
+            processos (int, opcional): Número de processos da varredura.
+        
         Returns:
             Tuple[Union[int, List[int]], int]: Uma tupla contendo:
                 - O ano ou lista de anos com mais lançamentos
                 - O número de lançamentos nesse(s) ano(s)
         """
-        anos_principais = self.dados.obter_ano_com_mais_lancamentos()
+        if 'ano_com_mais_lancamentos' in self.agregados:
+            return self.agregados['ano_com_mais_lancamentos'].resultado()
+        if processos > 1:
+            analise = 'ano_com_mais_lancamentos'
+            return self.executar_analises([analise], processos=processos)[analise]
+        with etapa('analise.ano_com_mais_lancamentos', len(self.dados.tabela)):
+            contagem_anos = self.dados.contar_lancamentos_por_ano()
+            anos_principais = self.dados.obter_ano_com_mais_lancamentos(contagem_anos)
         
-        # Contabiliza o número de lançamentos no(s) ano(s) de pico
+        # Lê o número de lançamentos no(s) ano(s) de pico da mesma contagem
         if isinstance(anos_principais, list):
-            contagem_lancamentos = sum(1 for jogo in self.dados.jogos 
-                                if jogo.ano_lancamento() == anos_principais[0])
+            contagem_lancamentos = contagem_anos[anos_principais[0]]
         else:
-            contagem_lancamentos = sum(1 for jogo in self.dados.jogos 
-                                if jogo.ano_lancamento() == anos_principais)
+            contagem_lancamentos = contagem_anos[anos_principais]
         
         return anos_principais, contagem_lancamentos
     
-    def analisar_generos_por_faixa_preco(self) -> Dict[str, Dict[str, int]]:
-        """
-        Analisa a distribuição de gêneros por faixa de preço.
-        
-        Esta é uma implementação para a terceira pergunta:
-        "Qual a distribuição de gêneros de jogos por faixa de preço?"
-        
-        Returns:
-            Dict[str, Dict[str, int]]: Um dicionário onde:
-                - As chaves são faixas de preço (ex: "Gratuito", "Até R$10", etc.)
-                - Os valores são dicionários com contagens de gêneros nessa faixa
-        """
-        if not self.dados.jogos:
-            raise ErroDadosJogos("Nenhum dado de jogo carregado.")
-        
-        # Definição das faixas de preço
-        faixas = {
-            "Gratuito": (0, 0),
-            "Até R$10": (0.01, 10),
-            "R$10-30": (10.01, 30),
-            "R$30-60": (30.01, 60),
-            "Acima de R$60": (60.01, float('inf'))
-        }
-        
-        # Inicializa o resultado
-        resultado = {faixa: {} for faixa in faixas}
-        
-        # Analisa cada jogo
-        for jogo in self.dados.jogos:
-            # Determina a faixa de preço do jogo
-            faixa_jogo = None
-            for faixa, (preco_min, preco_max) in faixas.items():
-                if preco_min <= jogo.preco <= preco_max:
-                    faixa_jogo = faixa
-                    break
-            
-            if faixa_jogo is None:
-                continue  # Ignora jogos sem preço válido
-            
-            # Contabiliza gêneros do jogo na faixa de preço correspondente
-            for genero in jogo.generos:
-                if genero:  # Ignora gêneros vazios
-                    if genero in resultado[faixa_jogo]:
-                        resultado[faixa_jogo][genero] += 1
-                    else:
-                        resultado[faixa_jogo][genero] = 1
-        
-        # Ordena os gêneros por frequência em cada faixa de preço
-        for faixa in resultado:
-            resultado[faixa] = dict(sorted(
-                resultado[faixa].items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            ))
-        
-        return resultado
-    
-    def obter_estatisticas_preco_por_genero(self) -> Dict[str, Dict[str, float]]:
+    def obter_estatisticas_preco_por_genero(self, filtro: Optional[Predicado] = None,
+                                            processos: int = 1) -> Dict[str, Dict[str, float]]:
         """
         Calcula estatísticas de preço por gênero.
         
         Esta é outra possível implementação para a terceira pergunta:
         "Quais gêneros de jogos têm o maior e menor preço médio?"
         
+        Args:
+            filtro (Predicado, opcional): Consulta que restringe os jogos considerados,
+                por exemplo `Termo('publicadores', 'Valve')`.
+            processos (int, opcional): Número de processos da varredura.
+        
         Returns:
             Dict[str, Dict[str, float]]: Um dicionário onde:
                 - As chaves são gêneros de jogos
@@ -145,101 +241,101 @@ class AnalisadorJogos:
         if not self.dados.jogos:
             raise ErroDadosJogos("Nenhum dado de jogo carregado.")
         
-        # Inicializa estruturas para armazenar dados por gênero
-        precos_por_genero = {}
-        
-        # Coleta dados de preço por gênero
-        for jogo in self.dados.jogos:
-            if jogo.preco is None:
-                continue  # Ignora jogos sem preço
-
-            for genero in jogo.generos:
-                if not genero:
-                    continue  # Ignora gêneros vazios
-                
-                if genero not in precos_por_genero:
-                    precos_por_genero[genero] = {
-                        'precos': [],
-                        'total_jogos': 0
-                    }
-                
-                precos_por_genero[genero]['precos'].append(jogo.preco)
-                precos_por_genero[genero]['total_jogos'] += 1
-        
-        # Calcula estatísticas para cada gênero
-        resultado = {}
-        for genero, dados in precos_por_genero.items():
-            precos = dados['precos']
-            if precos:
-                resultado[genero] = {
-                    'preco_medio': round(sum(precos) / len(precos), 2),
-                    'preco_maximo': max(precos),
-                    'preco_minimo': min(p for p in precos if p > 0) if any(p > 0 for p in precos) else 0,
-                    'total_jogos': dados['total_jogos']
-                }
-        
-        # Ordena os gêneros por preço médio (decrescente)
-        resultado = dict(sorted(
-            resultado.items(),
-            key=lambda x: x[1]['preco_medio'],
-            reverse=True
-        ))
-        
-        return resultado
+        analise = 'estatisticas_preco_por_genero'
+        return self.executar_analises([analise], filtro, processos)[analise]
 
-    def analisar_generos_por_faixa_preco(self) -> Dict[str, Dict[str, int]]:
+    def analisar_generos_por_faixa_preco(self, limites: Optional[Sequence[float]] = None,
+                                         rotulos: Optional[Sequence[str]] = None,
+                                         processos: int = 1) -> Dict[str, Dict[str, int]]:
         """
-        Analisa a distribuição de gêneros de jogos por faixa de preço.
+        Analisa a distribuição de gêneros por faixa de preço.
+        
+        Esta é uma implementação para a terceira pergunta:
+        "Qual a distribuição de gêneros de jogos por faixa de preço?"
+        
+        As faixas são contíguas e fechadas à direita: com os limites padrão
+        (0, 10, 30, 60) um jogo de R$10,005 fica na faixa "R$10-30".
+        
+        Args:
+            limites (Sequence[float], opcional): Limites superiores das faixas, em
+                ordem crescente. Se omitido, usa as faixas padrão ("Gratuito",
+                "Até R$10", "R$10-30", "R$30-60" e "Acima de R$60").
+            rotulos (Sequence[str], opcional): Rótulos das faixas definidas por
+                `limites`. Se omitido, são gerados a partir dos limites.
+            processos (int, opcional): Número de processos da varredura.
         
         Returns:
-            Dict[str, Dict[str, int]]: Dicionário com faixas de preço como chaves e
-                                    dicionários de gêneros e suas contagens como valores.
+            Dict[str, Dict[str, int]]: Um dicionário onde:
+                - As chaves são faixas de preço (ex: "Gratuito", "Até R$10", etc.)
+                - Os valores são dicionários com contagens de gêneros nessa faixa
         """
         try:
             if not self.dados.jogos:
                 raise ErroDadosJogos("Nenhum dado de jogo carregado.")
             
-            # Define faixas de preço
-            faixas = {
-                "Gratuito": (0, 0),
-                "Até R$10": (0.01, 10),
-                "R$10-30": (10.01, 30),
-                "R$30-60": (30.01, 60),
-                "Acima de R$60": (60.01, float('inf'))
-            }
-            
-            # Inicializa contadores por faixa de preço e gênero
-            contagem_generos = {faixa: {} for faixa in faixas}
-            
-            # Analisa cada jogo
-            for jogo in self.dados.jogos:
-                # Determina a faixa de preço do jogo
-                faixa_jogo = None
-                for faixa, (min_preco, max_preco) in faixas.items():
-                    if jogo.gratuito and faixa == "Gratuito":
-                        faixa_jogo = faixa
-                        break
-                    elif min_preco <= jogo.preco <= max_preco:
-                        faixa_jogo = faixa
-                        break
-                
-                if not faixa_jogo:  # Se não encontrar faixa (improvável, mas por segurança)
-                    continue
-                
-                # Conta os gêneros para este jogo
-                for genero in jogo.generos:
-                    if not genero:  # Ignora gêneros vazios
-                        continue
-                    contagem_generos[faixa_jogo][genero] = contagem_generos[faixa_jogo].get(genero, 0) + 1
-            
-            # Ordena os gêneros por contagem (decrescente) em cada faixa
-            for faixa, generos in contagem_generos.items():
-                contagem_generos[faixa] = dict(sorted(
-                    generos.items(), 
-                    key=lambda item: item[1], 
-                    reverse=True
-                ))
-            
-            return contagem_generos
+            if limites is None and 'generos_por_faixa_preco' in self.agregados:
+                return self.agregados['generos_por_faixa_preco'].resultado()
+            faixas = FaixasPreco(limites, rotulos) if limites is not None else None
+            acumulador = AcumuladorGenerosPorFaixaPreco(faixas)
+            analise = 'generos_por_faixa_preco'
+            return self.executar_analises({analise: acumulador}, processos=processos)[analise]
         except Exception as e:
-            raise ErroDadosJogos(f"Erro ao analisar gêneros por faixa de preço: {str(e)}")
\ No newline at end of file
+            raise ErroDadosJogos(f"Erro ao analisar gêneros por faixa de preço: {str(e)}")
+    
+    def estimar_estatisticas_preco(self, caminho_arquivo: Optional[str] = None,
+                                   quantis: Sequence[float] = QUANTIS_PADRAO, k: int = K_PADRAO,
+                                   processos: int = 1) -> Dict[str, Any]:
+        """
+        Estima percentis de preço por gênero e por ano em memória limitada.
+        
+        Em vez de guardar os preços de cada grupo, cada gênero e cada ano
+        mantém um esboço de quantis de tamanho limitado, e o número de
+        publicadoras e desenvolvedores distintos é estimado com contadores
+        HyperLogLog. Com `caminho_arquivo`, o CSV é lido em fluxo, lote a lote,
+        sem ser carregado na memória; caso contrário, usa os dados carregados.
+        
+        Args:
+            caminho_arquivo (str, opcional): CSV lido em fluxo. Se omitido, usa os
+                                           dados já carregados.
+            quantis (Sequence[float], opcional): Quantis estimados, entre 0 e 1.
+            k (int, opcional): Parâmetro de precisão dos esboços de quantis.
+            processos (int, opcional): Número de processos usados na leitura em fluxo
+                                     ou na varredura dos dados carregados.
+        
+        Returns:
+            Dict[str, Any]: Um dicionário com:
+                - 'por_genero' e 'por_ano': para cada grupo, 'total_jogos',
+                  'preco_minimo', 'preco_maximo' e os percentis ('p25', 'p50', ...)
+                - 'publicadores_distintos' e 'desenvolvedores_distintos'
+                - 'erro_posto': erro máximo do posto dos percentis (fração), com 99% de confiança
+                - 'erro_distintos': erro padrão relativo das contagens de distintos
+            
+        Raises:
+            ErroDadosJogos: Se não houver dados.
+        """
+        por_genero = AcumuladorQuantisPrecoPorGenero(quantis, k)
+        por_ano = AcumuladorQuantisPrecoPorAno(quantis, k)
+        distintos = AcumuladorDistintos()
+        acumuladores = [por_genero, por_ano, distintos]
+        
+        if not caminho_arquivo and not self.dados.tabela:
+            raise ErroDadosJogos("Nenhum dado de jogo carregado.")
+        
+        with etapa('analise.estimar_estatisticas_preco') as medicao:
+            if caminho_arquivo:
+                for tabela in DadosJogos.iterar_tabelas(caminho_arquivo, processos):
+                    varrer(tabela, acumuladores)
+                    medicao.linhas += len(tabela)
+            else:
+                varrer_paralelo(self.dados.tabela, acumuladores, processos)
+                medicao.linhas = len(self.dados.tabela)
+        
+        contagens = distintos.resultado()
+        return {
+            'por_genero': por_genero.resultado(),
+            'por_ano': por_ano.resultado(),
+            'publicadores_distintos': contagens['publicadores'],
+            'desenvolvedores_distintos': contagens['desenvolvedores'],
+            'erro_posto': por_genero.erro_posto(),
+            'erro_distintos': distintos.erro_padrao(),
+        }
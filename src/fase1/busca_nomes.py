@@ -0,0 +1,322 @@
+"""
+Módulo com o índice de busca por nome de jogo.
+
+Os nomes são normalizados (decomposição NFKD sem acentos, `casefold` e
+espaços simplificados) e cada nome normalizado distinto recebe um código,
+com as linhas da tabela em que aparece. Sobre esses códigos o índice
+oferece três buscas, sem percorrer a tabela:
+
+- exata, por um dicionário de nomes normalizados;
+- por prefixo, por busca binária na lista ordenada de nomes;
+- aproximada, por trigramas: cada nome é decomposto nos seus trigramas e um
+  índice invertido guarda, separados pelo número de trigramas do nome, os
+  nomes de cada trigrama. Só são consultados os grupos de nomes com tamanho
+  compatível com a similaridade mínima, começando pelos mais próximos do
+  tamanho da consulta; em cada grupo, os candidatos saem só dos trigramas
+  mais raros da consulta (um nome com similaridade suficiente precisa ter ao
+  menos um deles). À medida que os melhores resultados são encontrados, a
+  similaridade exigida dos demais sobe, e menos grupos e listas são lidos.
+
+Exemplo:
+    >>> indice = dados.indice_nomes()
+    >>> indice.aproximado('conter strik')[0].nome
+    'Counter-Strike'
+"""
+
+import unicodedata
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from heapq import heappush, heapreplace
+from math import ceil
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+from src.fase1.colunas import DicionarioTermos
+
+# Similaridade mínima padrão da busca aproximada
+SIMILARIDADE_MINIMA = 0.3
+
+# Número padrão de resultados das buscas por prefixo e aproximada
+LIMITE_RESULTADOS = 10
+
+# Custo de uma busca binária em uma lista de trigramas, em elementos contados
+# (usado para escolher entre procurar os candidatos e contar a lista inteira)
+CUSTO_BUSCA_BINARIA = 16
+
+
+class ResultadoNome(NamedTuple):
+    """
+    Nome encontrado em uma busca.
+
+    Atributos:
+        nome (str): Nome como aparece no CSV (a primeira grafia vista, se
+            várias grafias têm a mesma forma normalizada).
+        similaridade (float): Similaridade com a consulta, de 0 a 1 (1 nas
+            buscas exata e por prefixo).
+        linhas (array): Linhas da tabela com esse nome, em ordem crescente.
+        app_ids (List[str]): AppIDs dessas linhas.
+    """
+    nome: str
+    similaridade: float
+    linhas: array
+    app_ids: List[str]
+
+
+def normalizar_nome(nome: str) -> str:
+    """
+    Normaliza um nome para comparação, sem acentos nem diferença de maiúsculas.
+
+    Args:
+        nome (str): Nome do jogo.
+
+    Returns:
+        str: Nome decomposto (NFKD), sem marcas combinantes, em `casefold` e
+        com os espaços simplificados.
+    """
+    decomposto = unicodedata.normalize('NFKD', nome)
+    if not decomposto.isascii():
+        decomposto = ''.join(caractere for caractere in decomposto if not unicodedata.combining(caractere))
+    return ' '.join(decomposto.casefold().split())
+
+
+def trigramas(chave: str) -> Set[str]:
+    """
+    Retorna os trigramas distintos de um nome normalizado.
+
+    O nome recebe dois espaços no início e um no final, para que prefixos e
+    nomes curtos também gerem trigramas.
+
+    Args:
+        chave (str): Nome já normalizado.
+
+    Returns:
+        Set[str]: Trigramas do nome (vazio para um nome vazio).
+    """
+    if not chave:
+        return set()
+    texto = f"  {chave} "
+    return {texto[posicao:posicao + 3] for posicao in range(len(texto) - 2)}
+
+
+def _contem(lista: array, valor: int) -> bool:
+    """Verifica por busca binária se uma lista ordenada contém um valor."""
+    posicao = bisect_left(lista, valor)
+    return posicao < len(lista) and lista[posicao] == valor
+
+
+class IndiceNomes:
+    """
+    Índice dos nomes dos jogos para buscas exata, por prefixo e aproximada.
+
+    Linhas acrescentadas depois às listas de nomes e AppIDs (por exemplo por
+    `DadosJogos.atualizar_dados`) são indexadas com `atualizar`.
+
+    Atributos:
+        nomes (List[str]): Nome de cada linha da tabela.
+        app_ids (List[str]): AppID de cada linha da tabela.
+        linhas_indexadas (int): Número de linhas já indexadas.
+    """
+
+    __slots__ = ('nomes', 'app_ids', 'linhas_indexadas', '_chaves', '_grafias', '_linhas', '_tamanhos',
+                 '_trigramas', '_ordenadas', '_pendentes')
+
+    def __init__(self, nomes: List[str], app_ids: List[str]):
+        """
+        Cria o índice dos nomes de uma tabela.
+
+        Args:
+            nomes (List[str]): Nome de cada linha.
+            app_ids (List[str]): AppID de cada linha.
+        """
+        self.nomes = nomes
+        self.app_ids = app_ids
+        self.linhas_indexadas = 0
+        self._chaves = DicionarioTermos()
+        self._grafias: List[str] = []
+        self._linhas: List[array] = []
+        self._tamanhos = array('H')
+        self._trigramas: Dict[int, Dict[str, array]] = {}
+        self._ordenadas: List[str] = []
+        self._pendentes: List[str] = []
+        self.atualizar()
+
+    def atualizar(self) -> None:
+        """Indexa as linhas acrescentadas desde a última atualização."""
+        chaves, linhas, indice_trigramas = self._chaves, self._linhas, self._trigramas
+        normalizados: Dict[str, str] = {}
+        for linha in range(self.linhas_indexadas, len(self.nomes)):
+            nome = self.nomes[linha]
+            chave = normalizados.get(nome)
+            if chave is None:
+                chave = normalizados[nome] = normalizar_nome(nome)
+            codigo = chaves.codificar(chave)
+            if codigo == len(linhas):
+                # Primeira ocorrência do nome normalizado
+                self._grafias.append(nome)
+                linhas.append(array('I'))
+                self._pendentes.append(chave)
+                trigramas_chave = trigramas(chave)
+                self._tamanhos.append(len(trigramas_chave))
+                grupo = indice_trigramas.setdefault(len(trigramas_chave), {})
+                for trigrama in trigramas_chave:
+                    lista = grupo.get(trigrama)
+                    if lista is None:
+                        lista = grupo[trigrama] = array('I')
+                    lista.append(codigo)
+            linhas[codigo].append(linha)
+        self.linhas_indexadas = len(self.nomes)
+
+    def _resultado(self, codigo: int, similaridade: float = 1.0) -> ResultadoNome:
+        """Monta o resultado de um nome normalizado."""
+        linhas = array('I', self._linhas[codigo])
+        return ResultadoNome(self._grafias[codigo], similaridade, linhas,
+                             [self.app_ids[linha] for linha in linhas])
+
+    def exato(self, nome: str) -> List[ResultadoNome]:
+        """
+        Procura um nome, sem diferenciar acentos, maiúsculas e espaços.
+
+        Args:
+            nome (str): Nome procurado.
+
+        Returns:
+            List[ResultadoNome]: Um resultado com todas as linhas do nome, ou
+            uma lista vazia se o nome não existir.
+        """
+        codigo = self._chaves.codigo(normalizar_nome(nome))
+        return [] if codigo is None else [self._resultado(codigo)]
+
+    def prefixo(self, prefixo: str, limite: int = LIMITE_RESULTADOS) -> List[ResultadoNome]:
+        """
+        Procura os nomes que começam com um texto, em ordem alfabética normalizada.
+
+        Args:
+            prefixo (str): Início do nome.
+            limite (int, opcional): Número máximo de resultados.
+
+        Returns:
+            List[ResultadoNome]: Nomes encontrados, em ordem alfabética.
+        """
+        ordenadas = self._ordenadas
+        if self._pendentes:
+            # Poucos nomes novos são inseridos em ordem; muitos, reordenados de uma vez
+            if len(self._pendentes) * 8 < len(ordenadas):
+                for chave in self._pendentes:
+                    insort(ordenadas, chave)
+            else:
+                ordenadas.extend(self._pendentes)
+                ordenadas.sort()
+            self._pendentes = []
+
+        prefixo = normalizar_nome(prefixo)
+        resultados = []
+        posicao = bisect_left(ordenadas, prefixo)
+        while posicao < len(ordenadas) and len(resultados) < limite and ordenadas[posicao].startswith(prefixo):
+            resultados.append(self._resultado(self._chaves.codigo(ordenadas[posicao])))
+            posicao += 1
+        return resultados
+
+    def aproximado(self, nome: str, limite: int = LIMITE_RESULTADOS,
+                   similaridade_minima: float = SIMILARIDADE_MINIMA) -> List[ResultadoNome]:
+        """
+        Procura os nomes mais parecidos com um texto, por similaridade de trigramas.
+
+        A similaridade é a de Jaccard entre os conjuntos de trigramas: o número
+        de trigramas em comum dividido pelo número de trigramas distintos dos
+        dois nomes.
+
+        Args:
+            nome (str): Texto procurado, possivelmente incompleto ou com erros.
+            limite (int, opcional): Número máximo de resultados.
+            similaridade_minima (float, opcional): Similaridade mínima, entre 0 e 1.
+
+        Returns:
+            List[ResultadoNome]: Nomes encontrados, do mais ao menos parecido;
+            empates ficam na ordem em que os nomes aparecem na tabela.
+        """
+        trigramas_consulta = trigramas(normalizar_nome(nome))
+        if not trigramas_consulta or limite <= 0:
+            return []
+        total = len(trigramas_consulta)
+        # Um nome com t trigramas tem similaridade de no máximo min(n, t) / max(n, t)
+        grupos = sorted(self._trigramas, key=lambda tamanho: -min(total, tamanho) / max(total, tamanho))
+
+        melhores: List[Tuple[float, int]] = []
+        for tamanho in grupos:
+            limiar = similaridade_minima if len(melhores) < limite else max(similaridade_minima, melhores[0][0])
+            if min(total, tamanho) / max(total, tamanho) < limiar:
+                break
+            for similaridade, codigo in self._candidatos(trigramas_consulta, tamanho, limiar):
+                if len(melhores) < limite:
+                    heappush(melhores, (similaridade, -codigo))
+                elif (similaridade, -codigo) > melhores[0]:
+                    heapreplace(melhores, (similaridade, -codigo))
+        return [self._resultado(-codigo, similaridade) for similaridade, codigo in sorted(melhores, reverse=True)]
+
+    def _candidatos(self, trigramas_consulta: Set[str], tamanho: int, limiar: float) -> List[Tuple[float, int]]:
+        """
+        Retorna os nomes com `tamanho` trigramas e similaridade de pelo menos `limiar` com a consulta.
+
+        Args:
+            trigramas_consulta (Set[str]): Trigramas da consulta.
+            tamanho (int): Número de trigramas dos nomes do grupo consultado.
+            limiar (float): Similaridade mínima.
+
+        Returns:
+            List[Tuple[float, int]]: Similaridade e código de cada nome encontrado.
+        """
+        grupo = self._trigramas[tamanho]
+        vazia = array('I')
+        listas = sorted((grupo.get(trigrama, vazia) for trigrama in trigramas_consulta), key=len)
+
+        # e / (n + t - e) >= s exige e >= s * (n + t) / (1 + s) trigramas em comum, logo
+        # algum dos n - e + 1 trigramas mais raros da consulta
+        total = len(listas)
+        minimo = min(total, tamanho, max(1, ceil(limiar * (total + tamanho) / (1 + limiar) - 1e-9)))
+        raras, comuns = listas[:total - minimo + 1], listas[total - minimo + 1:]
+        contagens = Counter()
+        for lista in raras:
+            contagens.update(lista)
+
+        if len(contagens) * len(comuns) * CUSTO_BUSCA_BINARIA > sum(map(len, comuns)):
+            # Muitos candidatos: contar os trigramas comuns inteiros sai mais barato que
+            # procurar cada candidato neles. Nomes fora das listas raras não chegam ao
+            # mínimo (têm no máximo minimo - 1 trigramas comuns) e são descartados
+            for lista in comuns:
+                contagens.update(lista)
+        elif comuns:
+            for codigo in contagens:
+                contagens[codigo] += sum(1 for lista in comuns if _contem(lista, codigo))
+
+        candidatos = []
+        for codigo, em_comum in contagens.items():
+            if em_comum >= minimo:
+                similaridade = em_comum / (total + tamanho - em_comum)
+                if similaridade >= limiar:
+                    candidatos.append((similaridade, codigo))
+        return candidatos
+
+    def duplicados(self) -> Dict[str, List[str]]:
+        """
+        Retorna os nomes que aparecem em mais de uma linha e os AppIDs de cada um.
+
+        São os jogos que consultas com nomes sem repetição (como o top 10 do
+        Metacritic, que mantém só a primeira linha de cada nome) reduzem a um
+        único resultado. Os nomes são comparados exatamente como no CSV.
+
+        Returns:
+            Dict[str, List[str]]: AppIDs de cada nome repetido, na ordem da tabela.
+        """
+        duplicados: Dict[str, List[str]] = {}
+        for linhas in self._linhas:
+            if len(linhas) < 2:
+                continue
+            por_grafia: Dict[str, List[str]] = {}
+            for linha in linhas:
+                por_grafia.setdefault(self.nomes[linha], []).append(self.app_ids[linha])
+            duplicados.update((nome, app_ids) for nome, app_ids in por_grafia.items() if len(app_ids) > 1)
+        return duplicados
+
+    def __len__(self) -> int:
+        """Retorna o número de nomes normalizados distintos."""
+        return len(self._linhas)
@@ -0,0 +1,267 @@
+"""
+Módulo para o cache binário da tabela de jogos.
+
+Depois de convertido, o CSV é gravado em um arquivo binário ao lado do
+original, com as colunas já tipadas. Nas cargas seguintes esse arquivo é
+mapeado em memória e cada coluna é lida com uma única cópia em bloco, o que
+evita converter o CSV novamente. O cache é identificado pelo tamanho, data
+de modificação e hash SHA-256 do CSV e é descartado quando o CSV muda.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Optional
+
+from src.fase1.colunas import ColunaCategorica, ColunaMultivalorada, DicionarioTermos
+from src.fase1.dados_jogos import TabelaJogos
+
+# Identificação do formato e versão do arquivo de cache
+ASSINATURA = b'JOGOSv1\x00'
+
+# Extensão acrescentada ao nome do CSV para formar o nome do cache
+EXTENSAO_CACHE = '.cache'
+
+# Separador entre os textos de uma coluna de texto gravada no cache
+SEPARADOR = '\x00'
+
+COLUNAS_NUMERICAS = ['precos', 'anos', 'datas']
+COLUNAS_CATEGORICAS = ['datas_lancamento', 'donos_estimados']
+COLUNAS_MULTIVALORADAS = ['desenvolvedores', 'publicadores', 'generos']
+COLUNAS_TEXTO = ['app_ids', 'nomes']
+
+
+def caminho_cache(caminho_arquivo: str) -> str:
+    """
+    Retorna o caminho do arquivo de cache de um CSV.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV.
+
+    Returns:
+        str: Caminho do arquivo de cache correspondente.
+    """
+    return caminho_arquivo + EXTENSAO_CACHE
+
+
+def calcular_hash(caminho_arquivo: str) -> str:
+    """
+    Calcula o hash SHA-256 do conteúdo de um arquivo.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo.
+
+    Returns:
+        str: Hash em hexadecimal.
+    """
+    resumo = hashlib.sha256()
+    with open(caminho_arquivo, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(1024 * 1024), b''):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+def _identificar_origem(caminho_arquivo: str) -> Dict[str, Any]:
+    """Retorna tamanho, data de modificação e hash do CSV de origem."""
+    estado = os.stat(caminho_arquivo)
+    return {
+        'tamanho': estado.st_size,
+        'mtime_ns': estado.st_mtime_ns,
+        'sha256': calcular_hash(caminho_arquivo),
+    }
+
+
+def _codificar_textos(textos: List[str]) -> Optional[bytes]:
+    """Junta uma lista de textos em bytes, ou retorna None se algum contiver o separador."""
+    if any(SEPARADOR in texto for texto in textos):
+        return None
+    return SEPARADOR.join(textos).encode('utf-8')
+
+
+def _decodificar_textos(dados: bytes, quantidade: int) -> List[str]:
+    """Separa os textos gravados por `_codificar_textos`."""
+    return dados.decode('utf-8').split(SEPARADOR) if quantidade else []
+
+
+def salvar_cache(tabela: TabelaJogos, caminho_arquivo: str,
+                 origem: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Grava o cache binário de uma tabela carregada de um CSV.
+
+    O arquivo é escrito em um nome temporário e renomeado ao final, de modo
+    que uma gravação interrompida nunca deixa um cache corrompido.
+
+    Args:
+        tabela (TabelaJogos): Tabela convertida a partir do CSV.
+        caminho_arquivo (str): Caminho para o CSV de origem.
+        origem (Dict[str, Any], opcional): Identificação já calculada do CSV
+                                          (tamanho, data de modificação e hash).
+
+    Returns:
+        bool: True se o cache foi gravado, False se a tabela contém textos que
+        não podem ser representados no cache.
+    """
+    blocos = []
+
+    def adicionar(nome: str, dados: bytes, tipo: str, quantidade: int) -> None:
+        blocos.append((nome, dados, tipo, quantidade))
+
+    for nome in COLUNAS_NUMERICAS:
+        coluna = getattr(tabela, nome)
+        adicionar(nome, coluna.tobytes(), coluna.typecode, len(coluna))
+    for nome in COLUNAS_TEXTO + COLUNAS_CATEGORICAS + COLUNAS_MULTIVALORADAS:
+        coluna = getattr(tabela, nome)
+        textos = coluna if nome in COLUNAS_TEXTO else coluna.termos.valores
+        dados = _codificar_textos(textos)
+        if dados is None:
+            return False
+        sufixo = '' if nome in COLUNAS_TEXTO else '.termos'
+        adicionar(nome + sufixo, dados, 'texto', len(textos))
+        if nome in COLUNAS_CATEGORICAS + COLUNAS_MULTIVALORADAS:
+            adicionar(nome + '.codigos', coluna.codigos.tobytes(), coluna.codigos.typecode, len(coluna.codigos))
+        if nome in COLUNAS_MULTIVALORADAS:
+            adicionar(nome + '.deslocamentos', coluna.deslocamentos.tobytes(),
+                      coluna.deslocamentos.typecode, len(coluna.deslocamentos))
+
+    cabecalho = {
+        'ordem_bytes': sys.byteorder,
+        'origem': origem or _identificar_origem(caminho_arquivo),
+        'linhas': len(tabela),
+        'conversor_datas': {
+            'formatos': tabela.conversor_datas.formatos,
+            'acertos': tabela.conversor_datas.acertos,
+        },
+        'blocos': {},
+    }
+    # Calcula a posição de cada bloco, alinhada a 8 bytes, depois do cabeçalho
+    posicao = 0
+    for nome, dados, tipo, quantidade in blocos:
+        tamanho_item = array(tipo).itemsize if tipo != 'texto' else 1
+        cabecalho['blocos'][nome] = [posicao, len(dados), tipo, tamanho_item, quantidade]
+        posicao += (len(dados) + 7) // 8 * 8
+    texto_cabecalho = json.dumps(cabecalho, ensure_ascii=False).encode('utf-8')
+    inicio_blocos = (len(ASSINATURA) + 8 + len(texto_cabecalho) + 7) // 8 * 8
+
+    destino = caminho_cache(caminho_arquivo)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, 'wb') as arquivo:
+            arquivo.write(ASSINATURA)
+            arquivo.write(struct.pack('<Q', len(texto_cabecalho)))
+            arquivo.write(texto_cabecalho)
+            arquivo.write(bytes(inicio_blocos - arquivo.tell()))
+            for _, dados, _, _ in blocos:
+                arquivo.write(dados)
+                arquivo.write(bytes(-len(dados) % 8))
+        os.replace(temporario, destino)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    return True
+
+
+def _ler_cabecalho(mapa: mmap.mmap) -> Optional[Dict[str, Any]]:
+    """Lê e valida o cabeçalho do cache mapeado."""
+    if mapa[:len(ASSINATURA)] != ASSINATURA:
+        return None
+    (tamanho,) = struct.unpack('<Q', mapa[len(ASSINATURA):len(ASSINATURA) + 8])
+    inicio = len(ASSINATURA) + 8
+    cabecalho = json.loads(mapa[inicio:inicio + tamanho].decode('utf-8'))
+    if cabecalho['ordem_bytes'] != sys.byteorder:
+        return None
+    for _, _, tipo, tamanho_item, _ in cabecalho['blocos'].values():
+        if tipo != 'texto' and array(tipo).itemsize != tamanho_item:
+            return None
+    cabecalho['inicio_blocos'] = (inicio + tamanho + 7) // 8 * 8
+    return cabecalho
+
+
+def _verificar_origem(origem: Dict[str, Any], caminho_arquivo: str) -> Optional[Dict[str, Any]]:
+    """
+    Verifica se o CSV ainda é o mesmo usado para gerar o cache.
+
+    Returns:
+        Dict[str, Any] ou None: A identificação atual do CSV se o conteúdo não
+        mudou, ou None se o cache está desatualizado.
+    """
+    estado = os.stat(caminho_arquivo)
+    if estado.st_size != origem['tamanho']:
+        return None
+    if estado.st_mtime_ns == origem['mtime_ns']:
+        return origem
+    # A data mudou mas o tamanho não: só o conteúdo decide
+    if calcular_hash(caminho_arquivo) != origem['sha256']:
+        return None
+    return dict(origem, mtime_ns=estado.st_mtime_ns)
+
+
+def carregar_cache(caminho_arquivo: str) -> Optional[TabelaJogos]:
+    """
+    Carrega a tabela de jogos a partir do cache binário de um CSV.
+
+    Args:
+        caminho_arquivo (str): Caminho para o CSV de origem.
+
+    Returns:
+        TabelaJogos ou None: A tabela do cache, ou None se não houver cache
+        válido para o conteúdo atual do CSV.
+    """
+    destino = caminho_cache(caminho_arquivo)
+    if not os.path.exists(destino):
+        return None
+
+    try:
+        with open(destino, 'rb') as arquivo, \
+                mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            cabecalho = _ler_cabecalho(mapa)
+            origem = _verificar_origem(cabecalho['origem'], caminho_arquivo) if cabecalho else None
+            if origem is None:
+                return None
+
+            inicio_blocos = cabecalho['inicio_blocos']
+
+            def ler(nome: str) -> Any:
+                posicao, tamanho, tipo, _, quantidade = cabecalho['blocos'][nome]
+                dados = mapa[inicio_blocos + posicao:inicio_blocos + posicao + tamanho]
+                if tipo == 'texto':
+                    return _decodificar_textos(dados, quantidade)
+                coluna = array(tipo)
+                coluna.frombytes(dados)
+                return coluna
+
+            tabela = TabelaJogos()
+            for nome in COLUNAS_NUMERICAS + COLUNAS_TEXTO:
+                setattr(tabela, nome, ler(nome))
+            for nome in COLUNAS_CATEGORICAS:
+                coluna = ColunaCategorica()
+                coluna.termos = DicionarioTermos.de_valores(ler(nome + '.termos'))
+                coluna.codigos = ler(nome + '.codigos')
+                setattr(tabela, nome, coluna)
+            for nome in COLUNAS_MULTIVALORADAS:
+                coluna = ColunaMultivalorada()
+                coluna.termos = DicionarioTermos.de_valores(ler(nome + '.termos'))
+                coluna.codigos = ler(nome + '.codigos')
+                coluna.deslocamentos = ler(nome + '.deslocamentos')
+                setattr(tabela, nome, coluna)
+
+            conversor = cabecalho['conversor_datas']
+            tabela.conversor_datas.formatos = conversor['formatos']
+            tabela.conversor_datas.acertos = conversor['acertos']
+    except (OSError, ValueError, KeyError, struct.error):
+        # Cache ilegível ou de uma versão incompatível: será recriado
+        return None
+
+    if len(tabela) != cabecalho['linhas']:
+        return None
+    if origem is not cabecalho['origem']:
+        # Só a data de modificação mudou: atualiza o cache para evitar novo hash
+        try:
+            salvar_cache(tabela, caminho_arquivo, origem)
+        except OSError:
+            # Diretório somente leitura ou cheio: o cache lido continua válido
+            pass
+    return tabela
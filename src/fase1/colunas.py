@@ -0,0 +1,239 @@
+"""
+Módulo com estruturas de armazenamento colunar para os dados de jogos.
+
+Este módulo fornece colunas compactas (baseadas em `array` e em dicionários
+de termos) usadas por `TabelaJogos` para guardar o catálogo da Steam sem
+criar um objeto Python completo por linha do CSV.
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class DicionarioTermos:
+    """
+    Dicionário que associa cada termo distinto a um código inteiro.
+
+    Atributos:
+        valores (List[str]): Termos na ordem em que foram vistos pela primeira vez.
+    """
+
+    __slots__ = ('valores', '_codigos')
+
+    def __init__(self):
+        """Inicializa um dicionário de termos vazio."""
+        self.valores: List[str] = []
+        self._codigos: Dict[str, int] = {}
+
+    @classmethod
+    def de_valores(cls, valores: List[str]) -> 'DicionarioTermos':
+        """
+        Cria um dicionário a partir de uma lista de termos distintos.
+
+        Args:
+            valores (List[str]): Termos distintos, na ordem dos seus códigos.
+
+        Returns:
+            DicionarioTermos: Dicionário em que o termo `valores[i]` tem o código `i`.
+        """
+        dicionario = cls()
+        dicionario.valores = valores
+        dicionario._codigos = {termo: codigo for codigo, termo in enumerate(valores)}
+        return dicionario
+
+    def codificar(self, termo: str) -> int:
+        """
+        Retorna o código de um termo, registrando-o se ainda não existir.
+
+        Args:
+            termo (str): Termo a ser codificado.
+
+        Returns:
+            int: Código inteiro do termo.
+        """
+        codigo = self._codigos.get(termo)
+        if codigo is None:
+            codigo = len(self.valores)
+            self._codigos[termo] = codigo
+            self.valores.append(termo)
+        return codigo
+
+    def codigo(self, termo: str) -> Optional[int]:
+        """
+        Retorna o código de um termo já registrado.
+
+        Args:
+            termo (str): Termo procurado.
+
+        Returns:
+            int ou None: O código do termo, ou None se ele nunca foi visto.
+        """
+        return self._codigos.get(termo)
+
+    def __getitem__(self, codigo: int) -> str:
+        """Retorna o termo associado a um código."""
+        return self.valores[codigo]
+
+    def __len__(self) -> int:
+        """Retorna o número de termos distintos."""
+        return len(self.valores)
+
+
+class ColunaCategorica:
+    """
+    Coluna de texto codificada por dicionário.
+
+    Cada linha guarda apenas um código inteiro; o texto fica armazenado
+    uma única vez em `termos`. Indicada para colunas com muitos valores
+    repetidos, como datas de lançamento e faixas de proprietários.
+
+    Atributos:
+        termos (DicionarioTermos): Dicionário de valores distintos.
+        codigos (array): Código do valor de cada linha.
+    """
+
+    def __init__(self):
+        """Inicializa uma coluna categórica vazia."""
+        self.termos = DicionarioTermos()
+        self.codigos = array('I')
+
+    def adicionar(self, valor: str) -> None:
+        """
+        Adiciona um valor ao final da coluna.
+
+        Args:
+            valor (str): Valor da nova linha.
+        """
+        self.codigos.append(self.termos.codificar(valor))
+
+    def estender(self, outra: 'ColunaCategorica') -> None:
+        """
+        Adiciona ao final desta coluna todas as linhas de outra coluna.
+
+        Os códigos da outra coluna são traduzidos para o dicionário desta.
+
+        Args:
+            outra (ColunaCategorica): Coluna cujas linhas serão copiadas.
+        """
+        mapa = [self.termos.codificar(termo) for termo in outra.termos.valores]
+        self.codigos.extend(mapa[codigo] for codigo in outra.codigos)
+
+    def selecionar(self, linhas: Iterable[int]) -> 'ColunaCategorica':
+        """
+        Cria uma coluna apenas com as linhas indicadas.
+
+        A nova coluna compartilha o dicionário de termos desta, de modo que os
+        códigos continuam os mesmos.
+
+        Args:
+            linhas (Iterable[int]): Índices das linhas, na ordem desejada.
+
+        Returns:
+            ColunaCategorica: Coluna com as linhas selecionadas.
+        """
+        selecao = ColunaCategorica()
+        selecao.termos = self.termos
+        codigos = self.codigos
+        selecao.codigos = array('I', (codigos[linha] for linha in linhas))
+        return selecao
+
+    def __getitem__(self, indice: int) -> str:
+        """Retorna o valor da linha indicada."""
+        return self.termos.valores[self.codigos[indice]]
+
+    def __len__(self) -> int:
+        """Retorna o número de linhas da coluna."""
+        return len(self.codigos)
+
+
+class ColunaMultivalorada:
+    """
+    Coluna com uma lista de termos por linha, em formato de deslocamentos.
+
+    Os códigos de todas as linhas ficam contíguos em `codigos`; os termos da
+    linha `i` ocupam o intervalo `codigos[deslocamentos[i]:deslocamentos[i + 1]]`.
+
+    Atributos:
+        termos (DicionarioTermos): Dicionário de termos distintos.
+        deslocamentos (array): Posição inicial de cada linha em `codigos`.
+        codigos (array): Códigos dos termos de todas as linhas.
+    """
+
+    def __init__(self):
+        """Inicializa uma coluna multivalorada vazia."""
+        self.termos = DicionarioTermos()
+        self.deslocamentos = array('I', [0])
+        self.codigos = array('I')
+
+    def adicionar(self, valores: Iterable[str]) -> None:
+        """
+        Adiciona uma linha com a lista de termos fornecida.
+
+        Args:
+            valores (Iterable[str]): Termos da nova linha.
+        """
+        codificar = self.termos.codificar
+        self.codigos.extend(codificar(valor) for valor in valores)
+        self.deslocamentos.append(len(self.codigos))
+
+    def estender(self, outra: 'ColunaMultivalorada') -> None:
+        """
+        Adiciona ao final desta coluna todas as linhas de outra coluna.
+
+        Os códigos da outra coluna são traduzidos para o dicionário desta e os
+        deslocamentos são ajustados para a nova posição das linhas.
+
+        Args:
+            outra (ColunaMultivalorada): Coluna cujas linhas serão copiadas.
+        """
+        mapa = [self.termos.codificar(termo) for termo in outra.termos.valores]
+        base = len(self.codigos)
+        self.codigos.extend(mapa[codigo] for codigo in outra.codigos)
+        self.deslocamentos.extend(base + deslocamento for deslocamento in outra.deslocamentos[1:])
+
+    def selecionar(self, linhas: Iterable[int]) -> 'ColunaMultivalorada':
+        """
+        Cria uma coluna apenas com as linhas indicadas.
+
+        A nova coluna compartilha o dicionário de termos desta, de modo que os
+        códigos continuam os mesmos.
+
+        Args:
+            linhas (Iterable[int]): Índices das linhas, na ordem desejada.
+
+        Returns:
+            ColunaMultivalorada: Coluna com as linhas selecionadas.
+        """
+        selecao = ColunaMultivalorada()
+        selecao.termos = self.termos
+        codigos, deslocamentos = self.codigos, self.deslocamentos
+        for linha in linhas:
+            selecao.codigos.extend(codigos[deslocamentos[linha]:deslocamentos[linha + 1]])
+            selecao.deslocamentos.append(len(selecao.codigos))
+        return selecao
+
+    def codigos_linha(self, indice: int) -> array:
+        """
+        Retorna os códigos dos termos de uma linha.
+
+        Args:
+            indice (int): Índice da linha.
+
+        Returns:
+            array: Códigos dos termos da linha.
+        """
+        return self.codigos[self.deslocamentos[indice]:self.deslocamentos[indice + 1]]
+
+    def __getitem__(self, indice: int) -> List[str]:
+        """Retorna a lista de termos da linha indicada."""
+        valores = self.termos.valores
+        return [valores[codigo] for codigo in self.codigos_linha(indice)]
+
+    def __iter__(self) -> Iterator[List[str]]:
+        """Itera sobre as listas de termos de todas as linhas."""
+        for indice in range(len(self)):
+            yield self[indice]
+
+    def __len__(self) -> int:
+        """Retorna o número de linhas da coluna."""
+        return len(self.deslocamentos) - 1
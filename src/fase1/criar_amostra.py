@@ -1,4 +1,4 @@
-from src.fase1.analisador_jogos import AnalisadorJogos
+from src.fase1.dados_jogos import DadosJogos
 
 def main():
     """
@@ -9,9 +9,14 @@ def main():
         arquivo_dados = 'steam_games.csv'
         arquivo_amostra = 'amostra_jogos.csv'
         
-        # Cria o analisador e gera a amostra
-        analisador = AnalisadorJogos(arquivo_dados)
-        analisador.criar_amostra(20, arquivo_amostra)
+        # Semente fixa para que a amostra possa ser recriada, estratificada por
+        # ano para que os anos de lançamento fiquem representados na proporção real
+        semente = 42
+        estratificar_por = 'ano'
+        
+        # Sorteia a amostra diretamente do CSV, sem carregar o arquivo inteiro
+        DadosJogos().criar_amostra(20, arquivo_amostra, semente, estratificar_por,
+                                   arquivo_origem=arquivo_dados)
         
         print(f"Amostra de 20 jogos criada com sucesso no arquivo '{arquivo_amostra}'.")
         print("Use esta amostra para validar manualmente os resultados e criar os testes.")
@@ -20,4 +25,4 @@ def main():
         print(f"Erro ao criar amostra: {str(e)}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
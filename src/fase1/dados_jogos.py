@@ -6,9 +6,29 @@ dados de jogos da plataforma Steam.
 """
 
 import csv
-import random
-from datetime import datetime
-from typing import List, Dict, Optional, Union, Set, Tuple, Any
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from datetime import date
+from itertools import islice
+from typing import List, Dict, Callable, Iterable, Iterator, Optional, Union, Set, Tuple, Any
+
+from src.fase1.busca_nomes import IndiceNomes
+from src.fase1.colunas import ColunaCategorica, ColunaMultivalorada
+from src.fase1.datas import ConversorDatas
+from src.fase1.indices import COLUNAS_INDEXAVEIS, IndiceInvertido, Predicado, indice_por_chave
+from src.fase1.leitura_csv import dividir_em_intervalos, fim_ultimo_registro, ler_cabecalho, ler_linhas_intervalo
+from src.instrumentacao import INSTRUMENTACAO, ContagemRejeicoes, etapa
+
+# Número de linhas convertidas por lote na leitura em fluxo
+LINHAS_POR_LOTE = 10_000
+
+# Bytes antes do ponto de leitura usados para detectar se o CSV foi reescrito
+TAMANHO_ASSINATURA = 64 * 1024
 
 
 class ErroDadosJogos(Exception):
@@ -16,12 +36,156 @@ class ErroDadosJogos(Exception):
     pass
 
 
+class TabelaJogos:
+    """
+    Armazenamento colunar dos dados de jogos.
+
+    Em vez de um objeto por jogo, cada atributo é guardado em uma coluna
+    compacta: preços e anos em arrays numéricos, textos repetidos codificados
+    por dicionário e listas (desenvolvedores, publicadoras, gêneros) em
+    colunas de deslocamentos. As datas de lançamento são convertidas uma
+    única vez, no momento em que a linha é adicionada.
+
+    Atributos:
+        app_ids (List[str]): Identificadores dos jogos.
+        nomes (List[str]): Nomes dos jogos.
+        datas_lancamento (ColunaCategorica): Datas de lançamento em texto.
+        donos_estimados (ColunaCategorica): Faixas de proprietários estimados.
+        precos (array): Preços dos jogos.
+        anos (array): Anos de lançamento (0 quando desconhecido).
+        datas (array): Datas de lançamento como ordinais de `date` (0 quando desconhecida).
+        desenvolvedores (ColunaMultivalorada): Desenvolvedores de cada jogo.
+        publicadores (ColunaMultivalorada): Publicadoras de cada jogo.
+        generos (ColunaMultivalorada): Gêneros de cada jogo.
+        conversor_datas (ConversorDatas): Conversor usado para as datas de lançamento.
+    """
+
+    def __init__(self, conversor_datas: Optional[ConversorDatas] = None):
+        """
+        Inicializa uma tabela vazia.
+
+        Args:
+            conversor_datas (ConversorDatas, opcional): Conversor de datas a ser
+                                                       compartilhado com outras tabelas.
+        """
+        self.app_ids: List[str] = []
+        self.nomes: List[str] = []
+        self.datas_lancamento = ColunaCategorica()
+        self.donos_estimados = ColunaCategorica()
+        self.precos = array('d')
+        self.anos = array('H')
+        self.datas = array('i')
+        self.desenvolvedores = ColunaMultivalorada()
+        self.publicadores = ColunaMultivalorada()
+        self.generos = ColunaMultivalorada()
+        self.conversor_datas = conversor_datas or ConversorDatas()
+
+    def adicionar(self, dados_jogo: Dict[str, Any]) -> None:
+        """
+        Converte uma linha do CSV e a adiciona ao final da tabela.
+
+        A linha só é gravada nas colunas depois de totalmente convertida, de
+        modo que uma linha inválida não deixa a tabela inconsistente.
+
+        Args:
+            dados_jogo: Dicionário contendo os dados do jogo.
+
+        Raises:
+            ErroDadosJogos: Se houver um erro ao processar os dados do jogo.
+        """
+        try:
+            app_id = dados_jogo.get('AppID') or ''
+            nome = dados_jogo.get('Name') or ''
+            data_lancamento = dados_jogo.get('Release date') or ''
+            donos_estimados = dados_jogo.get('Estimated owners') or ''
+
+            # Converte preço para float
+            preco_str = dados_jogo.get('Price', '0')
+            preco = float(preco_str) if preco_str else 0.0
+
+            # Processa listas separadas por vírgulas ou ponto e vírgula
+            desenvolvedores = dados_jogo.get('Developers', '')
+            desenvolvedores = [d.strip() for d in desenvolvedores.split(';')] if desenvolvedores else []
+
+            publicadores = dados_jogo.get('Publishers', '')
+            publicadores = [p.strip() for p in publicadores.split(';')] if publicadores else []
+
+            generos = dados_jogo.get('Genres', '')
+            generos = [g.strip() for g in generos.split(',')] if generos else []
+
+            ano, data = self.conversor_datas.converter(data_lancamento)
+        except Exception as e:
+            raise ErroDadosJogos(f"Erro ao processar dados do jogo {dados_jogo.get('Name', 'desconhecido')}: {str(e)}") from e
+
+        self.app_ids.append(app_id)
+        self.nomes.append(nome)
+        self.datas_lancamento.adicionar(data_lancamento)
+        self.donos_estimados.adicionar(donos_estimados)
+        self.precos.append(preco)
+        self.anos.append(ano or 0)
+        self.datas.append(data.toordinal() if data else 0)
+        self.desenvolvedores.adicionar(desenvolvedores)
+        self.publicadores.adicionar(publicadores)
+        self.generos.adicionar(generos)
+
+    def estender(self, outra: 'TabelaJogos') -> None:
+        """
+        Adiciona ao final desta tabela todas as linhas de outra tabela.
+
+        Usado para juntar, na ordem original, as tabelas parciais produzidas
+        pela leitura em paralelo.
+
+        Args:
+            outra (TabelaJogos): Tabela cujas linhas serão copiadas.
+        """
+        self.app_ids.extend(outra.app_ids)
+        self.nomes.extend(outra.nomes)
+        self.datas_lancamento.estender(outra.datas_lancamento)
+        self.donos_estimados.estender(outra.donos_estimados)
+        self.precos.extend(outra.precos)
+        self.anos.extend(outra.anos)
+        self.datas.extend(outra.datas)
+        self.desenvolvedores.estender(outra.desenvolvedores)
+        self.publicadores.estender(outra.publicadores)
+        self.generos.estender(outra.generos)
+
+    def selecionar(self, linhas: Iterable[int]) -> 'TabelaJogos':
+        """
+        Cria uma tabela apenas com as linhas indicadas.
+
+        Usado para executar análises somente sobre os jogos que satisfazem uma
+        consulta. As colunas codificadas compartilham os dicionários de termos
+        desta tabela, então a seleção não deve receber novas linhas.
+
+        Args:
+            linhas (Iterable[int]): Índices das linhas, na ordem desejada.
+
+        Returns:
+            TabelaJogos: Tabela com as linhas selecionadas.
+        """
+        linhas = list(linhas)
+        selecao = TabelaJogos(self.conversor_datas)
+        selecao.app_ids = [self.app_ids[linha] for linha in linhas]
+        selecao.nomes = [self.nomes[linha] for linha in linhas]
+        for nome in ('precos', 'anos', 'datas'):
+            coluna = getattr(self, nome)
+            setattr(selecao, nome, array(coluna.typecode, (coluna[linha] for linha in linhas)))
+        for nome in ('datas_lancamento', 'donos_estimados', 'desenvolvedores', 'publicadores', 'generos'):
+            setattr(selecao, nome, getattr(self, nome).selecionar(linhas))
+        return selecao
+
+    def __len__(self) -> int:
+        """Retorna o número de jogos na tabela."""
+        return len(self.precos)
+
+
 class Jogo:
     """
     Representa um jogo com seus atributos.
 
-    Esta classe encapsula os dados de um jogo da plataforma Steam,
-    fornecendo métodos para acessar e manipular suas propriedades.
+    Esta classe é uma visão leve sobre uma linha de `TabelaJogos`: ela guarda
+    apenas a tabela e o índice da linha, e lê cada atributo das colunas
+    quando ele é acessado.
 
     Atributos:
         app_id (str): Identificador único do jogo na plataforma.
@@ -35,6 +199,8 @@ class Jogo:
         generos (List[str]): Lista de gêneros do jogo.
     """
 
+    __slots__ = ('_tabela', '_indice')
+
     def __init__(self, dados_jogo: Dict[str, Any]):
         """
         Inicializa um objeto Jogo com os dados fornecidos.
@@ -45,65 +211,253 @@ class Jogo:
         Raises:
             ErroDadosJogos: Se houver um erro ao processar os dados do jogo.
         """
-        try:
-            self.app_id = dados_jogo.get('AppID', '')
-            self.nome = dados_jogo.get('Name', '')
-            self.data_lancamento = dados_jogo.get('Release date', '')
-            self.donos_estimados = dados_jogo.get('Estimated owners', '')
-            
-            # Converte preço para float
-            preco_str = dados_jogo.get('Price', '0')
-            self.preco = float(preco_str) if preco_str else 0.0
-            
-            # Determina se o jogo é gratuito com base no preço
-            self.gratuito = self.preco == 0.0
-            
-            # Processa listas separadas por vírgulas ou ponto e vírgula
-            desenvolvedores = dados_jogo.get('Developers', '')
-            self.desenvolvedores = [d.strip() for d in desenvolvedores.split(';')] if desenvolvedores else []
-            
-            publicadores = dados_jogo.get('Publishers', '')
-            self.publicadores = [p.strip() for p in publicadores.split(';')] if publicadores else []
-            
-            generos = dados_jogo.get('Genres', '')
-            self.generos = [g.strip() for g in generos.split(',')] if generos else []
-            
-        except Exception as e:
-            raise ErroDadosJogos(f"Erro ao processar dados do jogo {dados_jogo.get('Name', 'desconhecido')}: {str(e)}")
-    
+        self._tabela = TabelaJogos()
+        self._tabela.adicionar(dados_jogo)
+        self._indice = 0
+
+    @classmethod
+    def da_tabela(cls, tabela: TabelaJogos, indice: int) -> 'Jogo':
+        """
+        Cria uma visão sobre uma linha já existente de uma tabela.
+
+        Args:
+            tabela (TabelaJogos): Tabela que contém o jogo.
+            indice (int): Índice da linha do jogo.
+
+        Returns:
+            Jogo: Visão sobre a linha indicada.
+        """
+        jogo = cls.__new__(cls)
+        jogo._tabela = tabela
+        jogo._indice = indice
+        return jogo
+
+    @property
+    def app_id(self) -> str:
+        return self._tabela.app_ids[self._indice]
+
+    @property
+    def nome(self) -> str:
+        return self._tabela.nomes[self._indice]
+
+    @property
+    def data_lancamento(self) -> str:
+        return self._tabela.datas_lancamento[self._indice]
+
+    @property
+    def donos_estimados(self) -> str:
+        return self._tabela.donos_estimados[self._indice]
+
+    @property
+    def preco(self) -> float:
+        return self._tabela.precos[self._indice]
+
+    @property
+    def gratuito(self) -> bool:
+        return self._tabela.precos[self._indice] == 0.0
+
+    @property
+    def desenvolvedores(self) -> List[str]:
+        return self._tabela.desenvolvedores[self._indice]
+
+    @property
+    def publicadores(self) -> List[str]:
+        return self._tabela.publicadores[self._indice]
+
+    @property
+    def generos(self) -> List[str]:
+        return self._tabela.generos[self._indice]
+
     def __str__(self) -> str:
         """Retorna uma representação em string do jogo."""
         return f"{self.nome} (ID: {self.app_id})"
     
     def ano_lancamento(self) -> Optional[int]:
         """
-        Extrai o ano de lançamento da data de lançamento.
+        Retorna o ano de lançamento, extraído durante o carregamento.
         
         Returns:
             int ou None: O ano de lançamento se disponível, None caso contrário.
         """
+        return self._tabela.anos[self._indice] or None
+
+    def data_lancamento_convertida(self) -> Optional[date]:
+        """
+        Retorna a data de lançamento completa, convertida durante o carregamento.
+
+        Returns:
+            date ou None: A data de lançamento, ou None se apenas o ano (ou nada)
+            pôde ser identificado.
+        """
+        ordinal = self._tabela.datas[self._indice]
+        return date.fromordinal(ordinal) if ordinal else None
+
+
+class VisaoJogos(Sequence):
+    """
+    Sequência de objetos Jogo criados sob demanda a partir de uma tabela.
+
+    Permite que o código existente continue tratando `DadosJogos.jogos` como
+    uma lista (iteração, `len`, indexação, `random.sample`) sem que um objeto
+    por jogo precise ficar em memória.
+    """
+
+    __slots__ = ('_tabela',)
+
+    def __init__(self, tabela: TabelaJogos):
+        """
+        Inicializa a visão sobre uma tabela.
+
+        Args:
+            tabela (TabelaJogos): Tabela com os dados dos jogos.
+        """
+        self._tabela = tabela
+
+    def __len__(self) -> int:
+        """Retorna o número de jogos."""
+        return len(self._tabela)
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[Jogo, List[Jogo]]:
+        """Retorna o jogo (ou a lista de jogos) na posição indicada."""
+        if isinstance(indice, slice):
+            return [Jogo.da_tabela(self._tabela, i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de jogo fora do intervalo")
+        return Jogo.da_tabela(self._tabela, indice)
+
+    def __iter__(self) -> Iterator[Jogo]:
+        """Itera sobre todos os jogos da tabela."""
+        tabela = self._tabela
+        for indice in range(len(tabela)):
+            yield Jogo.da_tabela(tabela, indice)
+
+
+class _ConversorCronometrado:
+    """Envolve um ConversorDatas e acumula o tempo gasto convertendo datas."""
+
+    __slots__ = ('conversor', 'segundos')
+
+    def __init__(self, conversor: ConversorDatas):
+        """Inicializa o cronômetro sobre um conversor."""
+        self.conversor = conversor
+        self.segundos = 0.0
+
+    def converter(self, texto: str) -> Tuple[Optional[int], Optional[date]]:
+        """Converte a data com o conversor original, medindo o tempo."""
+        inicio = time.perf_counter()
         try:
-            if not self.data_lancamento:
-                return None
-            
-            # Tenta diferentes formatos de data
-            formatos = ["%b %d, %Y", "%B %d, %Y", "%d %b, %Y", "%Y-%m-%d"]
-            for formato in formatos:
-                try:
-                    data = datetime.strptime(self.data_lancamento, formato)
-                    return data.year
-                except ValueError:
-                    continue
-            
-            # Tenta extrair o ano diretamente da string
-            for parte in self.data_lancamento.split():
-                parte = parte.strip(',.')
-                if parte.isdigit() and len(parte) == 4:
-                    return int(parte)
-            
-            return None
-        except Exception:
-            return None
+            return self.conversor.converter(texto)
+        finally:
+            self.segundos += time.perf_counter() - inicio
+
+
+def _adicionar_linhas(tabela: TabelaJogos, linhas: Iterable[Dict[str, str]], rejeicoes: ContagemRejeicoes,
+                      nome_etapa: Optional[str] = None) -> int:
+    """
+    Adiciona linhas do CSV à tabela, contando as que não puderem ser convertidas.
+
+    Retorna o número de linhas lidas, incluindo as rejeitadas.
+
+    Com a instrumentação ativa e `nome_etapa` informado, separa o tempo de
+    leitura do CSV, o de conversão das linhas e, dentro dele, o de conversão
+    das datas, registrados como subetapas de `nome_etapa`.
+    """
+    if nome_etapa is None or not INSTRUMENTACAO.ativa:
+        quantidade = 0
+        for quantidade, linha in enumerate(linhas, 1):
+            try:
+                tabela.adicionar(linha)
+            except Exception as e:
+                rejeicoes.registrar(e)
+        return quantidade
+
+    relogio = time.perf_counter
+    conversor = tabela.conversor_datas
+    cronometro = tabela.conversor_datas = _ConversorCronometrado(conversor)
+    leitura = conversao = 0.0
+    quantidade = 0
+    iterador = iter(linhas)
+    try:
+        while True:
+            inicio = relogio()
+            linha = next(iterador, None)
+            meio = relogio()
+            leitura += meio - inicio
+            if linha is None:
+                break
+            try:
+                tabela.adicionar(linha)
+            except Exception as e:
+                rejeicoes.registrar(e)
+            conversao += relogio() - meio
+            quantidade += 1
+    finally:
+        tabela.conversor_datas = conversor
+    INSTRUMENTACAO.acumular(f"{nome_etapa}.leitura_csv", leitura, quantidade)
+    INSTRUMENTACAO.acumular(f"{nome_etapa}.conversao", conversao, quantidade)
+    INSTRUMENTACAO.acumular(f"{nome_etapa}.conversao.datas", cronometro.segundos, quantidade)
+    return quantidade
+
+
+def _relatar_rejeicoes(rejeicoes: ContagemRejeicoes, nome_etapa: str, origem: str) -> None:
+    """Mostra um único aviso com as linhas rejeitadas e o registra na instrumentação."""
+    if rejeicoes:
+        print(rejeicoes.resumo(origem))
+        INSTRUMENTACAO.registrar_rejeicoes(nome_etapa, rejeicoes)
+
+
+def _carregar_intervalo(caminho_arquivo: str, inicio: int, fim: int,
+                        campos: List[str]) -> Tuple[TabelaJogos, ContagemRejeicoes]:
+    """
+    Converte as linhas de um intervalo de bytes do CSV em uma tabela parcial.
+
+    Executada nos processos de trabalho da leitura em paralelo.
+
+    Returns:
+        Tuple[TabelaJogos, ContagemRejeicoes]: A tabela parcial e as linhas
+        que não puderam ser processadas.
+    """
+    tabela = TabelaJogos()
+    rejeicoes = ContagemRejeicoes()
+    _adicionar_linhas(tabela, ler_linhas_intervalo(caminho_arquivo, inicio, fim, campos), rejeicoes)
+    return tabela, rejeicoes
+
+
+def _iterar_tabelas_paralelo(caminho_arquivo: str, processos: int,
+                             partes: int) -> Iterator[Tuple[TabelaJogos, ContagemRejeicoes]]:
+    """
+    Lê o CSV em intervalos de bytes usando vários processos.
+
+    As tabelas parciais são produzidas na ordem original do arquivo; no
+    máximo `2 * processos` intervalos ficam pendentes ao mesmo tempo.
+    """
+    campos = ler_cabecalho(caminho_arquivo)
+    _, intervalos = dividir_em_intervalos(caminho_arquivo, partes)
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        pendentes = []
+        for inicio, fim in intervalos:
+            pendentes.append(executor.submit(_carregar_intervalo, caminho_arquivo, inicio, fim, campos))
+            if len(pendentes) >= 2 * processos:
+                yield pendentes.pop(0).result()
+        for futuro in pendentes:
+            yield futuro.result()
+
+
+def _assinar_trecho(caminho_arquivo: str, fim: int) -> Tuple[str, bool]:
+    """
+    Calcula a assinatura dos últimos bytes lidos de um arquivo.
+
+    Returns:
+        Tuple[str, bool]: O hash SHA-256 dos `TAMANHO_ASSINATURA` bytes antes de
+        `fim` e se o último desses bytes é uma quebra de linha.
+    """
+    inicio = max(0, fim - TAMANHO_ASSINATURA)
+    with open(caminho_arquivo, 'rb') as arquivo:
+        arquivo.seek(inicio)
+        trecho = arquivo.read(fim - inicio)
+    return hashlib.sha256(trecho).hexdigest(), trecho.endswith(b'\n')
 
 
 class DadosJogos:
@@ -114,94 +468,409 @@ class DadosJogos:
     criar amostras aleatórias e realizar análises nos dados.
     
     Atributos:
-        jogos (List[Jogo]): Lista de objetos Jogo carregados.
+        tabela (TabelaJogos): Armazenamento colunar dos jogos carregados.
+        jogos (VisaoJogos): Sequência de objetos Jogo sobre a tabela.
         caminho_arquivo (str): Caminho para o arquivo CSV contendo os dados dos jogos.
     """
     
-    def __init__(self, caminho_arquivo: str = None):
+    def __init__(self, caminho_arquivo: str = None, usar_cache: bool = True):
         """
         Inicializa um objeto DadosJogos.
         
         Args:
             caminho_arquivo (str, opcional): Caminho para o arquivo CSV. Se fornecido,
                                            os dados são carregados imediatamente.
+            usar_cache (bool, opcional): Se True, usa o cache binário do CSV (veja
+                                       `carregar_dados`).
         """
-        self.jogos = []
+        self.tabela = TabelaJogos()
         self.caminho_arquivo = caminho_arquivo
+        self._usar_cache = usar_cache
+        self._campos: Optional[List[str]] = None
+        self._bytes_lidos = 0
+        self._assinatura_lida: Optional[Tuple[str, bool]] = None
+        self._indices: Dict[str, IndiceInvertido] = {}
+        self._indice_app_ids: Dict[str, int] = {}
+        self._app_ids_indexados = 0
+        self._indice_nomes: Optional[IndiceNomes] = None
         if caminho_arquivo:
-            self.carregar_dados(caminho_arquivo)
+            self.carregar_dados(caminho_arquivo, usar_cache=usar_cache)
+
+    @property
+    def jogos(self) -> VisaoJogos:
+        """Sequência de objetos Jogo sobre a tabela carregada."""
+        return VisaoJogos(self.tabela)
     
-    def carregar_dados(self, caminho_arquivo: str) -> None:
+    def carregar_dados(self, caminho_arquivo: str, processos: int = 1, usar_cache: bool = True) -> None:
         """
         Carrega dados de jogos de um arquivo CSV.
         
+        Com mais de um processo, o arquivo é dividido em intervalos de bytes
+        alinhados aos registros, cada intervalo é convertido em um processo
+        separado e as tabelas parciais são juntadas na ordem original.
+        
+        Com o cache ativado, a tabela convertida é gravada em um arquivo binário
+        ao lado do CSV (`<arquivo>.cache`), e as cargas seguintes leem esse
+        arquivo em vez de converter o CSV novamente. O cache é descartado
+        automaticamente quando o conteúdo do CSV muda.
+        
+        A posição até onde o CSV foi lido fica registrada, para que jogos
+        acrescentados depois ao final do arquivo possam ser lidos com
+        `atualizar_dados` sem converter o arquivo inteiro de novo.
+        
         Args:
             caminho_arquivo (str): Caminho para o arquivo CSV.
+            processos (int, opcional): Número de processos usados na leitura.
+            usar_cache (bool, opcional): Se True, lê e grava o cache binário do CSV.
             
         Raises:
             ErroDadosJogos: Se houver um erro ao carregar os dados.
         """
+        from src.fase1.cache_tabela import carregar_cache, salvar_cache
+        
         try:
-            self.jogos = []
-            self.caminho_arquivo = caminho_arquivo
+            self._reiniciar(caminho_arquivo, usar_cache)
+            rejeicoes = ContagemRejeicoes()
             
-            with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
-                leitor = csv.DictReader(arquivo)
-                for linha in leitor:
-                    try:
-                        # Cria um objeto Jogo para cada linha do CSV
-                        jogo = Jogo(linha)
-                        self.jogos.append(jogo)
-                    except Exception as e:
-                        print(f"Aviso: Não foi possível processar a linha: {linha}. Erro: {e}")
+            with etapa('carregar_dados') as medicao:
+                tamanho = os.path.getsize(caminho_arquivo)
+                with etapa('carregar_dados.cache'):
+                    tabela_cache = carregar_cache(caminho_arquivo) if usar_cache else None
+                if tabela_cache is not None:
+                    self.tabela = tabela_cache
+                    bytes_lidos = tamanho
+                elif processos > 1:
+                    self._campos = ler_cabecalho(caminho_arquivo)
+                    bytes_lidos = tamanho
+                    for tabela, rejeicoes_intervalo in _iterar_tabelas_paralelo(caminho_arquivo, processos,
+                                                                                4 * processos):
+                        rejeicoes.combinar(rejeicoes_intervalo)
+                        self.tabela.estender(tabela)
+                else:
+                    with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
+                        leitor = csv.DictReader(arquivo)
+                        # Adiciona cada linha do CSV às colunas da tabela
+                        _adicionar_linhas(self.tabela, leitor, rejeicoes, 'carregar_dados')
+                        self._campos = leitor.fieldnames
+                        bytes_lidos = arquivo.buffer.tell()
+                medicao.linhas = len(self.tabela)
+            _relatar_rejeicoes(rejeicoes, 'carregar_dados', caminho_arquivo)
                         
-            if not self.jogos:
+            if not self.tabela:
                 raise ErroDadosJogos(f"Nenhum jogo foi carregado de {caminho_arquivo}")
+            
+            if usar_cache and tabela_cache is None:
+                try:
+                    with etapa('carregar_dados.salvar_cache', len(self.tabela)):
+                        salvar_cache(self.tabela, caminho_arquivo)
+                except OSError as e:
+                    print(f"Aviso: Não foi possível gravar o cache de {caminho_arquivo}: {e}")
+            
+            self._bytes_lidos = bytes_lidos
+            self._assinatura_lida = _assinar_trecho(caminho_arquivo, bytes_lidos)
                 
         except Exception as e:
             raise ErroDadosJogos(f"Erro ao carregar dados de {caminho_arquivo}: {str(e)}")
     
-    def criar_amostra(self, tamanho_amostra: int, arquivo_saida: str) -> None:
+    def carregar_registros(self, registros: Iterable[Dict[str, Any]], origem: str = 'registros') -> None:
+        """
+        Carrega jogos já lidos de outra fonte, como as linhas de um DataFrame.
+        
+        Cada registro tem os campos de uma linha do CSV ('AppID', 'Name',
+        'Price', ...), em texto, e é convertido como na leitura do arquivo.
+        Permite que um CSV já lido por outro programa (por exemplo, com pandas
+        na fase 2) não seja lido de novo. Sem um arquivo de origem,
+        `atualizar_dados` não está disponível.
+        
+        Args:
+            registros (Iterable[Dict[str, Any]]): Jogos, um dicionário por linha.
+            origem (str, opcional): Nome da origem dos dados, usado nos avisos.
+            
+        Raises:
+            ErroDadosJogos: Se nenhum jogo puder ser carregado.
+        """
+        self._reiniciar(None, False)
+        rejeicoes = ContagemRejeicoes()
+        with etapa('carregar_registros') as medicao:
+            _adicionar_linhas(self.tabela, registros, rejeicoes, 'carregar_registros')
+            medicao.linhas = len(self.tabela)
+        _relatar_rejeicoes(rejeicoes, 'carregar_registros', origem)
+        
+        if not self.tabela:
+            raise ErroDadosJogos(f"Nenhum jogo foi carregado de {origem}")
+    
+    def _reiniciar(self, caminho_arquivo: Optional[str], usar_cache: bool) -> None:
+        """Descarta a tabela, os índices e a posição de leitura antes de uma nova carga."""
+        self.tabela = TabelaJogos()
+        self.caminho_arquivo = caminho_arquivo
+        self._usar_cache = usar_cache
+        self._campos = None
+        self._bytes_lidos = 0
+        self._assinatura_lida = None
+        self._indices = {}
+        self._indice_app_ids = {}
+        self._app_ids_indexados = 0
+        self._indice_nomes = None
+    
+    def atualizar_dados(self, processos: int = 1) -> int:
+        """
+        Lê os jogos acrescentados ao final do CSV desde a última carga.
+        
+        Apenas os bytes adicionados depois da posição registrada na última
+        leitura são convertidos. Um registro incompleto no final do arquivo
+        (ainda sendo escrito) fica para a próxima atualização. Se o arquivo
+        foi reescrito ou truncado, em vez de apenas crescer, os dados são
+        carregados novamente por completo.
+        
+        Args:
+            processos (int, opcional): Número de processos usados se for preciso
+                                     recarregar o arquivo inteiro.
+            
+        Returns:
+            int: O índice do primeiro jogo novo na tabela, ou 0 se a tabela
+            foi recarregada por completo.
+            
+        Raises:
+            ErroDadosJogos: Se nenhum arquivo foi carregado ou houver um erro na leitura.
+        """
+        if not self.caminho_arquivo or self._assinatura_lida is None:
+            raise ErroDadosJogos("Nenhum dado de jogo carregado.")
+        
+        caminho_arquivo = self.caminho_arquivo
+        try:
+            tamanho = os.path.getsize(caminho_arquivo)
+            if not self._apenas_acrescentado(tamanho):
+                self.carregar_dados(caminho_arquivo, processos, self._usar_cache)
+                return 0
+            
+            primeiro_novo = len(self.tabela)
+            fim = fim_ultimo_registro(caminho_arquivo, self._bytes_lidos, tamanho)
+            if fim > self._bytes_lidos:
+                if self._campos is None:
+                    self._campos = ler_cabecalho(caminho_arquivo)
+                rejeicoes = ContagemRejeicoes()
+                with etapa('atualizar_dados') as medicao:
+                    _adicionar_linhas(self.tabela,
+                                      ler_linhas_intervalo(caminho_arquivo, self._bytes_lidos, fim, self._campos),
+                                      rejeicoes, 'atualizar_dados')
+                    medicao.linhas = len(self.tabela) - primeiro_novo
+                _relatar_rejeicoes(rejeicoes, 'atualizar_dados', caminho_arquivo)
+                self._bytes_lidos = fim
+                self._assinatura_lida = _assinar_trecho(caminho_arquivo, fim)
+            return primeiro_novo
+        except ErroDadosJogos:
+            raise
+        except Exception as e:
+            raise ErroDadosJogos(f"Erro ao atualizar dados de {caminho_arquivo}: {str(e)}")
+    
+    def _apenas_acrescentado(self, tamanho: int) -> bool:
+        """Verifica se o CSV só recebeu bytes novos no final desde a última leitura."""
+        if tamanho < self._bytes_lidos:
+            return False
+        _, terminou_em_quebra = self._assinatura_lida
+        if tamanho > self._bytes_lidos and not terminou_em_quebra:
+            # O último registro lido não tinha quebra de linha e pode ter sido completado
+            return False
+        return _assinar_trecho(self.caminho_arquivo, self._bytes_lidos) == self._assinatura_lida
+    
+    @staticmethod
+    def iterar_tabelas(caminho_arquivo: str, processos: int = 1,
+                       linhas_por_lote: int = LINHAS_POR_LOTE) -> Iterator[TabelaJogos]:
+        """
+        Percorre um arquivo CSV em tabelas parciais, sem carregá-lo inteiro na memória.
+        
+        Os jogos são convertidos em lotes (ou em intervalos de bytes, quando há
+        mais de um processo) e as tabelas são produzidas na ordem do arquivo.
+        Cada tabela tem seus próprios dicionários de termos.
+        
+        Args:
+            caminho_arquivo (str): Caminho para o arquivo CSV.
+            processos (int, opcional): Número de processos usados na leitura.
+            linhas_por_lote (int, opcional): Linhas convertidas por lote na leitura sequencial.
+            
+        Yields:
+            TabelaJogos: Cada lote de jogos do arquivo, na ordem original.
+        """
+        if processos > 1:
+            tamanho = os.path.getsize(caminho_arquivo)
+            partes = max(4 * processos, tamanho // (16 * 1024 * 1024))
+            rejeicoes = ContagemRejeicoes()
+            for tabela, rejeicoes_intervalo in _iterar_tabelas_paralelo(caminho_arquivo, processos, partes):
+                rejeicoes.combinar(rejeicoes_intervalo)
+                yield tabela
+            _relatar_rejeicoes(rejeicoes, 'iterar_tabelas', caminho_arquivo)
+            return
+
+        conversor_datas = ConversorDatas()
+        rejeicoes = ContagemRejeicoes()
+        with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
+            leitor = csv.DictReader(arquivo)
+            while True:
+                tabela = TabelaJogos(conversor_datas)
+                if not _adicionar_linhas(tabela, islice(leitor, linhas_por_lote), rejeicoes, 'iterar_tabelas'):
+                    break
+                if tabela:
+                    yield tabela
+        _relatar_rejeicoes(rejeicoes, 'iterar_tabelas', caminho_arquivo)
+    
+    @staticmethod
+    def iterar_jogos(caminho_arquivo: str, processos: int = 1,
+                     linhas_por_lote: int = LINHAS_POR_LOTE) -> Iterator[Jogo]:
+        """
+        Percorre os jogos de um arquivo CSV sem carregá-lo inteiro na memória.
+        
+        Os jogos são convertidos em lotes (veja `iterar_tabelas`) e produzidos
+        na ordem do arquivo. Cada lote é descartado assim que o chamador deixa
+        de referenciar seus jogos.
+        
+        Args:
+            caminho_arquivo (str): Caminho para o arquivo CSV.
+            processos (int, opcional): Número de processos usados na leitura.
+            linhas_por_lote (int, opcional): Linhas convertidas por lote na leitura sequencial.
+            
+        Yields:
+            Jogo: Cada jogo do arquivo, na ordem original.
+        """
+        for tabela in DadosJogos.iterar_tabelas(caminho_arquivo, processos, linhas_por_lote):
+            yield from VisaoJogos(tabela)
+    
+    def criar_amostra(self, tamanho_amostra: int, arquivo_saida: str, semente: Optional[int] = None,
+                      estratificar_por: Union[None, str, Callable[[Dict[str, str]], Any]] = None,
+                      arquivo_origem: Optional[str] = None) -> None:
         """
         Cria uma amostra aleatória de jogos e a salva em um arquivo CSV.
         
+        A amostra é sorteada por reservatório em uma única leitura do CSV de
+        origem, sem exigir que os dados estejam carregados na memória.
+        
         Args:
             tamanho_amostra (int): O número de jogos a serem incluídos na amostra.
             arquivo_saida (str): Caminho para salvar o arquivo CSV da amostra.
+            semente (int, opcional): Semente do gerador aleatório, para amostras reproduzíveis.
+            estratificar_por (str ou Callable, opcional): 'ano' ou 'faixa_preco' para
+                uma amostra estratificada por ano de lançamento ou faixa de preço, ou
+                uma função que recebe a linha do CSV e retorna seu estrato.
+            arquivo_origem (str, opcional): CSV de onde a amostra é sorteada. Se
+                omitido, usa o arquivo de onde os dados foram carregados.
             
         Raises:
             ErroDadosJogos: Se houver um erro ao criar a amostra.
         """
+        from src.fase1.amostragem import amostrar_csv
+        
         try:
-            if not self.jogos:
+            caminho_origem = arquivo_origem or self.caminho_arquivo
+            if not caminho_origem:
                 raise ErroDadosJogos("Nenhum dado de jogo carregado.")
             
-            if tamanho_amostra > len(self.jogos):
-                tamanho_amostra = len(self.jogos)
-            
-            # Seleciona jogos aleatórios para a amostra
-            jogos_amostra = random.sample(self.jogos, tamanho_amostra)
-            
-            # Obtém os nomes dos campos do CSV original
-            with open(self.caminho_arquivo, 'r', encoding='utf-8') as arquivo:
-                nomes_campos = csv.DictReader(arquivo).fieldnames
-            
-            # Cria o arquivo CSV da amostra
-            with open(arquivo_saida, 'w', newline='', encoding='utf-8') as arquivo:
-                escritor = csv.DictWriter(arquivo, fieldnames=nomes_campos)
-                escritor.writeheader()
-                
-                # Abre o arquivo original para ler as linhas correspondentes aos jogos da amostra
-                with open(self.caminho_arquivo, 'r', encoding='utf-8') as arquivo_original:
-                    leitor = csv.DictReader(arquivo_original)
-                    for linha in leitor:
-                        if linha['AppID'] in [jogo.app_id for jogo in jogos_amostra]:
-                            escritor.writerow(linha)
+            tamanho_amostra = amostrar_csv(caminho_origem, arquivo_saida, tamanho_amostra,
+                                           semente, estratificar_por)
             
             print(f"Amostra de {tamanho_amostra} jogos salva em {arquivo_saida}")
         except Exception as e:
             raise ErroDadosJogos(f"Erro ao criar amostra: {str(e)}")
     
+    def indice(self, coluna: str) -> IndiceInvertido:
+        """
+        Retorna o índice invertido de uma coluna, criando-o na primeira consulta.
+        
+        O índice acompanha a tabela: jogos lidos por `atualizar_dados` são
+        indexados na consulta seguinte, e uma nova carga descarta os índices.
+        
+        Args:
+            coluna (str): 'generos', 'publicadores' ou 'desenvolvedores'.
+            
+        Returns:
+            IndiceInvertido: Linhas em que cada termo da coluna aparece.
+            
+        Raises:
+            ErroDadosJogos: Se a coluna não puder ser indexada.
+        """
+        if coluna not in COLUNAS_INDEXAVEIS:
+            raise ErroDadosJogos(f"Coluna sem índice: {coluna}. Disponíveis: {', '.join(COLUNAS_INDEXAVEIS)}")
+        indice = self._indices.get(coluna)
+        if indice is None:
+            indice = self._indices[coluna] = IndiceInvertido(getattr(self.tabela, coluna))
+        elif indice.linhas_indexadas < len(self.tabela):
+            indice.atualizar()
+        return indice
+    
+    def buscar_jogo(self, app_id: str) -> Optional[Jogo]:
+        """
+        Procura um jogo pelo AppID usando um índice de hash.
+        
+        Args:
+            app_id (str): Identificador do jogo na Steam.
+            
+        Returns:
+            Jogo ou None: O jogo (a primeira ocorrência, se o AppID se repetir), ou
+            None se não houver jogo com esse AppID.
+        """
+        app_ids = self.tabela.app_ids
+        if self._app_ids_indexados < len(app_ids):
+            indice_por_chave(app_ids, self._indice_app_ids, self._app_ids_indexados)
+            self._app_ids_indexados = len(app_ids)
+        linha = self._indice_app_ids.get(str(app_id))
+        return Jogo.da_tabela(self.tabela, linha) if linha is not None else None
+    
+    def indice_nomes(self) -> IndiceNomes:
+        """
+        Retorna o índice de busca por nome, criando-o na primeira consulta.
+        
+        Como os índices invertidos, o índice acompanha a tabela: jogos lidos por
+        `atualizar_dados` são indexados na consulta seguinte, e uma nova carga
+        descarta o índice.
+        
+        Returns:
+            IndiceNomes: Índice com buscas exata, por prefixo e aproximada.
+        """
+        indice = self._indice_nomes
+        if indice is None or indice.nomes is not self.tabela.nomes:
+            indice = self._indice_nomes = IndiceNomes(self.tabela.nomes, self.tabela.app_ids)
+        elif indice.linhas_indexadas < len(self.tabela):
+            indice.atualizar()
+        return indice
+    
+    def buscar_por_nome(self, nome: str) -> List[Jogo]:
+        """
+        Procura os jogos com um nome, sem diferenciar acentos e maiúsculas.
+        
+        Args:
+            nome (str): Nome do jogo.
+            
+        Returns:
+            List[Jogo]: Jogos com esse nome, na ordem do arquivo (vazia se não houver).
+        """
+        return [Jogo.da_tabela(self.tabela, linha)
+                for resultado in self.indice_nomes().exato(nome) for linha in resultado.linhas]
+    
+    def consultar(self, predicado: Predicado) -> array:
+        """
+        Retorna as linhas dos jogos que satisfazem uma consulta.
+        
+        A consulta é resolvida apenas com os índices invertidos, sem comparar os
+        textos de cada jogo. Exemplo: `Termo('generos', 'Indie') & Termo('publicadores', 'Valve')`.
+        
+        Args:
+            predicado (Predicado): Condição combinada com `&` e `|`.
+            
+        Returns:
+            array: Índices das linhas, em ordem crescente.
+        """
+        return predicado.linhas(self)
+    
+    def filtrar(self, predicado: Predicado) -> VisaoJogos:
+        """
+        Retorna os jogos que satisfazem uma consulta.
+        
+        Args:
+            predicado (Predicado): Condição combinada com `&` e `|`.
+            
+        Returns:
+            VisaoJogos: Jogos selecionados, na ordem do arquivo.
+        """
+        return VisaoJogos(self.tabela.selecionar(self.consultar(predicado)))
+    
     def obter_contagem_jogos(self) -> int:
         """
         Retorna o número total de jogos carregados.
@@ -209,7 +878,7 @@ class DadosJogos:
         Returns:
             int: Número de jogos.
         """
-        return len(self.jogos)
+        return len(self.tabela)
     
     def calcular_percentual_gratuitos_vs_pagos(self) -> Dict[str, float]:
         """
@@ -222,11 +891,11 @@ class DadosJogos:
             ErroDadosJogos: Se houver um erro no cálculo.
         """
         try:
-            if not self.jogos:
+            if not self.tabela:
                 raise ErroDadosJogos("Nenhum dado de jogo carregado.")
             
-            total_jogos = len(self.jogos)
-            jogos_gratuitos = sum(1 for jogo in self.jogos if jogo.gratuito)
+            total_jogos = len(self.tabela)
+            jogos_gratuitos = self.tabela.precos.count(0.0)
             jogos_pagos = total_jogos - jogos_gratuitos
             
             percentual_gratuitos = (jogos_gratuitos / total_jogos) * 100 if total_jogos > 0 else 0
@@ -239,10 +908,26 @@ class DadosJogos:
         except Exception as e:
             raise ErroDadosJogos(f"Erro ao calcular percentuais de jogos gratuitos vs pagos: {str(e)}")
     
-    def obter_ano_com_mais_lancamentos(self) -> Union[int, List[int]]:
+    def contar_lancamentos_por_ano(self) -> Dict[int, int]:
+        """
+        Conta os lançamentos de cada ano a partir da coluna de anos pré-calculada.
+
+        Returns:
+            Dict[int, int]: Número de jogos lançados em cada ano, na ordem em que
+            os anos aparecem nos dados. Jogos sem ano conhecido são ignorados.
+        """
+        contagem_anos = Counter(self.tabela.anos)
+        contagem_anos.pop(0, None)
+        return dict(contagem_anos)
+
+    def obter_ano_com_mais_lancamentos(self, contagem_anos: Optional[Dict[int, int]] = None) -> Union[int, List[int]]:
         """
         Encontra o ano(s) com o maior número de lançamentos de jogos.
         
+        Args:
+            contagem_anos (Dict[int, int], opcional): Contagem já calculada por
+                                                     `contar_lancamentos_por_ano`.
+        
         Returns:
             int ou List[int]: O ano com mais lançamentos, ou uma lista de anos em caso de empate.
             
@@ -250,15 +935,12 @@ class DadosJogos:
             ErroDadosJogos: Se houver um erro no cálculo.
         """
         try:
-            if not self.jogos:
+            if not self.tabela:
                 raise ErroDadosJogos("Nenhum dado de jogo carregado.")
             
             # Conta lançamentos por ano
-            contagem_anos = {}
-            for jogo in self.jogos:
-                ano = jogo.ano_lancamento()
-                if ano:
-                    contagem_anos[ano] = contagem_anos.get(ano, 0) + 1
+            if contagem_anos is None:
+                contagem_anos = self.contar_lancamentos_por_ano()
             
             if not contagem_anos:
                 raise ErroDadosJogos("Nenhum ano de lançamento válido encontrado nos dados.")
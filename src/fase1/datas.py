@@ -0,0 +1,104 @@
+"""
+Módulo para conversão das datas de lançamento dos jogos.
+
+Este módulo fornece um conversor de datas que aprende qual formato é o
+mais comum no arquivo, tenta esse formato primeiro e guarda em cache o
+resultado de cada texto de data já visto.
+"""
+
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+# Formatos de data aceitos, na ordem de preferência inicial
+FORMATOS_DATA = ["%b %d, %Y", "%B %d, %Y", "%d %b, %Y", "%Y-%m-%d"]
+
+
+class ConversorDatas:
+    """
+    Converte textos de data de lançamento em ano e data.
+
+    A cada conversão bem-sucedida o formato usado ganha um ponto; os formatos
+    são mantidos em ordem decrescente de acertos, de modo que o formato
+    dominante do arquivo é sempre o primeiro a ser tentado. Textos repetidos
+    são resolvidos pelo cache sem nenhuma tentativa de conversão.
+
+    Atributos:
+        formatos (List[str]): Formatos aceitos, do mais para o menos usado.
+        acertos (Dict[str, int]): Número de conversões feitas com cada formato.
+        tamanho_maximo_cache (int): Número máximo de textos mantidos em cache.
+    """
+
+    def __init__(self, formatos: Optional[List[str]] = None, tamanho_maximo_cache: int = 100_000):
+        """
+        Inicializa um conversor de datas.
+
+        Args:
+            formatos (List[str], opcional): Formatos aceitos, no padrão de `strptime`.
+                                          Se omitido, usa `FORMATOS_DATA`.
+            tamanho_maximo_cache (int, opcional): Limite de textos guardados em cache.
+        """
+        self.formatos = list(formatos or FORMATOS_DATA)
+        self.acertos: Dict[str, int] = {formato: 0 for formato in self.formatos}
+        self.tamanho_maximo_cache = tamanho_maximo_cache
+        self._cache: Dict[str, Tuple[Optional[int], Optional[date]]] = {}
+
+    def converter(self, texto: str) -> Tuple[Optional[int], Optional[date]]:
+        """
+        Converte um texto de data de lançamento.
+
+        Args:
+            texto (str): Data de lançamento como aparece no CSV.
+
+        Returns:
+            Tuple[Optional[int], Optional[date]]: O ano e a data completa. A data é
+            None quando só o ano pôde ser identificado; ambos são None quando
+            nada pôde ser identificado.
+        """
+        resultado = self._cache.get(texto)
+        if resultado is None:
+            resultado = self._converter_sem_cache(texto)
+            if len(self._cache) < self.tamanho_maximo_cache:
+                self._cache[texto] = resultado
+        return resultado
+
+    def _converter_sem_cache(self, texto: str) -> Tuple[Optional[int], Optional[date]]:
+        """Converte um texto testando os formatos na ordem de acertos."""
+        try:
+            if not texto:
+                return None, None
+
+            for posicao, formato in enumerate(self.formatos):
+                try:
+                    data = datetime.strptime(texto, formato).date()
+                except ValueError:
+                    continue
+                self._registrar_acerto(posicao)
+                return data.year, data
+
+            # Tenta extrair o ano diretamente da string
+            for parte in texto.split():
+                parte = parte.strip(',.')
+                if parte.isdigit() and len(parte) == 4:
+                    return int(parte), None
+
+            return None, None
+        except Exception:
+            return None, None
+
+    def _registrar_acerto(self, posicao: int) -> None:
+        """Contabiliza um acerto e promove o formato se ele passou o anterior."""
+        formato = self.formatos[posicao]
+        self.acertos[formato] += 1
+        while posicao > 0 and self.acertos[self.formatos[posicao - 1]] < self.acertos[formato]:
+            self.formatos[posicao - 1], self.formatos[posicao] = formato, self.formatos[posicao - 1]
+            posicao -= 1
+
+    def formato_dominante(self) -> Optional[str]:
+        """
+        Retorna o formato com mais conversões bem-sucedidas.
+
+        Returns:
+            str ou None: O formato dominante, ou None se nenhuma data foi convertida.
+        """
+        formato = self.formatos[0]
+        return formato if self.acertos[formato] else None
@@ -0,0 +1,270 @@
+"""
+Módulo com índices invertidos e consultas sobre a tabela de jogos.
+
+Este módulo fornece índices que associam cada gênero, publicadora ou
+desenvolvedor às linhas da tabela em que ele aparece, e predicados
+combináveis com `&` (E) e `|` (OU) que são resolvidos apenas com esses
+índices, sem comparar textos linha a linha.
+
+Exemplo:
+    >>> consulta = Termo('generos', 'Indie') & (Termo('generos', 'RPG') | Termo('generos', 'Strategy'))
+    >>> linhas = dados.consultar(consulta)
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+from src.fase1.colunas import ColunaMultivalorada
+
+# Colunas multivaloradas de `TabelaJogos` que podem ser indexadas
+COLUNAS_INDEXAVEIS = ('generos', 'publicadores', 'desenvolvedores')
+
+# Razão de tamanhos a partir da qual a interseção busca a lista menor na maior
+RAZAO_BUSCA_BINARIA = 16
+
+
+def intersecao(linhas_a: array, linhas_b: array) -> array:
+    """
+    Calcula a interseção de duas listas ordenadas de linhas.
+
+    Quando uma lista é muito menor que a outra, cada linha da menor é
+    procurada na maior por busca binária; caso contrário, a interseção é
+    feita com conjuntos.
+
+    Args:
+        linhas_a (array): Linhas em ordem crescente, sem repetição.
+        linhas_b (array): Linhas em ordem crescente, sem repetição.
+
+    Returns:
+        array: As linhas presentes nas duas listas, em ordem crescente.
+    """
+    if len(linhas_a) > len(linhas_b):
+        linhas_a, linhas_b = linhas_b, linhas_a
+    if len(linhas_a) * RAZAO_BUSCA_BINARIA >= len(linhas_b):
+        return array('I', sorted(set(linhas_a).intersection(linhas_b)))
+
+    resultado = array('I')
+    posicao = 0
+    for linha in linhas_a:
+        posicao = bisect_left(linhas_b, linha, posicao)
+        if posicao == len(linhas_b):
+            break
+        if linhas_b[posicao] == linha:
+            resultado.append(linha)
+    return resultado
+
+
+class IndiceInvertido:
+    """
+    Índice das linhas em que cada termo de uma coluna multivalorada aparece.
+
+    Para cada código de termo o índice guarda um `array('I')` com as linhas
+    em ordem crescente. Linhas acrescentadas depois à coluna são indexadas
+    com `atualizar`, sem refazer o índice.
+
+    Atributos:
+        coluna (ColunaMultivalorada): Coluna indexada.
+        listas (List[array]): Linhas de cada código de termo.
+        linhas_indexadas (int): Número de linhas da coluna já indexadas.
+    """
+
+    __slots__ = ('coluna', 'listas', 'linhas_indexadas')
+
+    def __init__(self, coluna: ColunaMultivalorada):
+        """
+        Cria o índice de uma coluna.
+
+        Args:
+            coluna (ColunaMultivalorada): Coluna a ser indexada.
+        """
+        self.coluna = coluna
+        self.listas: List[array] = []
+        self.linhas_indexadas = 0
+        self.atualizar()
+
+    def atualizar(self) -> None:
+        """Indexa as linhas acrescentadas à coluna desde a última atualização."""
+        coluna = self.coluna
+        listas = self.listas
+        listas.extend(array('I') for _ in range(len(coluna.termos) - len(listas)))
+
+        codigos, deslocamentos = coluna.codigos, coluna.deslocamentos
+        for linha in range(self.linhas_indexadas, len(coluna)):
+            for codigo in codigos[deslocamentos[linha]:deslocamentos[linha + 1]]:
+                lista = listas[codigo]
+                # Um termo repetido na mesma linha é indexado uma única vez
+                if not lista or lista[-1] != linha:
+                    lista.append(linha)
+        self.linhas_indexadas = len(coluna)
+
+    def linhas(self, termo: str) -> array:
+        """
+        Retorna as linhas em que um termo aparece.
+
+        Args:
+            termo (str): Termo procurado.
+
+        Returns:
+            array: Cópia das linhas em ordem crescente (vazia se o termo nunca
+            aparece); alterá-la não altera o índice.
+        """
+        codigo = self.coluna.termos.codigo(termo)
+        if codigo is None or codigo >= len(self.listas):
+            return array('I')
+        return array('I', self.listas[codigo])
+
+    def contagens(self) -> Dict[str, int]:
+        """
+        Retorna o número de linhas de cada termo, sem percorrer a tabela.
+
+        Returns:
+            Dict[str, int]: Número de linhas por termo, na ordem em que os termos
+            apareceram pela primeira vez.
+        """
+        termos = self.coluna.termos.valores
+        return {termos[codigo]: len(lista) for codigo, lista in enumerate(self.listas) if lista}
+
+
+class Predicado:
+    """
+    Classe base das condições de consulta.
+
+    Predicados podem ser combinados com `&` (todas as condições) e `|`
+    (alguma das condições). Subclasses implementam `linhas`.
+    """
+
+    def linhas(self, dados: Any) -> array:
+        """
+        Resolve o predicado com os índices de um objeto DadosJogos.
+
+        Args:
+            dados (DadosJogos): Dados com os índices a consultar.
+
+        Returns:
+            array: Linhas que satisfazem o predicado, em ordem crescente.
+        """
+        raise NotImplementedError
+
+    def __and__(self, outro: 'Predicado') -> 'E':
+        """Combina dois predicados exigindo ambos."""
+        return E(self, outro)
+
+    def __or__(self, outro: 'Predicado') -> 'Ou':
+        """Combina dois predicados exigindo algum deles."""
+        return Ou(self, outro)
+
+
+class Termo(Predicado):
+    """
+    Condição de que uma coluna multivalorada contenha um termo.
+
+    Atributos:
+        coluna (str): 'generos', 'publicadores' ou 'desenvolvedores'.
+        valor (str): Termo procurado, por exemplo 'RPG' ou 'Valve'.
+    """
+
+    def __init__(self, coluna: str, valor: str):
+        """
+        Inicializa a condição.
+
+        Args:
+            coluna (str): Nome da coluna (uma de `COLUNAS_INDEXAVEIS`).
+            valor (str): Termo procurado.
+        """
+        self.coluna = coluna
+        self.valor = valor
+
+    def linhas(self, dados: Any) -> array:
+        """Retorna as linhas do termo no índice da coluna."""
+        return dados.indice(self.coluna).linhas(self.valor)
+
+    def __repr__(self) -> str:
+        """Representação legível da condição."""
+        return f"Termo({self.coluna!r}, {self.valor!r})"
+
+
+class E(Predicado):
+    """Condição satisfeita pelas linhas que satisfazem todos os predicados."""
+
+    def __init__(self, *predicados: Predicado):
+        """
+        Inicializa a conjunção.
+
+        Args:
+            *predicados (Predicado): Predicados que devem ser satisfeitos.
+        """
+        self.predicados = predicados
+
+    def __and__(self, outro: Predicado) -> 'E':
+        """Acrescenta um predicado à conjunção, sem aninhar."""
+        return E(*self.predicados, outro)
+
+    def linhas(self, dados: Any) -> array:
+        """Intersecta as linhas dos predicados, começando pelas listas menores."""
+        listas = sorted((predicado.linhas(dados) for predicado in self.predicados), key=len)
+        if not listas:
+            return array('I')
+        resultado = listas[0]
+        for lista in listas[1:]:
+            if not resultado:
+                break
+            resultado = intersecao(resultado, lista)
+        return array('I', resultado)
+
+    def __repr__(self) -> str:
+        """Representação legível da conjunção."""
+        return f"E{self.predicados!r}"
+
+
+class Ou(Predicado):
+    """Condição satisfeita pelas linhas que satisfazem algum dos predicados."""
+
+    def __init__(self, *predicados: Predicado):
+        """
+        Inicializa a disjunção.
+
+        Args:
+            *predicados (Predicado): Predicados alternativos.
+        """
+        self.predicados = predicados
+
+    def __or__(self, outro: Predicado) -> 'Ou':
+        """Acrescenta um predicado à disjunção, sem aninhar."""
+        return Ou(*self.predicados, outro)
+
+    def linhas(self, dados: Any) -> array:
+        """Une as linhas dos predicados."""
+        listas = [predicado.linhas(dados) for predicado in self.predicados]
+        if len(listas) == 1:
+            return array('I', listas[0])
+        conjunto = set()
+        for lista in listas:
+            conjunto.update(lista)
+        return array('I', sorted(conjunto))
+
+    def __repr__(self) -> str:
+        """Representação legível da disjunção."""
+        return f"Ou{self.predicados!r}"
+
+
+def indice_por_chave(chaves: List[str], indice: Optional[Dict[str, int]] = None,
+                     inicio: int = 0) -> Dict[str, int]:
+    """
+    Cria (ou estende) um índice de hash da chave de cada linha.
+
+    Quando uma chave se repete, o índice aponta para a primeira linha em que
+    ela aparece.
+
+    Args:
+        chaves (List[str]): Chave de cada linha, por exemplo os AppIDs.
+        indice (Dict[str, int], opcional): Índice existente a ser estendido.
+        inicio (int, opcional): Primeira linha ainda não indexada.
+
+    Returns:
+        Dict[str, int]: Linha de cada chave.
+    """
+    indice = {} if indice is None else indice
+    for linha in range(inicio, len(chaves)):
+        indice.setdefault(chaves[linha], linha)
+    return indice
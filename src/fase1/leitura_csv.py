@@ -0,0 +1,156 @@
+"""
+Módulo para leitura de arquivos CSV em intervalos de bytes.
+
+Este módulo fornece funções para dividir um arquivo CSV em intervalos
+alinhados ao início de registros (respeitando quebras de linha dentro de
+campos entre aspas) e para ler as linhas de cada intervalo de forma
+independente, permitindo que vários processos leiam o mesmo arquivo.
+"""
+
+import csv
+import io
+import mmap
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Quantidade máxima de bytes copiados de uma vez ao contar aspas
+TAMANHO_JANELA = 16 * 1024 * 1024
+
+
+def _contar_aspas(mapa: mmap.mmap, inicio: int, fim: int) -> int:
+    """Conta as aspas duplas entre duas posições do arquivo mapeado."""
+    total = 0
+    while inicio < fim:
+        passo = min(fim, inicio + TAMANHO_JANELA)
+        total += mapa[inicio:passo].count(b'"')
+        inicio = passo
+    return total
+
+
+def _proximo_fim_de_registro(mapa: mmap.mmap, posicao: int, aspas: int) -> Tuple[Optional[int], int]:
+    """
+    Procura a próxima quebra de linha fora de aspas a partir de uma posição.
+
+    Uma quebra de linha encerra um registro quando o número de aspas lidas
+    desde o início do arquivo é par; aspas escapadas (`""`) não alteram a
+    paridade, então a contagem simples é suficiente.
+
+    Returns:
+        Tuple[Optional[int], int]: A posição logo após a quebra de linha (ou
+        None se o arquivo terminou) e o total de aspas contadas até ela.
+    """
+    while True:
+        quebra = mapa.find(b'\n', posicao)
+        if quebra == -1:
+            return None, aspas
+        aspas += _contar_aspas(mapa, posicao, quebra)
+        posicao = quebra + 1
+        if aspas % 2 == 0:
+            return posicao, aspas
+
+
+def dividir_em_intervalos(caminho_arquivo: str, partes: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Divide os registros de um CSV em intervalos de bytes de tamanho parecido.
+
+    Cada intervalo começa e termina em um limite de registro, de modo que
+    pode ser lido isoladamente. O cabeçalho não faz parte de nenhum intervalo.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV.
+        partes (int): Número desejado de intervalos.
+
+    Returns:
+        Tuple[int, List[Tuple[int, int]]]: A posição onde terminam os dados do
+        cabeçalho e a lista de intervalos `(inicio, fim)`, em ordem. Podem ser
+        retornados menos intervalos que o pedido em arquivos pequenos.
+    """
+    tamanho = os.path.getsize(caminho_arquivo)
+    if tamanho == 0:
+        return 0, []
+
+    with open(caminho_arquivo, 'rb') as arquivo, \
+            mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        inicio_dados, aspas = _proximo_fim_de_registro(mapa, 0, 0)
+        if inicio_dados is None or inicio_dados >= tamanho:
+            return tamanho, []
+
+        limites = [inicio_dados]
+        posicao = inicio_dados
+        for parte in range(1, max(partes, 1)):
+            alvo = inicio_dados + parte * (tamanho - inicio_dados) // partes
+            if alvo <= posicao:
+                continue
+            aspas += _contar_aspas(mapa, posicao, alvo)
+            limite, aspas = _proximo_fim_de_registro(mapa, alvo, aspas)
+            if limite is None or limite >= tamanho:
+                break
+            limites.append(limite)
+            posicao = limite
+
+    limites.append(tamanho)
+    return inicio_dados, list(zip(limites, limites[1:]))
+
+
+def ler_cabecalho(caminho_arquivo: str) -> List[str]:
+    """
+    Lê os nomes dos campos de um arquivo CSV.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV.
+
+    Returns:
+        List[str]: Nomes dos campos do cabeçalho.
+    """
+    with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
+        return csv.DictReader(arquivo).fieldnames or []
+
+
+def ler_linhas_intervalo(caminho_arquivo: str, inicio: int, fim: int,
+                         campos: List[str]) -> Iterator[Dict[str, str]]:
+    """
+    Lê as linhas de um intervalo de bytes de um CSV como dicionários.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV.
+        inicio (int): Posição inicial do intervalo (início de um registro).
+        fim (int): Posição final do intervalo (fim de um registro).
+        campos (List[str]): Nomes dos campos, lidos do cabeçalho.
+
+    Yields:
+        Dict[str, str]: Uma linha do CSV, como produzida por `csv.DictReader`.
+    """
+    with open(caminho_arquivo, 'rb') as arquivo:
+        arquivo.seek(inicio)
+        conteudo = arquivo.read(fim - inicio)
+    texto = io.TextIOWrapper(io.BytesIO(conteudo), encoding='utf-8')
+    yield from csv.DictReader(texto, fieldnames=campos)
+
+
+def fim_ultimo_registro(caminho_arquivo: str, inicio: int, fim: int) -> int:
+    """
+    Encontra o fim do último registro completo dentro de um intervalo de bytes.
+
+    Usado na leitura incremental: bytes de um registro que ainda está sendo
+    escrito no final do arquivo ficam para a próxima leitura.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV.
+        inicio (int): Posição inicial do intervalo (início de um registro).
+        fim (int): Posição final do intervalo.
+
+    Returns:
+        int: A posição logo após o último registro completo, ou `inicio` se o
+        intervalo não contém nenhum registro completo.
+    """
+    if fim <= inicio:
+        return inicio
+
+    with open(caminho_arquivo, 'rb') as arquivo, \
+            mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        quebra = mapa.rfind(b'\n', inicio, fim)
+        while quebra != -1:
+            if _contar_aspas(mapa, inicio, quebra) % 2 == 0:
+                return quebra + 1
+            quebra = mapa.rfind(b'\n', inicio, quebra)
+    return inicio
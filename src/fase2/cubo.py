@@ -0,0 +1,354 @@
+"""
+Cubo de agregados dos dados processados da fase 2.
+
+As perguntas da Fun Corp são, em sua maioria, agrupamentos sobre as mesmas
+dimensões: ano de lançamento, plataformas suportadas, gênero, categoria e
+faixa de preço. Em vez de percorrer o DataFrame inteiro a cada pergunta, o
+cubo é calculado uma vez depois de `preprocess_data` e guarda, para cada
+combinação de dimensões, medidas aditivas: número de jogos, somas de
+avaliações positivas e negativas, soma de preços e as somas usadas para a
+média e o desvio padrão da proporção de avaliações positivas.
+
+O cubo é formado por alguns cubóides densos (arrays do numpy com um eixo
+por dimensão e um eixo de medidas). Gêneros e categorias são multivalorados
+e ficam em cubóides próprios, em que um jogo conta uma vez para cada um dos
+seus gêneros ou categorias. Uma consulta usa o menor cubóide que contém as
+dimensões pedidas, seleciona os valores filtrados e soma os demais eixos,
+sem tocar nos dados originais.
+
+Exemplo:
+    cube = build_cube(df)
+    cube.share('supports_linux', by=['release_year'], where={'release_year': range(2018, 2023)})
+    cube.query('games', by=['release_year', 'genre'],
+               where={'genre': ['Indie', 'Strategy'], 'category': 'Single-player'})
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.fase2.preprocessamento import explode_multivalue
+
+# Faixas de preço (as mesmas da análise de avaliações por faixa de preço)
+PRICE_BINS = [-0.001, 0.01, 5, 10, 20, 30, 60, 100, 1000]
+PRICE_LABELS = ['Gratuito', 'Até $5', '$5-10', '$10-20', '$20-30', '$30-60', '$60-100', '$100+']
+
+# Mínimo de avaliações para um jogo entrar nas medidas de proporção de positivas
+MIN_REVIEWS = 10
+
+# Dimensões com um valor por jogo e colunas do DataFrame de onde vêm
+PLATFORM_DIMENSIONS = ('supports_windows', 'supports_mac', 'supports_linux')
+BASE_DIMENSIONS = ('release_year', *PLATFORM_DIMENSIONS, 'price_range')
+
+# Dimensões multivaloradas e, para cada uma, a coluna de texto e a coluna de listas equivalentes
+MULTI_VALUED_DIMENSIONS = {'genre': ('Genres', 'genres_list'), 'category': ('Categories', 'categories_list')}
+
+# Cubóides materializados
+CUBOIDS = (
+    BASE_DIMENSIONS,
+    (*BASE_DIMENSIONS, 'genre'),
+    (*BASE_DIMENSIONS, 'category'),
+    ('release_year', 'genre', 'category'),
+)
+
+# Medidas aditivas guardadas em cada célula
+MEASURES = ('games', 'positive', 'negative', 'price_sum', 'rated_games', 'ratio_sum', 'ratio_sq_sum')
+
+# Medidas inteiras (as demais são somas em ponto flutuante)
+INTEGER_MEASURES = ('games', 'positive', 'negative', 'rated_games')
+
+# Medidas derivadas das aditivas
+DERIVED_MEASURES = ('avg_price', 'positive_ratio_mean', 'positive_ratio_std')
+
+
+def _year_codes(years):
+    """Códigos dos anos de lançamento, com os anos ausentes no último valor (None)."""
+    codes, uniques = pd.factorize(years, sort=True)
+    labels = [int(year) for year in uniques]
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(labels), codes)
+        labels.append(None)
+    return codes, labels
+
+def _price_codes(prices):
+    """Códigos das faixas de preço; preços ausentes contam como gratuitos e os fora das faixas ficam em None."""
+    codes = pd.cut(prices, bins=PRICE_BINS, labels=PRICE_LABELS).cat.codes.to_numpy().astype(np.intp)
+    codes[prices.isna().to_numpy()] = 0
+    labels = list(PRICE_LABELS)
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(labels), codes)
+        labels.append(None)
+    return codes, labels
+
+def _multi_valued_codes(df, dimension):
+    """Posições das linhas e códigos dos itens de uma dimensão multivalorada, com os rótulos em ordem alfabética."""
+    text_column, list_column = MULTI_VALUED_DIMENSIONS[dimension]
+    if text_column in df.columns:
+        long = explode_multivalue(df[text_column].reset_index(drop=True))
+        positions, values = long.index.to_numpy(), long['value']
+    elif list_column in df.columns:
+        lists = df[list_column].reset_index(drop=True)
+        values = lists.explode().dropna()
+        positions, values = values.index.to_numpy(), values.astype('category')
+    else:
+        raise KeyError(f"O cubo precisa da coluna '{text_column}' ou '{list_column}'")
+    categories = values.cat.categories
+    order = np.argsort(np.asarray(categories, dtype=object))
+    mapping = np.empty(len(order), dtype=np.intp)
+    mapping[order] = np.arange(len(order))
+    return positions, mapping[values.cat.codes.to_numpy()], [str(categories[i]) for i in order]
+
+def _measures(df, min_reviews):
+    """Medidas aditivas de cada jogo, uma coluna por medida de `MEASURES`."""
+    positive = df['positive'].fillna(0).to_numpy(dtype=np.float64)
+    negative = df['negative'].fillna(0).to_numpy(dtype=np.float64)
+    reviews = positive + negative
+    rated = reviews >= min_reviews
+    ratio = np.divide(positive, reviews, out=np.zeros_like(positive), where=rated)
+    return np.column_stack([
+        np.ones(len(df)), positive, negative, df['price'].fillna(0).to_numpy(dtype=np.float64),
+        rated.astype(np.float64), ratio, ratio * ratio,
+    ])
+
+def _aggregate(codes, shape, measures):
+    """Soma as medidas de cada linha na célula indicada pelos códigos, em um array denso."""
+    cells = int(np.prod(shape))
+    flat = np.ravel_multi_index(codes, shape)
+    result = np.empty((cells, measures.shape[1]))
+    for position in range(measures.shape[1]):
+        result[:, position] = np.bincount(flat, weights=measures[:, position], minlength=cells)
+    return result.reshape(*shape, measures.shape[1])
+
+def build_cube(df, min_reviews=MIN_REVIEWS):
+    """
+    Calcula o cubo de agregados de um DataFrame pré-processado.
+
+    Args:
+        df: Resultado de `preprocess_data`, com 'release_year', as colunas
+            'supports_*', 'price', 'positive', 'negative' e os gêneros e
+            categorias (em texto ou em listas).
+        min_reviews: Mínimo de avaliações (positivas + negativas) para um
+            jogo entrar nas medidas de proporção de avaliações positivas.
+
+    Returns:
+        AggregateCube com os cubóides de `CUBOIDS`.
+    """
+    codes, labels = {}, {}
+    codes['release_year'], labels['release_year'] = _year_codes(df['release_year'])
+    for dimension in PLATFORM_DIMENSIONS:
+        codes[dimension], labels[dimension] = df[dimension].to_numpy(dtype=bool).astype(np.intp), [False, True]
+    codes['price_range'], labels['price_range'] = _price_codes(df['price'])
+    measures = _measures(df, min_reviews)
+
+    items = {dimension: _multi_valued_codes(df, dimension) for dimension in MULTI_VALUED_DIMENSIONS}
+    for dimension, (_, item_codes, item_labels) in items.items():
+        labels[dimension] = item_labels
+
+    cuboids = {}
+    for dimensions in CUBOIDS:
+        multi = [dimension for dimension in dimensions if dimension in MULTI_VALUED_DIMENSIONS]
+        if not multi:
+            rows = np.arange(len(df))
+            cuboid_codes = {}
+        elif len(multi) == 1:
+            rows, item_codes, _ = items[multi[0]]
+            cuboid_codes = {multi[0]: item_codes}
+        else:
+            # Um par (gênero, categoria) para cada combinação dos itens de um mesmo jogo
+            frames = [pd.DataFrame({'row': items[dimension][0], dimension: items[dimension][1]}) for dimension in multi]
+            pairs = frames[0].merge(frames[1], on='row')
+            rows = pairs['row'].to_numpy()
+            cuboid_codes = {dimension: pairs[dimension].to_numpy() for dimension in multi}
+        axes = [cuboid_codes[dimension] if dimension in cuboid_codes else codes[dimension][rows]
+                for dimension in dimensions]
+        shape = tuple(len(labels[dimension]) for dimension in dimensions)
+        cuboids[dimensions] = _aggregate(axes, shape, measures[rows])
+    return AggregateCube(labels, cuboids, min_reviews)
+
+class AggregateCube:
+    """
+    Cubo de agregados por ano, plataformas, faixa de preço, gênero e categoria.
+
+    Use `build_cube` para calculá-lo e `AggregateCube.load` para lê-lo de um
+    arquivo gravado por `save`.
+    """
+
+    def __init__(self, labels, cuboids, min_reviews=MIN_REVIEWS):
+        """
+        Args:
+            labels: Valores de cada dimensão, na ordem dos eixos.
+            cuboids: Array de cada cubóide, indexado pela tupla das suas
+                dimensões; o último eixo é o das medidas de `MEASURES`.
+            min_reviews: Mínimo de avaliações usado nas medidas de proporção.
+        """
+        self.labels = labels
+        self.cuboids = cuboids
+        self.min_reviews = min_reviews
+        self._positions = {dimension: {label: position for position, label in enumerate(values)}
+                           for dimension, values in labels.items()}
+
+    @property
+    def dimensions(self):
+        """Nomes das dimensões do cubo."""
+        return list(self.labels)
+
+    def _cuboid_for(self, dimensions):
+        """
+        Menor cubóide que contém todas as dimensões pedidas.
+
+        Cubóides com uma dimensão multivalorada fora do pedido são evitados:
+        somar esse eixo contaria um jogo uma vez para cada gênero ou categoria.
+        """
+        dimensions = set(dimensions)
+        candidates = [cuboid for cuboid in self.cuboids if dimensions <= set(cuboid)
+                      and not (set(cuboid) - dimensions) & set(MULTI_VALUED_DIMENSIONS)]
+        if not candidates:
+            raise ValueError(f"Nenhum cubóide contém as dimensões {sorted(dimensions)}")
+        return min(candidates, key=lambda cuboid: self.cuboids[cuboid].size)
+
+    def _select(self, dimension, values):
+        """Posições, no eixo de uma dimensão, dos valores filtrados (valores inexistentes são ignorados)."""
+        if isinstance(values, (str, bool, int, float, np.generic)) or values is None:
+            values = [values]
+        positions = self._positions[dimension]
+        return [positions[value] for value in values if value in positions]
+
+    def _rollup(self, by, where):
+        """Soma as medidas do cubo agrupadas pelas dimensões `by`, com os filtros de `where` aplicados."""
+        unknown = [dimension for dimension in [*by, *where] if dimension not in self.labels]
+        if unknown:
+            raise KeyError(f"Dimensões inexistentes no cubo: {unknown}")
+        selections = {dimension: self._select(dimension, values) for dimension, values in where.items()}
+        for dimension, positions in selections.items():
+            if dimension in MULTI_VALUED_DIMENSIONS and dimension not in by and len(positions) > 1:
+                # Um jogo com vários dos valores filtrados seria contado mais de uma vez
+                raise ValueError(f"Filtre '{dimension}' por um único valor ou agrupe por essa dimensão")
+
+        cuboid = self._cuboid_for([*by, *where])
+        values = self.cuboids[cuboid]
+        labels = {}
+        for axis, dimension in enumerate(cuboid):
+            if dimension in selections:
+                values = values.take(selections[dimension], axis=axis)
+            labels[dimension] = [self.labels[dimension][position] for position in
+                                 selections.get(dimension, range(len(self.labels[dimension])))]
+        kept = [axis for axis, dimension in enumerate(cuboid) if dimension in by]
+        summed = tuple(axis for axis, dimension in enumerate(cuboid) if dimension not in by)
+        values = values.sum(axis=summed) if summed else values
+        # Eixos na ordem de `by`, seguidos do eixo das medidas
+        order = [kept.index(cuboid.index(dimension)) for dimension in by]
+        values = values.transpose(*order, len(order))
+        return values, [labels[dimension] for dimension in by]
+
+    @staticmethod
+    def _measure(values, name):
+        """Calcula uma medida, aditiva ou derivada, a partir das somas do último eixo."""
+        column = {measure: values[..., position] for position, measure in enumerate(MEASURES)}
+        if name in MEASURES:
+            result = column[name]
+            return result.round().astype(np.int64) if name in INTEGER_MEASURES else result
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if name == 'avg_price':
+                return column['price_sum'] / column['games']
+            rated = column['rated_games']
+            if name == 'positive_ratio_mean':
+                return column['ratio_sum'] / rated
+            if name == 'positive_ratio_std':
+                variance = (column['ratio_sq_sum'] - column['ratio_sum'] ** 2 / rated) / (rated - 1)
+                return np.sqrt(np.maximum(variance, 0))
+        raise KeyError(f"Medida desconhecida: {name}")
+
+    @staticmethod
+    def _frame(by, labels, columns, keep):
+        """Monta o DataFrame de um resultado denso, apenas com as células selecionadas por `keep`."""
+        cells = np.nonzero(keep)
+        data = {dimension: pd.Series(np.asarray(labels[axis], dtype=object)[cells[axis]].tolist())
+                for axis, dimension in enumerate(by)}
+        data.update({name: values[cells] for name, values in columns.items()})
+        return pd.DataFrame(data)
+
+    def query(self, measures='games', by=None, where=None):
+        """
+        Agrega medidas do cubo por algumas dimensões.
+
+        Args:
+            measures: Nome ou lista de nomes de medidas, de `MEASURES` ou de
+                `DERIVED_MEASURES` ('avg_price', 'positive_ratio_mean',
+                'positive_ratio_std').
+            by: Dimensões de agrupamento (por exemplo ['release_year']).
+            where: Filtros, de dimensão para um valor ou uma lista de
+                valores (por exemplo {'release_year': range(2018, 2023),
+                'supports_linux': True}). Gênero e categoria só aceitam
+                vários valores se também estiverem em `by`.
+
+        Returns:
+            Series com as medidas, se `by` for vazio; senão, DataFrame com uma
+            linha por combinação de valores de `by` com algum jogo, na ordem
+            dos valores filtrados em `where` (ou dos rótulos da dimensão).
+        """
+        names = [measures] if isinstance(measures, str) else list(measures)
+        by = list(by or [])
+        values, labels = self._rollup(by, dict(where or {}))
+        columns = {name: self._measure(values, name) for name in names}
+        if not by:
+            return pd.Series({name: value.item() for name, value in columns.items()})
+        return self._frame(by, labels, columns, self._measure(values, 'games') > 0)
+
+    def share(self, dimension, value=True, by=None, where=None):
+        """
+        Proporção de jogos com um valor de dimensão (por exemplo suporte a Linux).
+
+        Args:
+            dimension: Dimensão avaliada, como 'supports_linux' ou 'genre'.
+            value: Valor contado (True para as plataformas).
+            by: Dimensões de agrupamento.
+            where: Filtros, como em `query`.
+
+        Returns:
+            DataFrame com as colunas de `by` e 'matching' (jogos com o valor),
+            'total' e 'percentage'; sem `by`, uma Series com esses campos.
+        """
+        by = list(by or [])
+        where = dict(where or {})
+        total, labels = self._rollup(by, where)
+        matching, _ = self._rollup(by, {**where, dimension: value})
+        total, matching = self._measure(total, 'games'), self._measure(matching, 'games')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentage = matching / total * 100
+        columns = {'matching': matching, 'total': total, 'percentage': percentage}
+        if not by:
+            return pd.Series({name: values.item() for name, values in columns.items()})
+        return self._frame(by, labels, columns, total > 0)
+
+    def save(self, path):
+        """
+        Grava o cubo em um arquivo `.npz` do numpy.
+
+        Args:
+            path: Caminho do arquivo (a extensão `.npz` é acrescentada pelo
+                numpy se faltar).
+        """
+        metadata = {'labels': self.labels, 'cuboids': [list(cuboid) for cuboid in self.cuboids],
+                    'measures': list(MEASURES), 'min_reviews': self.min_reviews}
+        arrays = {f'cuboid_{position}': values for position, values in enumerate(self.cuboids.values())}
+        np.savez_compressed(path, metadata=np.array(json.dumps(metadata, ensure_ascii=False)), **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Lê um cubo gravado por `save`.
+
+        Args:
+            path: Caminho do arquivo `.npz`.
+
+        Returns:
+            AggregateCube.
+        """
+        with np.load(path, allow_pickle=False) as file:
+            metadata = json.loads(file['metadata'].item())
+            if metadata['measures'] != list(MEASURES):
+                raise ValueError(f"{path}: medidas do cubo diferentes das esperadas")
+            cuboids = {tuple(cuboid): file[f'cuboid_{position}']
+                       for position, cuboid in enumerate(metadata['cuboids'])}
+        return cls(metadata['labels'], cuboids, metadata['min_reviews'])
@@ -0,0 +1,91 @@
+"""
+Estatísticas por publicadora ou desenvolvedora de jogos.
+
+As colunas 'publisher' e 'developer' podem ter várias empresas separadas por
+';' (como em `Jogo.publicadores`, da fase 1). Cada coluna é separada uma única
+vez em uma tabela longa, com uma linha por par (jogo, empresa), e as
+estatísticas de todas as empresas são calculadas de uma só vez: para cada
+coluna de valores, as linhas são ordenadas por empresa e valor, e a contagem,
+a média e os percentis de cada empresa saem de posições desse vetor ordenado.
+O custo é o mesmo para cinco ou para milhares de empresas; a seleção das N
+maiores é feita depois, sobre a tabela de estatísticas.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.fase2.preprocessamento import _explode
+from src.fase2.ranking import top_k
+
+COMPANY_SEPARATOR = ';'
+VALUE_COLUMNS = ('positive', 'price', 'owners')
+PERCENTILES = (0.25, 0.75, 0.9)
+
+
+def _percentile_name(q):
+    """Nome da coluna de um percentil (0.9 -> 'p90')."""
+    return f"p{q * 100:g}"
+
+def _grouped_stats(codes, values, group_count, percentiles):
+    """
+    Calcula média, mediana e percentis de `values` para cada código de grupo.
+
+    Valores ausentes são ignorados; grupos sem valores recebem NaN. Os
+    percentis usam interpolação linear, como `Series.quantile`.
+    """
+    valid = ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    counts = np.bincount(codes, minlength=group_count)
+    starts = np.cumsum(counts) - counts
+    ordered = values[np.lexsort((values, codes))]
+    present = counts > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stats = {'mean': np.bincount(codes, weights=values, minlength=group_count) / counts}
+    for name, q in (('median', 0.5), *((_percentile_name(q), q) for q in percentiles)):
+        position = (counts - 1) * q
+        low = np.floor(position).astype(np.intp)
+        high = np.ceil(position).astype(np.intp)
+        result = np.full(group_count, np.nan)
+        low_values = ordered[starts[present] + low[present]]
+        high_values = ordered[starts[present] + high[present]]
+        result[present] = low_values + (high_values - low_values) * (position - low)[present]
+        stats[name] = result
+    return stats
+
+def company_stats(df, column='publisher', values=None, percentiles=PERCENTILES, top=None, sort_by='games'):
+    """
+    Calcula estatísticas de jogos por publicadora ou desenvolvedora.
+
+    Jogos com várias empresas contam para cada uma delas.
+
+    Args:
+        df: DataFrame processado por `preprocess_data`.
+        column: Coluna das empresas ('publisher' ou 'developer').
+        values: Colunas numéricas resumidas; por padrão, as de `VALUE_COLUMNS`
+            presentes em `df` (avaliações positivas, preço e proprietários).
+        percentiles: Percentis calculados além da mediana, entre 0 e 1.
+        top: Se informado, mantém só as `top` empresas com maior `sort_by`.
+        sort_by: Coluna do resultado usada para ordenar as empresas.
+
+    Returns:
+        DataFrame indexado pelo nome da empresa, com a coluna 'games' (número de
+        jogos) e, para cada coluna de valores, as colunas '<valor>_mean',
+        '<valor>_median' e '<valor>_p<percentil>'. As empresas ficam em ordem
+        decrescente de `sort_by`; empates mantêm a ordem em que as empresas
+        aparecem em `df`.
+    """
+    if values is None:
+        values = [value for value in VALUE_COLUMNS if value in df.columns]
+    positions, codes, uniques = _explode(df[column], COMPANY_SEPARATOR)
+    group_count = len(uniques)
+
+    result = {'games': np.bincount(codes, minlength=group_count)}
+    for value in values:
+        numbers = df[value].to_numpy(dtype=np.float64, na_value=np.nan)[positions]
+        stats = _grouped_stats(codes, numbers, group_count, percentiles)
+        result.update((f"{value}_{name}", stat) for name, stat in stats.items())
+    result = pd.DataFrame(result, index=uniques.rename(column))
+
+    if top is not None:
+        return top_k(result, top, by=sort_by, ascending=False)
+    return result.sort_values(sort_by, ascending=False, kind='stable')
@@ -0,0 +1,467 @@
+"""
+Formato colunar particionado para os dados processados da fase 2.
+
+O CSV processado perde os tipos das colunas: listas de gêneros e categorias,
+datas e categorias voltam como texto e precisam ser convertidas de novo a
+cada leitura. Neste formato, cada coluna é gravada em arquivos `.npy` do
+numpy, já no tipo final, dentro de um diretório por valor da coluna de
+partição (por padrão `release_year`):
+
+    steam_games_processed/
+        manifest.json
+        release_year=2018/part-00000/c0.npy, c1.offsets.npy, ...
+        release_year=null/part-00000/...
+        _dictionaries/write-00000/...
+
+O `manifest.json` descreve as colunas (nome, tipo e arquivos) e as
+partições, cada uma com as suas partes e número de linhas. Colunas numéricas,
+booleanas e de datas são gravadas como arrays; textos como um único texto
+UTF-8 e as posições em que cada valor termina; categorias e listas como
+códigos inteiros em cada parte e um dicionário de valores distintos por
+gravação, compartilhado pelas partes gravadas juntas.
+
+Na leitura, os arquivos são mapeados em memória e apenas as colunas e as
+partições pedidas são abertas: uma consulta de 2018 a 2022 lê somente as
+cinco partições desses anos. Gravações com `append=True` acrescentam uma nova
+parte às partições, sem reescrever as existentes.
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+# Identificação e versão do formato, gravadas no manifesto
+FORMAT_NAME = 'steam-colunar'
+FORMAT_VERSION = 1
+
+MANIFEST_FILE = 'manifest.json'
+
+# Coluna usada por padrão para particionar os dados processados
+PARTITION_COLUMN = 'release_year'
+
+# Nome do diretório da partição de linhas sem valor na coluna de partição
+NULL_PARTITION = 'null'
+
+# Separador dos textos de uma coluna quando nenhum deles o contém
+TEXT_SEPARATOR = '\x00'
+
+# Arquivo com os rótulos do índice de cada parte
+INDEX_FILE = 'index.npy'
+
+# Diretório dos dicionários de categorias e de itens de listas, um por gravação
+DICTIONARIES_DIRECTORY = '_dictionaries'
+
+
+def is_columnar_path(path):
+    """Indica se um caminho de dados processados usa o formato colunar (qualquer caminho que não seja `.csv`)."""
+    return not str(path).lower().endswith('.csv')
+
+def _column_kind(series):
+    """
+    Classifica uma coluna em 'array', 'category', 'text' ou 'list'.
+
+    Levanta ValueError para colunas que o formato não representa sem perdas.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        if len(dtype.categories) and not all(isinstance(value, str) for value in dtype.categories):
+            raise ValueError(f"Coluna '{series.name}': só categorias de texto são suportadas")
+        return 'category'
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufmM':
+        return 'array'
+
+    values = series.to_numpy(dtype=object)
+    missing = pd.isna(values) if len(values) else np.zeros(0, dtype=bool)
+    present = values[~missing]
+    if len(present) and isinstance(present[0], list):
+        if missing.any() or not all(isinstance(value, list) for value in values):
+            raise ValueError(f"Coluna '{series.name}': todas as linhas devem ser listas")
+        return 'list'
+    if not all(isinstance(value, str) for value in present):
+        raise ValueError(f"Coluna '{series.name}' com tipo {dtype} não é suportada pelo formato colunar")
+    return 'text'
+
+def _write_text(directory, name, values):
+    """
+    Grava uma sequência de textos como um único texto UTF-8.
+
+    As posições (em caracteres) do fim de cada texto são sempre gravadas;
+    se nenhum texto contiver `TEXT_SEPARATOR`, os textos são unidos por ele,
+    o que permite separá-los na leitura com um único `split`.
+    """
+    values = list(values)
+    ends = np.cumsum(np.fromiter(map(len, values), dtype=np.int64, count=len(values)))
+    np.save(os.path.join(directory, f'{name}.offsets.npy'), ends)
+    text = ''.join(values)
+    if TEXT_SEPARATOR in text:
+        np.save(os.path.join(directory, f'{name}.text.npy'), _encode(text))
+    else:
+        np.save(os.path.join(directory, f'{name}.joined.npy'), _encode(TEXT_SEPARATOR.join(values)))
+
+def _encode(text):
+    """Converte um texto em array de bytes UTF-8."""
+    return np.frombuffer(text.encode('utf-8', 'surrogatepass'), dtype=np.uint8)
+
+def _read_text(directory, name):
+    """Lê os textos gravados por `_write_text`, como array de objetos."""
+    ends = np.load(os.path.join(directory, f'{name}.offsets.npy'), mmap_mode='r')
+    values = np.empty(len(ends), dtype=object)
+    joined_path = os.path.join(directory, f'{name}.joined.npy')
+    if os.path.exists(joined_path):
+        if len(ends):
+            text = np.load(joined_path, mmap_mode='r').tobytes().decode('utf-8', 'surrogatepass')
+            values[:] = text.split(TEXT_SEPARATOR)
+        return values
+    text = np.load(os.path.join(directory, f'{name}.text.npy'), mmap_mode='r').tobytes()
+    text = text.decode('utf-8', 'surrogatepass')
+    ends = ends.tolist()
+    values[:] = [text[start:end] for start, end in zip([0] + ends[:-1], ends)]
+    return values
+
+def _describe_column(series, position):
+    """Monta a descrição de uma coluna gravada no manifesto."""
+    kind = _column_kind(series)
+    column = {'name': series.name, 'kind': kind, 'file': f'c{position}', 'dtype': str(series.dtype)}
+    if kind == 'category':
+        column['ordered'] = bool(series.dtype.ordered)
+        column['categories_dtype'] = str(series.dtype.categories.dtype)
+    return column
+
+def _encode_column(column, series, dictionary_path):
+    """
+    Prepara uma coluna para ser gravada em partes.
+
+    Os dicionários de categorias e de itens das listas são gravados uma vez
+    por gravação, em `dictionary_path`, e compartilhados pelas partes.
+    Retorna os arrays a fatiar para cada parte.
+    """
+    name, kind = column['file'], column['kind']
+    if kind == 'array':
+        return {'values': series.to_numpy()}
+    if kind == 'category':
+        _write_text(dictionary_path, f'{name}.categories', series.cat.categories)
+        return {'codes': series.cat.codes.to_numpy()}
+    if kind == 'text':
+        values = series.to_numpy(dtype=object)
+        missing = pd.isna(values)
+        return {'values': np.where(missing, '', values) if missing.any() else values,
+                'missing': missing if missing.any() else None}
+    lists = series.tolist()
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    codes, uniques = pd.factorize(np.array([item for values in lists for item in values], dtype=object))
+    if not all(isinstance(value, str) for value in uniques):
+        raise ValueError(f"Coluna '{column['name']}': os itens das listas devem ser textos")
+    _write_text(dictionary_path, f'{name}.values', uniques)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    return {'codes': codes.astype(np.int32), 'starts': starts, 'lengths': lengths}
+
+def _write_part(directory, column, encoded, rows):
+    """Grava, em uma parte, as linhas `rows` de uma coluna preparada por `_encode_column`."""
+    name, kind = column['file'], column['kind']
+    if kind == 'array':
+        np.save(os.path.join(directory, f'{name}.npy'), encoded['values'][rows])
+    elif kind == 'category':
+        np.save(os.path.join(directory, f'{name}.codes.npy'), encoded['codes'][rows])
+    elif kind == 'text':
+        _write_text(directory, name, encoded['values'][rows])
+        if encoded['missing'] is not None and encoded['missing'][rows].any():
+            np.save(os.path.join(directory, f'{name}.missing.npy'), encoded['missing'][rows])
+    else:
+        lengths = encoded['lengths'][rows]
+        ends = np.cumsum(lengths)
+        # Posição, na lista achatada da gravação, de cada item das linhas da parte
+        items = np.repeat(encoded['starts'][rows] - (ends - lengths), lengths) + np.arange(ends[-1] if len(ends) else 0)
+        np.save(os.path.join(directory, f'{name}.offsets.npy'), ends)
+        np.save(os.path.join(directory, f'{name}.codes.npy'), encoded['codes'][items])
+
+def _read_part(directory, column, dictionary):
+    """
+    Lê uma coluna de uma parte.
+
+    Retorna o array da coluna ('array' e 'text'), ou o par (códigos,
+    categorias) para categorias, ou (posições do fim de cada lista, itens)
+    para listas; `_assemble_column` junta as partes.
+    """
+    name, kind = column['file'], column['kind']
+    if kind == 'array':
+        return np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+    if kind == 'category':
+        return np.load(os.path.join(directory, f'{name}.codes.npy'), mmap_mode='r'), dictionary
+    if kind == 'text':
+        values = _read_text(directory, name)
+        missing_path = os.path.join(directory, f'{name}.missing.npy')
+        if os.path.exists(missing_path):
+            values[np.load(missing_path)] = None
+        return values
+    ends = np.load(os.path.join(directory, f'{name}.offsets.npy'), mmap_mode='r')
+    codes = np.load(os.path.join(directory, f'{name}.codes.npy'), mmap_mode='r')
+    return ends, dictionary[codes]
+
+def _read_dictionary(directory, column):
+    """Lê o dicionário de categorias ou de itens de uma coluna, se ela tiver um."""
+    suffix = {'category': 'categories', 'list': 'values'}.get(column['kind'])
+    return _read_text(directory, f"{column['file']}.{suffix}") if suffix else None
+
+def _assemble_column(column, pieces, index):
+    """Junta as partes lidas de uma coluna em uma Series, no tipo original."""
+    kind = column['kind']
+    if kind == 'array':
+        # Com uma única parte, a Series usa o próprio array mapeado, sem cópia
+        if not pieces:
+            values = np.empty(0, dtype=column['dtype'])
+        else:
+            values = pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+        return pd.Series(values, index=index, name=column['name'], copy=False)
+    if kind == 'category':
+        dictionaries = list({id(categories): categories for _, categories in pieces}.values())
+        categories = pd.Index(np.concatenate(dictionaries) if dictionaries else [], dtype=object).unique()
+        if len(dictionaries) > 1 and all(pd.Index(part, dtype=object).is_monotonic_increasing for part in dictionaries):
+            # Gravações em blocos de categorias ordenadas (como as do `read_csv`) continuam ordenadas
+            categories = categories.sort_values()
+        codes = []
+        for part_codes, part_categories in pieces:
+            part_codes = np.asarray(part_codes, dtype=np.int64)
+            if len(dictionaries) > 1:
+                mapping = np.append(categories.get_indexer(pd.Index(part_categories, dtype=object)), -1)
+                part_codes = mapping[part_codes]
+            codes.append(part_codes)
+        categories = categories.astype(column['categories_dtype'])
+        dtype = pd.CategoricalDtype(categories, ordered=column['ordered'])
+        values = pd.Categorical.from_codes(np.concatenate(codes) if codes else [], dtype=dtype)
+        return pd.Series(values, index=index, name=column['name'])
+    if kind == 'text':
+        values = np.concatenate(pieces) if pieces else np.empty(0, dtype=object)
+        series = pd.Series(values, index=index, name=column['name'], dtype=object)
+        return series if column['dtype'] == 'object' else series.astype(column['dtype'])
+    lists = []
+    for ends, items in pieces:
+        items = items.tolist()
+        ends = ends.tolist()
+        lists.extend(items[start:end] for start, end in zip([0] + ends[:-1], ends))
+    return pd.Series(lists, index=index, name=column['name'], dtype=object)
+
+def _partition_directory(column, value):
+    """Nome do diretório de uma partição."""
+    if value is None:
+        return f'{column}={NULL_PARTITION}'
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return f'{column}={value}'
+
+def _read_manifest(path):
+    """Lê o manifesto de um diretório no formato colunar."""
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(f"{path} não contém dados no formato colunar ({MANIFEST_FILE} ausente)")
+    with open(manifest_path, 'r', encoding='utf-8') as file:
+        manifest = json.load(file)
+    if manifest.get('format') != FORMAT_NAME or manifest.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: formato colunar desconhecido")
+    return manifest
+
+def _write_manifest(path, manifest):
+    """Grava o manifesto de uma só vez, substituindo o anterior."""
+    temporary = os.path.join(path, MANIFEST_FILE + '.tmp')
+    with open(temporary, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=1, ensure_ascii=False)
+    os.replace(temporary, os.path.join(path, MANIFEST_FILE))
+
+def _group_partitions(series):
+    """Retorna, para cada valor da coluna de partição, as posições das suas linhas (em ordem)."""
+    codes, uniques = pd.factorize(series, sort=True)
+    # Linhas sem valor (código -1) vão para a última partição
+    codes = np.where(codes < 0, len(uniques), codes)
+    order = np.argsort(codes, kind='stable')
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(uniques) + 1))))
+    values = [value.item() if hasattr(value, 'item') else value for value in uniques] + [None]
+    for position, value in enumerate(values):
+        rows = order[bounds[position]:bounds[position + 1]]
+        if len(rows):
+            yield value, rows
+
+def write_columnar(df, path, partition_by=PARTITION_COLUMN, append=False):
+    """
+    Grava um DataFrame no formato colunar, particionado por uma coluna.
+
+    Args:
+        df: DataFrame a gravar. Colunas de listas devem conter listas de
+            textos em todas as linhas.
+        path: Diretório do conjunto de dados.
+        partition_by: Coluna de partição. Se None (ou ausente do `df`),
+            todas as linhas ficam em uma única partição.
+        append: Se True e `path` já contiver dados, acrescenta as linhas como
+            novas partes; as colunas devem ser as mesmas, nos mesmos tipos.
+
+    Returns:
+        Número de partições em que houve gravação.
+    """
+    if partition_by is not None and partition_by not in df.columns:
+        partition_by = None
+    columns = [_describe_column(df[name], position) for position, name in enumerate(df.columns)]
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+
+    if append and os.path.exists(manifest_path):
+        manifest = _read_manifest(path)
+        described = [{key: column[key] for key in ('name', 'kind', 'dtype')} for column in columns]
+        existing = [{key: column[key] for key in ('name', 'kind', 'dtype')} for column in manifest['columns']]
+        if described != existing or manifest['partition_by'] != partition_by:
+            raise ValueError(f"{path}: as colunas ou a partição não correspondem aos dados já gravados")
+        columns = manifest['columns']
+    else:
+        if os.path.exists(manifest_path):
+            shutil.rmtree(path)
+        elif os.path.isdir(path) and os.listdir(path):
+            raise FileExistsError(f"{path} já existe e não contém dados no formato colunar")
+        manifest = {'format': FORMAT_NAME, 'version': FORMAT_VERSION, 'partition_by': partition_by,
+                    'columns': columns, 'partitions': [], 'writes': 0}
+    os.makedirs(path, exist_ok=True)
+
+    index = df.index.to_numpy() if pd.api.types.is_integer_dtype(df.index.dtype) else None
+    if partition_by is None:
+        groups = [(None, np.arange(len(df)))] if len(df) else []
+    else:
+        groups = _group_partitions(df[partition_by])
+    partitions = {partition['directory']: partition for partition in manifest['partitions']}
+
+    dictionary = f"write-{manifest['writes']:05d}"
+    dictionary_path = os.path.join(path, DICTIONARIES_DIRECTORY, dictionary)
+    os.makedirs(dictionary_path)
+    encoded = [_encode_column(column, df[column['name']], dictionary_path) for column in columns]
+    manifest['writes'] += 1
+
+    written = 0
+    for value, rows in groups:
+        directory = _partition_directory(partition_by, value) if partition_by is not None else 'all'
+        partition = partitions.setdefault(directory, {'value': value, 'directory': directory, 'parts': []})
+        part = {'name': f"part-{len(partition['parts']):05d}", 'rows': len(rows),
+                'index': index is not None, 'dictionary': dictionary}
+        part_path = os.path.join(path, directory, part['name'])
+        os.makedirs(part_path)
+        for column, column_data in zip(columns, encoded):
+            _write_part(part_path, column, column_data, rows)
+        if index is not None:
+            np.save(os.path.join(part_path, INDEX_FILE), index[rows])
+        partition['parts'].append(part)
+        written += 1
+
+    # Partições em ordem crescente de valor, com a de valores ausentes por último
+    manifest['partitions'] = sorted(partitions.values(),
+                                    key=lambda partition: (partition['value'] is None, partition['value'] or 0))
+    _write_manifest(path, manifest)
+    return written
+
+class ProcessedDataset:
+    """
+    Dados processados no formato colunar, abertos sem carregar as colunas.
+
+    Apenas o manifesto é lido ao abrir; `read` e `iter_partitions` mapeiam
+    em memória somente os arquivos das colunas e partições pedidas.
+    """
+
+    def __init__(self, path):
+        """
+        Abre um diretório gravado por `write_columnar`.
+
+        Args:
+            path: Diretório do conjunto de dados.
+        """
+        self.path = path
+        self.manifest = _read_manifest(path)
+        self._columns = {column['name']: column for column in self.manifest['columns']}
+
+    @property
+    def columns(self):
+        """Nomes das colunas, na ordem em que foram gravadas."""
+        return list(self._columns)
+
+    @property
+    def partitions(self):
+        """Valores da coluna de partição (None para a partição de valores ausentes)."""
+        return [partition['value'] for partition in self.manifest['partitions']]
+
+    @property
+    def num_rows(self):
+        """Número total de linhas gravadas."""
+        return sum(part['rows'] for partition in self.manifest['partitions'] for part in partition['parts'])
+
+    def select_partitions(self, partitions=None):
+        """
+        Retorna as partições selecionadas, na ordem do manifesto.
+
+        Args:
+            partitions: Valores das partições desejadas (por exemplo
+                `range(2018, 2023)`) ou uma função que recebe o valor de
+                uma partição e retorna True para mantê-la. Se omitido,
+                seleciona todas.
+        """
+        selected = self.manifest['partitions']
+        if partitions is None:
+            return list(selected)
+        if callable(partitions):
+            return [partition for partition in selected if partitions(partition['value'])]
+        values = set(partitions)
+        return [partition for partition in selected if partition['value'] in values]
+
+    def _columns_for(self, columns):
+        """Descrições das colunas pedidas, validando os nomes."""
+        if columns is None:
+            return list(self._columns.values())
+        unknown = [name for name in columns if name not in self._columns]
+        if unknown:
+            raise KeyError(f"Colunas inexistentes em {self.path}: {unknown}")
+        return [self._columns[name] for name in columns]
+
+    def _read_parts(self, parts, columns):
+        """Lê e junta as partes indicadas em um único DataFrame."""
+        columns = self._columns_for(columns)
+        pieces = {column['name']: [] for column in columns}
+        dictionaries = {}
+        labels = []
+        for directory, part in parts:
+            part_path = os.path.join(self.path, directory, part['name'])
+            for column in columns:
+                key = (part['dictionary'], column['name'])
+                if key not in dictionaries:
+                    dictionaries[key] = _read_dictionary(
+                        os.path.join(self.path, DICTIONARIES_DIRECTORY, part['dictionary']), column)
+                pieces[column['name']].append(_read_part(part_path, column, dictionaries[key]))
+            if part['index']:
+                labels.append(np.load(os.path.join(part_path, INDEX_FILE)))
+            else:
+                labels.append(np.arange(part['rows']))
+        index = pd.Index(np.concatenate(labels)) if labels else pd.RangeIndex(0)
+        data = {column['name']: _assemble_column(column, pieces[column['name']], index) for column in columns}
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def read(self, columns=None, partitions=None):
+        """
+        Lê as colunas e partições pedidas em um único DataFrame.
+
+        As linhas vêm agrupadas por partição, em ordem crescente do valor de
+        partição, e mantêm os rótulos de índice do DataFrame gravado (use
+        `sort_index()` para voltar à ordem original).
+
+        Args:
+            columns: Colunas a ler. Se omitido, lê todas.
+            partitions: Partições a ler (veja `select_partitions`).
+
+        Returns:
+            DataFrame com os tipos originais das colunas.
+        """
+        parts = [(partition['directory'], part) for partition in self.select_partitions(partitions)
+                 for part in partition['parts']]
+        return self._read_parts(parts, columns)
+
+    def iter_partitions(self, columns=None, partitions=None):
+        """
+        Lê as partições pedidas uma a uma, sem carregar as demais.
+
+        Yields:
+            Pares (valor da partição, DataFrame da partição).
+        """
+        for partition in self.select_partitions(partitions):
+            parts = [(partition['directory'], part) for part in partition['parts']]
+            yield partition['value'], self._read_parts(parts, columns)
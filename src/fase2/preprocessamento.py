@@ -1,52 +1,649 @@
 import pandas as pd
 import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
+from pandas.tseries.api import guess_datetime_format
 
-def preprocess_data(df):
-    # Pré-processa o conjunto de dados de jogos da Steam.
-    processed_df = df.copy()
-    
-    # Tratamento do Metacritic score
-    processed_df['metacritic_score'] = pd.to_numeric(processed_df['Metacritic score'], errors='coerce')
-    
-    # Conversão da data de lançamento para datetime
-    processed_df['release_date'] = pd.to_datetime(processed_df['Release date'], errors='coerce')
-    processed_df['release_year'] = processed_df['release_date'].dt.year
+from src.fase2.formato_colunar import ProcessedDataset, is_columnar_path, write_columnar
+from src.instrumentacao import etapa
+
+# Separador das listas de gêneros e categorias no CSV (o mesmo usado por Jogo na fase 1)
+LIST_SEPARATOR = ','
+
+# Tipo de cada coluna do CSV bruto. Contagens ficam em int32 (ou float32, se
+# houver valores ausentes), notas em float32, plataformas em bool e textos
+# muito repetidos em category; None mantém o texto como lido pelo pandas.
+RAW_SCHEMA = {
+    'AppID': 'int32',
+    'Name': None,
+    'Release date': None,
+    'Estimated owners': 'category',
+    'Peak CCU': 'int32',
+    'Required age': 'int32',
+    'Price': 'float64',
+    'DLC count': 'int32',
+    'About the game': None,
+    'Supported languages': None,
+    'Full audio languages': None,
+    'Reviews': None,
+    'Header image': None,
+    'Website': None,
+    'Support url': None,
+    'Support email': None,
+    'Windows': 'bool',
+    'Mac': 'bool',
+    'Linux': 'bool',
+    'Metacritic score': 'float32',
+    'Metacritic url': None,
+    'User score': 'float32',
+    'Positive': 'int32',
+    'Negative': 'int32',
+    'Score rank': 'float32',
+    'Achievements': 'int32',
+    'Recommendations': 'int32',
+    'Notes': None,
+    'Average playtime forever': 'int32',
+    'Average playtime two weeks': 'int32',
+    'Median playtime forever': 'int32',
+    'Median playtime two weeks': 'int32',
+    'Developers': 'category',
+    'Publishers': 'category',
+    'Categories': None,
+    'Genres': None,
+    'Tags': None,
+    'Screenshots': None,
+    'Movies': None,
+}
+
+# Tipo das contagens de capturas de tela, vídeos e material de demonstração
+MEDIA_COUNT_DTYPE = 'int16'
+
+# Linhas por bloco em `preprocess_csv`
+CHUNKSIZE = 50_000
+
+# Colunas do CSV bruto usadas por `preprocess_data`
+PREPROCESS_COLUMNS = (
+    'Name', 'Release date', 'Estimated owners', 'Price', 'DLC count', 'Windows', 'Mac', 'Linux', 'Metacritic score',
+    'Positive', 'Negative', 'Developers', 'Publishers', 'Categories', 'Genres', 'Screenshots', 'Movies',
+)
+
+def _apply_schema(df, schema):
+    """Converte, no próprio DataFrame, cada coluna presente no esquema para o tipo declarado."""
+    for column in df.columns:
+        dtype = schema.get(column)
+        if dtype == 'category':
+            # Categorias sempre em ordem, qualquer que seja a divisão da leitura feita pelo `read_csv`
+            values = df[column].astype('category')
+            if not values.cat.categories.is_monotonic_increasing:
+                values = values.cat.reorder_categories(values.cat.categories.sort_values())
+            df[column] = values
+        elif dtype is None or df[column].dtype == dtype:
+            continue
+        elif dtype == 'bool':
+            df[column] = df[column].astype(str).str.strip().str.lower().eq('true')
+        else:
+            values = pd.to_numeric(df[column], errors='coerce')
+            if np.dtype(dtype).kind in 'iu' and values.isna().any():
+                # Inteiros com valores ausentes ficam em ponto flutuante, como no pandas
+                dtype = 'float32'
+            df[column] = values.astype(dtype)
+
+def load_raw_data(path, columns=None, schema=None, verbose=False, keep_text=False):
+    """
+    Carrega o CSV bruto lendo apenas as colunas pedidas, já em tipos compactos.
+
+    Args:
+        path: Caminho do CSV.
+        columns: Colunas a ler (por exemplo `PREPROCESS_COLUMNS`). Se omitido,
+            lê todas.
+        schema: Tipo de cada coluna. Se omitido, usa `RAW_SCHEMA`.
+        verbose: Se True, mostra a memória usada e a economia em relação aos
+            tipos padrão do pandas (veja `memory_report`).
+        keep_text: Se True, só campos vazios são valores ausentes; textos como
+            'NA', 'N/A' ou 'None' são mantidos, como na leitura da fase 1.
+
+    Returns:
+        DataFrame com as colunas lidas.
+    """
+    schema = RAW_SCHEMA if schema is None else schema
+    usecols = list(columns) if columns is not None else None
+    # Textos categóricos são convertidos durante a leitura, sem cópia em objetos
+    read_dtypes = {column: dtype for column, dtype in schema.items()
+                   if dtype == 'category' and (usecols is None or column in usecols)}
+    with etapa('load_raw_data') as medicao:
+        if keep_text:
+            df = pd.read_csv(path, usecols=usecols, dtype=read_dtypes, keep_default_na=False, na_values=[''])
+        else:
+            df = pd.read_csv(path, usecols=usecols, dtype=read_dtypes)
+        _apply_schema(df, schema)
+        medicao.linhas = len(df)
+
+    if verbose:
+        report = memory_report(df)
+        print(f"{len(df)} linhas e {len(df.columns)} colunas carregadas de {path}: "
+              f"{report['memory_mb']:.1f} MB (tipos padrão: {report['default_memory_mb']:.1f} MB, "
+              f"economia de {report['saved_mb']:.1f} MB)")
+    return df
+
+def memory_report(df):
+    """
+    Compara a memória de um DataFrame com a que ele ocuparia nos tipos padrão do pandas.
+
+    Os tipos padrão são os que `pd.read_csv` infere sem esquema: int64 e
+    float64 para números e texto para colunas categóricas.
+
+    Returns:
+        Dicionário com 'memory_mb', 'default_memory_mb', 'saved_mb' e, em
+        'columns', o tipo e a memória (atual e padrão, em bytes) de cada coluna.
+    """
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        memory = int(series.memory_usage(deep=True, index=False))
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            default = int(series.astype(str).memory_usage(deep=True, index=False))
+        elif series.dtype.kind in 'iuf':
+            default = len(series) * 8
+        else:
+            default = memory
+        columns[column] = {'dtype': str(series.dtype), 'memory': memory, 'default_memory': default}
+
+    megabyte = 1024 * 1024
+    memory = sum(info['memory'] for info in columns.values())
+    default = sum(info['default_memory'] for info in columns.values())
+    return {
+        'memory_mb': round(memory / megabyte, 2),
+        'default_memory_mb': round(default / megabyte, 2),
+        'saved_mb': round((default - memory) / megabyte, 2),
+        'columns': columns,
+    }
+
+def _has_padding(joined, sep):
+    """Verifica se algum item das listas unidas pode ter espaços nas bordas."""
+    if joined[:1].isspace() or joined[-1:].isspace():
+        return True
+    if '\t' in joined or '\n' in joined or '\r' in joined:
+        return True
+    return f" {sep}" in joined or f"{sep} " in joined
+
+def _split_items(series, sep=LIST_SEPARATOR):
+    """
+    Separa os itens de uma coluna multivalorada, sem espaços nas bordas.
+
+    Retorna a posição da linha de cada item não vazio e o texto do item. As
+    listas de todas as linhas são unidas em um único texto e separadas de
+    uma só vez, em vez de uma chamada de `split` por linha. Em colunas
+    categóricas, só as categorias distintas são separadas.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = pd.Series(series.cat.categories.astype(str))
+        category_positions, category_items = _split_items(categories, sep)
+        counts = np.bincount(category_positions, minlength=len(categories))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        # O código -1 (valor ausente) lê o zero acrescentado ao final
+        codes = series.cat.codes.to_numpy()
+        lengths = np.append(counts, 0)[codes]
+        positions = np.repeat(np.arange(len(series)), lengths)
+        offsets = np.arange(len(positions)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return positions, category_items[starts[codes[positions]] + offsets]
+    text = series.fillna('').astype(str).to_numpy(dtype=object)
+    filled = text != ''
+    separators = np.fromiter(map(str.count, text, repeat(sep)), dtype=np.intp, count=len(text))
+    lengths = np.where(filled, separators + 1, 0)
+    if not lengths.any():
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=object)
+    joined = sep.join(text[filled])
+    items = joined.split(sep)
+    if _has_padding(joined, sep):
+        items = [item.strip() for item in items]
+    items = np.array(items, dtype=object)
+    positions = np.repeat(np.arange(len(text)), lengths)
+    keep = items != ''
+    return positions[keep], items[keep]
+
+def _explode(series, sep=LIST_SEPARATOR):
+    """
+    Separa e codifica os itens de uma coluna multivalorada.
+
+    Retorna a posição da linha de cada item, o código de cada item e os
+    valores distintos, na ordem em que aparecem pela primeira vez.
+    """
+    positions, items = _split_items(series, sep)
+    codes, uniques = pd.factorize(items)
+    return positions, codes, pd.Index(uniques, dtype=object)
+
+def split_lists(series, sep=LIST_SEPARATOR):
+    """
+    Converte uma coluna multivalorada em uma coluna de listas Python.
+
+    Returns:
+        Series com a lista de itens de cada linha ([] para linhas vazias).
+    """
+    positions, items = _split_items(series, sep)
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(positions, minlength=len(series))))).tolist()
+    items = items.tolist()
+    lists = [items[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    return pd.Series(lists, index=series.index, dtype=object)
+
+def explode_multivalue(series, sep=LIST_SEPARATOR):
+    """
+    Converte uma coluna multivalorada ('Action,Indie') em uma tabela longa.
+
+    Args:
+        series: Coluna com listas de itens em texto, como 'Genres' ou 'Categories'.
+        sep: Separador dos itens.
+
+    Returns:
+        DataFrame com uma linha por item e a coluna 'value' categórica; o índice
+        repete o rótulo da linha original de cada item.
+    """
+    positions, codes, uniques = _explode(series, sep)
+    values = pd.Categorical.from_codes(codes, categories=uniques)
+    return pd.DataFrame({'value': values}, index=series.index.take(positions))
+
+def multi_hot(series, sep=LIST_SEPARATOR, sparse=True):
+    """
+    Converte uma coluna multivalorada em uma matriz multi-hot.
+
+    Args:
+        series: Coluna com listas de itens em texto, como 'Genres' ou 'Categories'.
+        sep: Separador dos itens.
+        sparse: Se True, as colunas são esparsas (apenas os valores True são guardados).
+
+    Returns:
+        DataFrame booleano com o mesmo índice da coluna e uma coluna por item
+        distinto, na ordem em que os itens aparecem pela primeira vez.
+    """
+    positions, codes, uniques = _explode(series, sep)
+    if not sparse:
+        matrix = np.zeros((len(series), len(uniques)), dtype=bool)
+        matrix[positions, codes] = True
+        return pd.DataFrame(matrix, index=series.index, columns=uniques)
+
+    # Cada coluna esparsa é montada a partir das linhas do seu item, com uma
+    # única coluna densa reaproveitada, sem criar a matriz densa inteira
+    order = np.argsort(codes, kind='stable')
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(uniques)))))
+    dense = np.zeros(len(series), dtype=bool)
+    columns = {}
+    for code in range(len(uniques)):
+        rows = positions[order[bounds[code]:bounds[code + 1]]]
+        dense[rows] = True
+        columns[code] = pd.arrays.SparseArray(dense, fill_value=False)
+        dense[rows] = False
+    result = pd.DataFrame(columns, index=series.index)
+    result.columns = uniques
+    return result
+
+def count_values(series, sep=LIST_SEPARATOR):
+    """
+    Conta em quantas linhas cada item de uma coluna multivalorada aparece.
+
+    Returns:
+        Series com a contagem de cada item, em ordem decrescente; itens empatados
+        ficam na ordem em que apareceram pela primeira vez.
+    """
+    _, codes, uniques = _explode(series, sep)
+    counts = pd.Series(np.bincount(codes, minlength=len(uniques)), index=uniques)
+    return counts.sort_values(ascending=False, kind='stable')
+
+def count_items(series, sep=LIST_SEPARATOR, dtype=MEDIA_COUNT_DTYPE):
+    """
+    Conta os itens de cada linha de uma coluna multivalorada, como as listas de URLs de 'Screenshots'.
+
+    Cada linha preenchida tem um item a mais que separadores; linhas vazias
+    ou ausentes têm zero itens. Os separadores são contados com `str.count`
+    em todas as linhas de uma vez (em colunas categóricas, só nas categorias).
+
+    Returns:
+        Series de inteiros do tipo `dtype`, com o mesmo índice da coluna.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = count_items(pd.Series(series.cat.categories.astype(str)), sep, dtype).to_numpy()
+        # O código -1 (valor ausente) lê o zero acrescentado ao final
+        codes = series.cat.codes.to_numpy()
+        return pd.Series(np.append(counts, 0)[codes].astype(dtype), index=series.index)
+    text = series.to_numpy(dtype=object, na_value='')
+    if not pd.api.types.is_string_dtype(series.dtype):
+        # Colunas lidas só com valores ausentes (ou números) vêm como float
+        text = np.array(list(map(str, text)), dtype=object)
+    separators = np.fromiter(map(str.count, text, repeat(sep)), dtype=np.int64, count=len(text))
+    counts = np.where(text != '', separators + 1, 0)
+    return pd.Series(counts.astype(dtype), index=series.index)
+
+def contains_value(series, value, sep=LIST_SEPARATOR, case=True):
+    """
+    Indica as linhas cuja lista contém um item.
+
+    Ao contrário de `str.contains`, compara itens inteiros: 'RPG' não
+    corresponde a 'Action RPG'.
+
+    Args:
+        series: Coluna com listas de itens em texto.
+        value: Item procurado.
+        sep: Separador dos itens.
+        case: Se False, ignora maiúsculas e minúsculas.
+
+    Returns:
+        Series booleana com o mesmo índice da coluna.
+    """
+    positions, codes, uniques = _explode(series, sep)
+    if case:
+        matches = np.flatnonzero(uniques == value)
+    else:
+        matches = np.flatnonzero(uniques.str.casefold() == value.casefold())
+    mask = np.zeros(len(series), dtype=bool)
+    mask[positions[np.isin(codes, matches)]] = True
+    return pd.Series(mask, index=series.index)
+
+def contains_pattern(series, pattern, case=True):
+    """
+    Indica as linhas cujo texto contém uma expressão regular.
+
+    Equivale a `series.str.contains(pattern, case=case, na=False)`, mas cada
+    texto distinto é examinado uma única vez; valores ausentes dão False.
+
+    Args:
+        series: Coluna de textos.
+        pattern: Expressão regular procurada.
+        case: Se False, ignora maiúsculas e minúsculas.
+
+    Returns:
+        Series booleana com o mesmo índice da coluna.
+    """
+    values = series.astype('category')
+    categories = pd.Series(values.cat.categories.astype(str))
+    found = np.append(categories.str.contains(pattern, case=case).to_numpy(dtype=bool), False)
+    return pd.Series(found[values.cat.codes.to_numpy()], index=series.index)
+
+def owners_midpoint(series):
+    """
+    Converte as faixas de proprietários estimados ('20000 - 50000') no ponto médio de cada faixa.
+
+    Cada faixa distinta é convertida uma única vez; valores que não são faixas
+    viram NaN.
+    """
+    values = series.astype('category')
+    categories = pd.Series(values.cat.categories.astype(str))
+    bounds = categories.str.extract(r'^\s*(\d+)\s*-\s*(\d+)\s*$').astype(float)
+    midpoints = np.append(((bounds[0] + bounds[1]) / 2).to_numpy(), np.nan)
+    return pd.Series(midpoints[values.cat.codes.to_numpy()], index=series.index)
+
+def _first_date(dates):
+    """Retorna o primeiro texto de data preenchido, do qual o formato das datas é deduzido."""
+    for value in dates:
+        if isinstance(value, str) and value.strip():
+            return value
+    return None
+
+def _date_format(first_date):
+    """Formato das datas deduzido de um exemplo (None se não houver exemplo ou formato reconhecido)."""
+    return guess_datetime_format(first_date) if first_date is not None else None
+
+def preprocess_data(df, copy=True, list_columns=True):
+    """
+    Pré-processa o conjunto de dados de jogos da Steam.
+
+    Colunas derivadas cujas colunas de origem não foram carregadas (veja
+    `load_raw_data`) são omitidas.
+
+    Args:
+        df: DataFrame com as colunas do CSV original, ou parte delas.
+        copy: Se False, as colunas novas são acrescentadas ao próprio `df`,
+            sem copiar o DataFrame inteiro.
+        list_columns: Se True, cria 'categories_list' e 'genres_list' com listas
+            Python. Para contagens e filtros, prefira `count_values`,
+            `contains_value`, `multi_hot` e `explode_multivalue`, que evitam
+            um objeto lista por linha.
+
+    Returns:
+        DataFrame pré-processado (o próprio `df` quando `copy=False`).
+    """
+    with etapa('preprocess_data', len(df)):
+        date_format = _date_format(_first_date(df['Release date'])) if 'Release date' in df.columns else None
+        return _preprocess_data(df, copy, list_columns, date_format)
+
+def _preprocess_data(df, copy, list_columns, date_format=None):
+    """
+    Aplica as transformações de `preprocess_data`.
+
+    O formato das datas é recebido já deduzido, para que todos os blocos de
+    `preprocess_csv` usem o mesmo formato que a leitura completa usaria. Os
+    tipos das colunas derivadas não dependem dos valores do bloco.
+    """
+    linhas = len(df)
+    with etapa('preprocess_data.copia', linhas):
+        processed_df = df.copy() if copy else df
+    present = set(processed_df.columns)
     
-    # Tratamento de campos numéricos
-    processed_df['positive'] = pd.to_numeric(processed_df['Positive'], errors='coerce')
-    processed_df['negative'] = pd.to_numeric(processed_df['Negative'], errors='coerce')
-    processed_df['price'] = pd.to_numeric(processed_df['Price'], errors='coerce')
-    processed_df['dlc_count'] = pd.to_numeric(processed_df['DLC count'], errors='coerce')
+    with etapa('preprocess_data.datas', linhas):
+        # Tratamento do Metacritic score
+        if 'Metacritic score' in present:
+            processed_df['metacritic_score'] = pd.to_numeric(processed_df['Metacritic score'], errors='coerce')
+        
+        # Conversão da data de lançamento para datetime
+        if 'Release date' in present:
+            processed_df['release_date'] = pd.to_datetime(processed_df['Release date'], errors='coerce',
+                                                          format=date_format).astype('datetime64[ns]')
+            processed_df['release_year'] = processed_df['release_date'].dt.year.astype('float64')
     
-    # Usar as colunas de plataforma que já existem
-    processed_df['supports_windows'] = processed_df['Windows'].astype(bool)
-    processed_df['supports_mac'] = processed_df['Mac'].astype(bool)
-    processed_df['supports_linux'] = processed_df['Linux'].astype(bool)
+    with etapa('preprocess_data.numericos', linhas):
+        # Tratamento de campos numéricos (tipos compactos de `load_raw_data` são mantidos)
+        for column, source in (('positive', 'Positive'), ('negative', 'Negative'),
+                               ('price', 'Price'), ('dlc_count', 'DLC count')):
+            if source in present:
+                processed_df[column] = pd.to_numeric(processed_df[source], errors='coerce')
+        if 'Estimated owners' in present:
+            processed_df['owners'] = owners_midpoint(processed_df['Estimated owners'])
+        
+        # Usar as colunas de plataforma que já existem
+        for column, source in (('supports_windows', 'Windows'), ('supports_mac', 'Mac'),
+                               ('supports_linux', 'Linux')):
+            if source in present:
+                processed_df[column] = processed_df[source].astype(bool)
     
-    # Processamento de categorias e gêneros
-    processed_df['categories_list'] = processed_df['Categories'].str.split(';').fillna('').apply(lambda x: [item.strip() for item in x if item])
-    processed_df['genres_list'] = processed_df['Genres'].str.split(';').fillna('').apply(lambda x: [item.strip() for item in x if item])
+    if list_columns:
+        with etapa('preprocess_data.listas', linhas):
+            # Processamento de categorias e gêneros, separados por vírgula como no CSV
+            if 'Categories' in present:
+                processed_df['categories_list'] = split_lists(processed_df['Categories'])
+            if 'Genres' in present:
+                processed_df['genres_list'] = split_lists(processed_df['Genres'])
     
-    # Cálculo do material de demonstração (screenshots + movies)
-    processed_df['screenshots'] = pd.to_numeric(processed_df['Screenshots'], errors='coerce').fillna(0)
-    processed_df['movies'] = pd.to_numeric(processed_df['Movies'], errors='coerce').fillna(0)
-    processed_df['demo_material'] = processed_df['screenshots'] + processed_df['movies']
+    with etapa('preprocess_data.material_demonstracao', linhas):
+        # Cálculo do material de demonstração (screenshots + movies), contando as URLs de cada lista
+        if 'Screenshots' in present:
+            processed_df['screenshots'] = count_items(processed_df['Screenshots'])
+        if 'Movies' in present:
+            processed_df['movies'] = count_items(processed_df['Movies'])
+        if {'Screenshots', 'Movies'} <= present:
+            processed_df['demo_material'] = processed_df['screenshots'] + processed_df['movies']
     
     # Indicador de jogo pago
-    processed_df['is_paid'] = processed_df['price'] > 0
+    if 'Price' in present:
+        processed_df['is_paid'] = processed_df['price'] > 0
     
     # Manter colunas originais importantes
-    processed_df['name'] = processed_df['Name']
-    processed_df['publisher'] = processed_df['Publishers']
-    processed_df['developer'] = processed_df['Developers']
+    for column, source in (('name', 'Name'), ('publisher', 'Publishers'), ('developer', 'Developers')):
+        if source in present:
+            processed_df[column] = processed_df[source]
     
     return processed_df
 
-def save_processed_data(df, output_path='../../data/processed/steam_games_processed.csv'):
-    """Salva os dados processados em CSV"""
+def save_processed_data(df, output_path='../../data/processed/steam_games_processed', append=False):
+    """
+    Salva os dados processados.
+
+    O formato é escolhido pelo caminho: se terminar em `.csv`, grava um CSV;
+    caso contrário, grava um diretório no formato colunar particionado por
+    'release_year' (veja `src.fase2.formato_colunar`), que mantém os tipos
+    das colunas, inclusive listas, datas e categorias.
+
+    Args:
+        df: DataFrame pré-processado.
+        output_path: Arquivo CSV ou diretório do formato colunar.
+        append: Se True, acrescenta as linhas aos dados já gravados em
+            `output_path` em vez de substituí-los.
+    """
     import os
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    df.to_csv(output_path, index=False)
-    print(f"Dados processados salvos em {output_path}")
\ No newline at end of file
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+
+    with etapa('save_processed_data', len(df)):
+        if is_columnar_path(output_path):
+            write_columnar(df, output_path, append=append)
+        elif append and os.path.exists(output_path):
+            df.to_csv(output_path, mode='a', header=False, index=False)
+        else:
+            df.to_csv(output_path, index=False)
+    print(f"Dados processados salvos em {output_path}")
+
+def load_processed_data(path='../../data/processed/steam_games_processed', columns=None, partitions=None):
+    """
+    Carrega os dados processados gravados por `save_processed_data`.
+
+    No formato colunar, apenas os arquivos das colunas e das partições
+    pedidas são lidos, mapeados em memória, e os tipos originais são
+    mantidos. Para ler as partições sob demanda, use
+    `ProcessedDataset(path).iter_partitions(...)`.
+
+    Args:
+        path: Arquivo CSV ou diretório do formato colunar.
+        columns: Colunas a ler. Se omitido, lê todas.
+        partitions: Anos de lançamento a ler (por exemplo
+            `range(2018, 2023)`) ou uma função que recebe o ano e retorna
+            True para as partições desejadas. Só vale para o formato colunar.
+
+    Returns:
+        DataFrame com os dados processados.
+    """
+    with etapa('load_processed_data') as medicao:
+        if is_columnar_path(path):
+            df = ProcessedDataset(path).read(columns, partitions)
+        elif partitions is not None:
+            raise ValueError("A seleção de partições só é possível no formato colunar")
+        else:
+            df = pd.read_csv(path, usecols=None if columns is None else list(columns))
+        medicao.linhas = len(df)
+    return df
+
+def _chunk_schema(path, columns, schema, chunksize):
+    """
+    Ajusta o esquema para a leitura em blocos.
+
+    `_apply_schema` troca por float32 as colunas inteiras com valores
+    ausentes, o que depende do arquivo inteiro. Esta função lê só essas
+    colunas, em blocos, e já declara float32 para as que têm ausentes, de
+    modo que todos os blocos tenham os mesmos tipos da leitura completa.
+    """
+    integer_columns = [column for column, dtype in schema.items()
+                       if dtype is not None and dtype not in ('bool', 'category') and np.dtype(dtype).kind in 'iu'
+                       and (columns is None or column in columns)]
+    if not integer_columns:
+        return schema
+    header = pd.read_csv(path, nrows=0).columns
+    integer_columns = [column for column in integer_columns if column in header]
+    missing = set()
+    for chunk in pd.read_csv(path, usecols=integer_columns, chunksize=chunksize):
+        for column in integer_columns:
+            if column not in missing and pd.to_numeric(chunk[column], errors='coerce').isna().any():
+                missing.add(column)
+    return {column: 'float32' if column in missing else dtype for column, dtype in schema.items()}
+
+def _preprocess_chunk(chunk, schema, date_format):
+    """Converte e pré-processa um bloco do CSV bruto (executada também nos processos auxiliares)."""
+    _apply_schema(chunk, schema)
+    return _preprocess_data(chunk, copy=False, list_columns=True, date_format=date_format)
+
+def _align_dtypes(df, dtypes):
+    """Converte para os tipos do primeiro bloco as colunas sem nenhum valor, cujo tipo o pandas deduz como float."""
+    for column, dtype in dtypes.items():
+        if df[column].dtype != dtype and df[column].isna().all():
+            df[column] = df[column].astype(dtype)
+    return df
+
+def preprocess_csv(input_path, output_path, columns=None, schema=None, chunksize=CHUNKSIZE, processes=1):
+    """
+    Pré-processa o CSV bruto em blocos, gravando o resultado aos poucos.
+
+    Equivale a `save_processed_data(preprocess_data(load_raw_data(input_path,
+    columns, schema)), output_path)`, e em CSV produz exatamente os mesmos
+    bytes, mas sem carregar o arquivo inteiro: a memória usada é limitada a
+    alguns blocos de `chunksize` linhas (até `2 * processes` blocos em
+    processamento ao mesmo tempo, mais o que está sendo gravado).
+
+    Args:
+        input_path: Caminho do CSV bruto.
+        output_path: Arquivo CSV ou diretório do formato colunar (veja
+            `save_processed_data`).
+        columns: Colunas do CSV a ler (por exemplo `PREPROCESS_COLUMNS`). Se
+            omitido, lê todas.
+        schema: Tipo de cada coluna. Se omitido, usa `RAW_SCHEMA`.
+        chunksize: Número de linhas de cada bloco.
+        processes: Número de processos que pré-processam blocos em paralelo;
+            com 1, tudo roda no processo atual. Os blocos são gravados
+            sempre na ordem do arquivo.
+
+    Returns:
+        Número de linhas processadas.
+    """
+    import os
+    schema = RAW_SCHEMA if schema is None else schema
+    usecols = list(columns) if columns is not None else None
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+
+    with etapa('preprocess_csv') as medicao:
+        schema = _chunk_schema(input_path, usecols, schema, chunksize)
+        read_dtypes = {column: dtype for column, dtype in schema.items()
+                       if dtype == 'category' and (usecols is None or column in usecols)}
+        reader = pd.read_csv(input_path, usecols=usecols, dtype=read_dtypes, chunksize=chunksize)
+
+        state = {'rows': 0, 'dtypes': None}
+        columnar = is_columnar_path(output_path)
+
+        def write(processed):
+            if state['dtypes'] is None:
+                state['dtypes'] = processed.dtypes.to_dict()
+            else:
+                _align_dtypes(processed, state['dtypes'])
+            append = state['rows'] > 0
+            if columnar:
+                write_columnar(processed, output_path, append=append)
+            else:
+                processed.to_csv(output_path, mode='a' if append else 'w', header=not append, index=False)
+            state['rows'] += len(processed)
+
+        first_date = None
+
+        def chunks():
+            # O formato das datas vem da primeira data preenchida do arquivo, como na leitura completa
+            nonlocal first_date
+            for chunk in reader:
+                if first_date is None and 'Release date' in chunk.columns:
+                    first_date = _first_date(chunk['Release date'])
+                yield chunk, _date_format(first_date)
+
+        with reader:
+            if processes > 1:
+                with ProcessPoolExecutor(max_workers=processes) as executor:
+                    pending = deque()
+                    for chunk, date_format in chunks():
+                        pending.append(executor.submit(_preprocess_chunk, chunk, schema, date_format))
+                        del chunk
+                        if len(pending) >= 2 * processes:
+                            write(pending.popleft().result())
+                    while pending:
+                        write(pending.popleft().result())
+            else:
+                for chunk, date_format in chunks():
+                    write(_preprocess_chunk(chunk, schema, date_format))
+
+        if state['dtypes'] is None:
+            # CSV sem linhas: grava só as colunas, como o caminho em memória
+            empty = pd.read_csv(input_path, usecols=usecols, dtype=read_dtypes, nrows=0)
+            write(_preprocess_chunk(empty, schema, None))
+        medicao.linhas = state['rows']
+
+    print(f"{state['rows']} linhas processadas salvas em {output_path}")
+    return state['rows']
@@ -0,0 +1,120 @@
+"""
+Seleção dos K melhores jogos, no total ou por grupo, sem ordenar o DataFrame inteiro.
+
+O resultado de `top_k` é o mesmo de:
+
+    df.sort_values(by, ascending=ascending, kind='stable')
+      .drop_duplicates(subset=[*group, *distinct])
+      .groupby(group, sort=False, dropna=False).head(k)
+
+(sem `groupby` quando não há grupos), inclusive na ordem das linhas e nos
+empates, que mantêm a ordem original. Em vez de ordenar todas as linhas, só
+são ordenadas as candidatas: em cada grupo, as linhas cujo primeiro critério
+de ordenação é pelo menos tão bom quanto o do m-ésimo melhor valor, com
+empates incluídos. Como as demais linhas são estritamente piores, a ordem
+das candidatas é um prefixo da ordem completa. Se, depois de remover as
+repetições, um grupo ainda tiver menos de K linhas, m é dobrado para ele.
+
+Resultados parciais (por exemplo, de cada bloco de `preprocess_csv` ou de
+cada partição do formato colunar) podem ser combinados aplicando `top_k` de
+novo à concatenação deles, na ordem original das linhas.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _as_list(columns):
+    """Normaliza um nome de coluna ou uma lista de nomes para lista."""
+    if columns is None:
+        return []
+    return [columns] if isinstance(columns, str) else list(columns)
+
+def _primary_key(series, ascending):
+    """
+    Converte o primeiro critério de ordenação em números em que menor é melhor.
+
+    Valores ausentes ficam por último, como no `sort_values`. Retorna None para
+    colunas não numéricas, que são ordenadas por completo.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = series.to_numpy().view('i8').astype(np.float64)
+    elif pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_numeric_dtype(series.dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        return None
+    return np.where(series.isna().to_numpy(), np.inf, values if ascending else -values)
+
+def _thresholds(primary, groups, group_count, limit):
+    """Valor do `limit`-ésimo melhor primeiro critério de cada grupo (o pior valor, em grupos menores)."""
+    if group_count == 1:
+        if limit >= len(primary):
+            return np.array([np.inf])
+        return np.array([np.partition(primary, limit - 1)[limit - 1]])
+    order = np.lexsort((primary, groups))
+    sizes = np.bincount(groups, minlength=group_count)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    positions = starts + np.minimum(sizes, limit) - 1
+    thresholds = np.full(group_count, np.inf)
+    present = sizes > 0
+    thresholds[present] = primary[order[positions[present]]]
+    return thresholds
+
+def top_k(df, k, by, ascending=True, distinct=None, group=None):
+    """
+    Seleciona as K melhores linhas de um DataFrame, no total ou por grupo.
+
+    Args:
+        df: DataFrame de origem.
+        k: Número de linhas por grupo (ou no total, sem `group`).
+        by: Coluna ou colunas de ordenação, como em `sort_values`.
+        ascending: Sentido de cada coluna de `by`, como em `sort_values`.
+        distinct: Coluna ou colunas que identificam repetições (por exemplo
+            'name'); de cada valor repetido, só a melhor linha é mantida.
+        group: Coluna ou colunas de agrupamento (por exemplo 'publisher' ou
+            'release_year') para selecionar as K melhores de cada grupo.
+
+    Returns:
+        DataFrame com as linhas selecionadas, na ordem de `by`, com o mesmo
+        índice e as mesmas colunas de `df`.
+    """
+    by, distinct, group = _as_list(by), _as_list(distinct), _as_list(group)
+    ascending = [ascending] * len(by) if isinstance(ascending, bool) else list(ascending)
+    if k <= 0 or df.empty:
+        return df.iloc[:0]
+    subset = [*group, *distinct]
+    keys = df[list(dict.fromkeys([*by, *subset]))]
+
+    def select(positions):
+        # Ordena só as colunas usadas, indexadas pela posição das linhas em `df`
+        frame = keys.iloc[positions].set_axis(positions)
+        frame = frame.sort_values(by, ascending=ascending, kind='stable')
+        if subset:
+            frame = frame.drop_duplicates(subset=subset)
+        frame = frame.groupby(group, sort=False, dropna=False).head(k) if group else frame.head(k)
+        return frame.index.to_numpy()
+
+    primary = _primary_key(df[by[0]], ascending[0])
+    if primary is None:
+        return df.iloc[select(np.arange(len(df)))]
+
+    if len(group) > 1:
+        groups, uniques = pd.MultiIndex.from_frame(df[group]).factorize()
+    elif group:
+        groups, uniques = pd.factorize(df[group[0]], use_na_sentinel=False)
+    else:
+        groups, uniques = np.zeros(len(df), dtype=np.intp), [None]
+    group_count = len(uniques)
+    sizes = np.bincount(groups, minlength=group_count)
+
+    limit = k
+    while True:
+        thresholds = _thresholds(primary, groups, group_count, limit)
+        candidates = np.flatnonzero(primary <= thresholds[groups])
+        selected = select(candidates)
+        # Um grupo está completo se já tem K linhas distintas ou se todas as suas linhas foram candidatas
+        found = np.bincount(groups[selected], minlength=group_count)
+        covered = np.bincount(groups[candidates], minlength=group_count)
+        if limit >= sizes.max() or ((found >= k) | (covered >= sizes)).all():
+            return df.iloc[selected]
+        limit *= 2
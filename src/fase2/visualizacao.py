@@ -1,67 +1,452 @@
+"""
+Gráficos da fase 2.
+
+Além das funções usadas diretamente no notebook (`set_custom_style` e
+`plot_os_support`), o módulo tem um registro de gráficos (`CHARTS`) e um
+renderizador (`render_charts`) que grava cada gráfico registrado em PNG e SVG
+sem usar o estado global do pyplot: cada gráfico é desenhado em uma `Figure`
+própria com o backend Agg, em processos separados quando há vários gráficos
+a desenhar. Cada gráfico é calculado a partir de um agregado pequeno (em
+geral uma consulta ao cubo de agregados); a impressão digital desse agregado,
+do código de desenho, da paleta e do estilo fica gravada junto dos arquivos,
+e gráficos em que nada disso mudou não são desenhados de novo.
+
+Exemplo:
+    render_charts(cube, 'reports/figures', processes=4)
+"""
+
+import functools
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LinearSegmentedColormap, LogNorm
+from matplotlib.figure import Figure
+
+from src.fase2.cubo import PLATFORM_DIMENSIONS, AggregateCube, build_cube
+
+# Cores da Steam em tons de azul e cinza
+STEAM_COLORS = ('#1b2838', '#2a475e', '#66c0f4', '#c7d5e0', '#b8b6b4')
+
+# Estilo base e definições personalizadas aplicadas sobre ele
+BASE_STYLE = 'seaborn-v0_8-darkgrid'
+STYLE_OVERRIDES = {
+    'figure.figsize': (12, 8),
+    'font.size': 12,
+    'axes.titlesize': 16,
+    'axes.titleweight': 'bold',
+    'axes.labelsize': 14,
+    'axes.labelweight': 'bold',
+    'xtick.labelsize': 12,
+    'ytick.labelsize': 12,
+    'legend.fontsize': 12,
+    'figure.titlesize': 20,
+}
+
+# Mapa de cores das densidades, do tom mais claro ao mais escuro da paleta da Steam
+DENSITY_COLORS = STEAM_COLORS[3::-1]
+
+# Número de pontos agregados por vez em `density_grid`
+DENSITY_CHUNKSIZE = 1 << 18
+
+# Formatos gravados por `render_charts`
+CHART_FORMATS = ('png', 'svg')
+
+# Arquivo, no diretório de saída, com a impressão digital de cada gráfico gravado
+FINGERPRINTS_FILE = 'fingerprints.json'
+
+# Gráficos registrados com `register_chart`, por nome
+CHARTS = {}
+
+_style_applied = False
+
+
+@functools.lru_cache(maxsize=None)
+def _style():
+    """Parâmetros do estilo personalizado (estilo base mais as definições do projeto), montados uma vez."""
+    params = dict(plt.style.library[BASE_STYLE])
+    params.update(STYLE_OVERRIDES)
+    return params
 
 def set_custom_style():
     """Define um estilo personalizado para todos os gráficos do projeto"""
-    # Cores da Steam em tons de azul e cinza
-    colors = ['#1b2838', '#2a475e', '#66c0f4', '#c7d5e0', '#b8b6b4']
-    
-    # Configurações de estilo
-    plt.style.use('seaborn-v0_8-darkgrid')
-    
-    # Definições personalizadas
-    plt.rcParams['figure.figsize'] = (12, 8)
-    plt.rcParams['font.size'] = 12
-    plt.rcParams['axes.titlesize'] = 16
-    plt.rcParams['axes.titleweight'] = 'bold'
-    plt.rcParams['axes.labelsize'] = 14
-    plt.rcParams['axes.labelweight'] = 'bold'
-    plt.rcParams['xtick.labelsize'] = 12
-    plt.rcParams['ytick.labelsize'] = 12
-    plt.rcParams['legend.fontsize'] = 12
-    plt.rcParams['figure.titlesize'] = 20
-    
+    global _style_applied
+    # O estilo é aplicado só na primeira chamada
+    if not _style_applied:
+        plt.rcParams.update(_style())
+        _style_applied = True
+
     # Retorna a paleta de cores para uso em gráficos
-    return colors
+    return list(STEAM_COLORS)
+
+def _os_support(df):
+    """Percentual de jogos com suporte a cada sistema operacional, a partir do DataFrame ou do cubo."""
+    if isinstance(df, AggregateCube):
+        values = [df.share(column)['percentage'] for column in PLATFORM_DIMENSIONS]
+    else:
+        # Calcular o total de "votos" para cada SO
+        total_games = len(df)
+        values = [(df[column].sum() / total_games) * 100 for column in PLATFORM_DIMENSIONS]
+    return pd.Series(values, index=['Windows', 'macOS', 'Linux'], dtype='float64')
+
+def _draw_os_support(os_support, ax, colors):
+    """Desenha as barras de suporte aos sistemas operacionais em `ax`."""
+    bars = ax.bar(os_support.index, os_support.to_numpy(), color=colors[:3])
+
+    # Adicionar rótulos nas barras
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
+                f'{height:.1f}%', ha='center', va='bottom')
+
+    ax.set_title('Percentual de Jogos por Sistema Operacional Suportado')
+    ax.set_ylabel('Percentual de Jogos (%)')
+    ax.set_ylim(0, 100)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
 
-def plot_os_support(df):
+def plot_os_support(df, ax=None):
     """
     Cria o gráfico de suporte aos sistemas operacionais (Gráfico 1)
-    
+
     Args:
-        df: DataFrame pré-processado
+        df: DataFrame pré-processado, ou o cubo de agregados (veja `build_cube`),
+            que dá os percentuais sem percorrer os jogos
+        ax: Eixos onde desenhar; se omitido, cria uma nova figura do pyplot
     """
     colors = set_custom_style()
-    
-    # Calcular o total de "votos" para cada SO
-    total_games = len(df)
-    windows_count = df['supports_windows'].sum()
-    mac_count = df['supports_mac'].sum()
-    linux_count = df['supports_linux'].sum()
-    
-    # Calcular percentuais
-    windows_pct = (windows_count / total_games) * 100
-    mac_pct = (mac_count / total_games) * 100
-    linux_pct = (linux_count / total_games) * 100
-    
-    # Criar gráfico
-    os_names = ['Windows', 'macOS', 'Linux']
-    os_values = [windows_pct, mac_pct, linux_pct]
-    
-    plt.figure(figsize=(10, 8))
-    bars = plt.bar(os_names, os_values, color=colors[:3])
-    
-    # Adicionar rótulos nas barras
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 1,
-                 f'{height:.1f}%', ha='center', va='bottom')
-    
-    plt.title('Percentual de Jogos por Sistema Operacional Suportado')
-    plt.ylabel('Percentual de Jogos (%)')
-    plt.ylim(0, 100)
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    
-    return plt.gcf()  # retorna a figura atual
\ No newline at end of file
+
+    if ax is None:
+        plt.figure(figsize=(10, 8))
+        ax = plt.gca()
+    _draw_os_support(_os_support(df), ax, colors)
+
+    return ax.figure
+
+def _as_float(values, log):
+    """Converte os valores em float64, em log10 se pedido (valores não positivos viram NaN)."""
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = np.asarray(values, dtype=np.float64)
+    if log:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.where(values > 0, np.log10(values), np.nan)
+    return values
+
+def _value_range(values, chunksize):
+    """Menor e maior valor finito, calculados por blocos."""
+    low, high = np.inf, -np.inf
+    for start in range(0, len(values), chunksize):
+        chunk = values[start:start + chunksize]
+        chunk = chunk[np.isfinite(chunk)]
+        if len(chunk):
+            low, high = min(low, chunk.min()), max(high, chunk.max())
+    if low > high:
+        return 0.0, 1.0
+    return (low - 0.5, high + 0.5) if low == high else (low, high)
+
+def density_grid(x, y, bins=200, range=None, log_x=False, log_y=False, chunksize=DENSITY_CHUNKSIZE):
+    """
+    Conta os pontos (x, y) em uma grade regular, como `np.histogram2d`.
+
+    Os pontos são agregados em blocos de `chunksize`, com um único
+    `np.bincount` por bloco; além dos dados de entrada, a memória usada
+    depende só do tamanho da grade e do bloco.
+
+    Args:
+        x: Valores do eixo x (array ou Series).
+        y: Valores do eixo y.
+        bins: Número de intervalos da grade, um só para os dois eixos ou um par (x, y).
+        range: Limites ((xmin, xmax), (ymin, ymax)) nas unidades originais; se
+            omitido, usa o menor e o maior valor de cada eixo.
+        log_x: Se True, os intervalos do eixo x são regulares em escala
+            logarítmica e os valores não positivos são ignorados.
+        log_y: O mesmo para o eixo y.
+        chunksize: Número de pontos agregados por vez.
+
+    Returns:
+        Tupla (counts, x_edges, y_edges): contagens com forma (bins_x, bins_y)
+        e as bordas dos intervalos nas unidades originais. Pontos ausentes ou
+        fora dos limites são ignorados.
+    """
+    x, y = _as_float(x, log_x), _as_float(y, log_y)
+    x_bins, y_bins = (bins, bins) if np.ndim(bins) == 0 else bins
+    limits = []
+    for values, log, bounds in zip((x, y), (log_x, log_y), range or (None, None)):
+        if bounds is None:
+            limits.append(_value_range(values, chunksize))
+        else:
+            limits.append(tuple(np.log10(bounds)) if log else tuple(map(float, bounds)))
+    (x_low, x_high), (y_low, y_high) = limits
+
+    counts = np.zeros(x_bins * y_bins, dtype=np.int64)
+    for start in np.arange(0, len(x), chunksize):
+        xs, ys = x[start:start + chunksize], y[start:start + chunksize]
+        valid = (xs >= x_low) & (xs <= x_high) & (ys >= y_low) & (ys <= y_high)
+        xs, ys = xs[valid], ys[valid]
+        # O último intervalo inclui a borda superior, como em np.histogram2d
+        columns = np.minimum(((xs - x_low) * (x_bins / (x_high - x_low))).astype(np.intp), x_bins - 1)
+        rows = np.minimum(((ys - y_low) * (y_bins / (y_high - y_low))).astype(np.intp), y_bins - 1)
+        counts += np.bincount(columns * y_bins + rows, minlength=x_bins * y_bins)
+
+    x_edges = np.linspace(x_low, x_high, x_bins + 1)
+    y_edges = np.linspace(y_low, y_high, y_bins + 1)
+    return (counts.reshape(x_bins, y_bins), 10 ** x_edges if log_x else x_edges,
+            10 ** y_edges if log_y else y_edges)
+
+def plot_density(x, y, bins=200, range=None, log_x=False, log_y=False, ax=None, xlabel=None, ylabel=None,
+                 title=None):
+    """
+    Cria um gráfico de densidade de pontos, para quando há pontos demais para um gráfico de dispersão.
+
+    Os pontos são agregados em uma grade com `density_grid` e desenhados
+    como uma imagem, nas cores da paleta da Steam; o tempo de desenho e a
+    memória dependem do tamanho da grade, não do número de pontos.
+
+    Args:
+        x: Valores do eixo x (por exemplo, preços).
+        y: Valores do eixo y (por exemplo, proporção de avaliações positivas).
+        bins: Número de intervalos da grade (um só ou um par (x, y)).
+        range: Limites ((xmin, xmax), (ymin, ymax)); se omitido, os dos dados.
+        log_x: Se True, usa escala logarítmica no eixo x (valores não positivos são ignorados).
+        log_y: O mesmo para o eixo y.
+        ax: Eixos onde desenhar; se omitido, cria uma nova figura do pyplot.
+        xlabel: Rótulo do eixo x; se omitido, usa o nome da Series, se houver.
+        ylabel: Rótulo do eixo y; se omitido, usa o nome da Series, se houver.
+        title: Título do gráfico.
+
+    Returns:
+        Figura do gráfico.
+    """
+    set_custom_style()
+    counts, x_edges, y_edges = density_grid(x, y, bins=bins, range=range, log_x=log_x, log_y=log_y)
+
+    if ax is None:
+        plt.figure()
+        ax = plt.gca()
+    cmap = LinearSegmentedColormap.from_list('steam', DENSITY_COLORS)
+    # Células vazias ficam transparentes; as contagens variam em ordens de grandeza
+    masked = np.ma.masked_equal(counts.T, 0)
+    norm = LogNorm(vmin=1, vmax=max(counts.max(), 1))
+    mesh = ax.pcolormesh(x_edges, y_edges, masked, cmap=cmap, norm=norm, rasterized=True)
+    ax.figure.colorbar(mesh, ax=ax, label='Número de jogos')
+
+    if log_x:
+        ax.set_xscale('log')
+    if log_y:
+        ax.set_yscale('log')
+    ax.set_xlabel(xlabel if xlabel is not None else getattr(x, 'name', None) or '')
+    ax.set_ylabel(ylabel if ylabel is not None else getattr(y, 'name', None) or '')
+    if title is not None:
+        ax.set_title(title)
+    return ax.figure
+
+def register_chart(name, aggregate, figsize=None, version=1):
+    """
+    Registra um gráfico para `render_charts` (usado como decorador da função de desenho).
+
+    Args:
+        name: Nome do gráfico, usado também como nome dos arquivos.
+        aggregate: Função que recebe o cubo de agregados e retorna os dados
+            do gráfico (DataFrame, Series ou outro valor pequeno).
+        figsize: Tamanho da figura; se omitido, usa o do estilo.
+        version: Versão do desenho, entra na impressão digital do gráfico.
+            Mudanças no código de desenho, nos textos, nas cores e no estilo
+            já são detectadas; aumente a versão para mudanças que não são
+            (por exemplo, em uma função de outro módulo chamada no desenho).
+
+    Returns:
+        Decorador que recebe a função de desenho, chamada com o agregado, os
+        eixos e a paleta de cores, e a retorna sem alterações.
+    """
+    def decorator(draw):
+        CHARTS[name] = {'aggregate': aggregate, 'draw': draw, 'figsize': figsize, 'version': version}
+        return draw
+    return decorator
+
+@register_chart('os_support', _os_support, figsize=(10, 8))
+def _chart_os_support(os_support, ax, colors):
+    _draw_os_support(os_support, ax, colors)
+
+def _linux_by_year(cube):
+    return cube.share('supports_linux', by=['release_year'], where={'release_year': range(2018, 2023)})
+
+@register_chart('linux_by_year', _linux_by_year, figsize=(10, 6))
+def _chart_linux_by_year(linux_by_year, ax, colors):
+    years, counts = linux_by_year['release_year'], linux_by_year['matching']
+    ax.plot(years, counts, marker='o', markersize=10, linewidth=2, color=colors[0])
+    ax.set_title('Evolução do Número de Jogos com Suporte a Linux (2018-2022)')
+    ax.set_xlabel('Ano')
+    ax.set_ylabel('Número de Jogos')
+    ax.set_xticks(years)
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+    # Adicionar os valores em cada ponto
+    for year, count in zip(years, counts):
+        ax.text(year, count, f"{count}", ha='center', va='bottom', fontweight='bold')
+
+def _single_player_by_genre(cube):
+    return cube.query('games', by=['genre', 'release_year'],
+                      where={'genre': ['Indie', 'Strategy'], 'category': 'Single-player',
+                             'release_year': range(2010, 2021)})
+
+@register_chart('single_player_by_genre', _single_player_by_genre)
+def _chart_single_player_by_genre(single_player, ax, colors):
+    for (genre, games), marker, color in zip(single_player.groupby('genre', sort=False), 'os', colors[::2]):
+        ax.plot(games['release_year'], games['games'], f'{marker}-', linewidth=2, markersize=8,
+                color=color, label=genre)
+    ax.set_title('Número de Jogos Single-Player por Gênero (2010-2020)')
+    ax.set_xlabel('Ano de Lançamento')
+    ax.set_ylabel('Número de Jogos')
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend(fontsize=12)
+    ax.set_xticks(range(2010, 2021))
+
+def _price_range_ratios(cube):
+    return cube.query(['rated_games', 'positive_ratio_mean'], by=['price_range'])
+
+@register_chart('price_range_ratios', _price_range_ratios, figsize=(14, 8))
+def _chart_price_range_ratios(price_stats, ax, colors):
+    bar_colors = plt.cm.viridis(np.linspace(0, 1, len(price_stats)))
+    bars = ax.bar(price_stats['price_range'].astype(str), price_stats['positive_ratio_mean'], color=bar_colors)
+
+    # Adicionar rótulos de contagem
+    for bar, count in zip(bars, price_stats['rated_games']):
+        ax.annotate(f'{count} jogos', (bar.get_x() + bar.get_width()/2., bar.get_height() + 0.01),
+                    ha='center', va='bottom', fontsize=10)
+
+    # Adicionar linha de 50% positivo/negativo
+    ax.axhline(0.5, color='red', linestyle='--', alpha=0.7)
+    ax.set_title('Proporção de Avaliações Positivas por Faixa de Preço', fontsize=16)
+    ax.set_ylabel('Proporção Média de Avaliações Positivas', fontsize=14)
+    ax.set_xlabel('Faixa de Preço', fontsize=14)
+    ax.set_ylim(0, 1)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+def _update_code(digest, function, seen):
+    """
+    Acrescenta à impressão digital o código de uma função e o das funções deste módulo que ela chama.
+
+    Além dos bytecodes, entram as constantes (textos, números, tuplas) e os
+    nomes usados, que não fazem parte de `co_code`.
+    """
+    if function in seen:
+        return
+    seen.add(function)
+    codes = [function.__code__]
+    while codes:
+        code = codes.pop()
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for constant in code.co_consts:
+            if hasattr(constant, 'co_code'):
+                codes.append(constant)
+            else:
+                digest.update(repr(constant).encode())
+        for called in code.co_names:
+            value = function.__globals__.get(called)
+            if callable(value) and getattr(value, '__module__', None) == __name__ and hasattr(value, '__code__'):
+                _update_code(digest, value, seen)
+
+def _fingerprint(name, aggregate, formats):
+    """
+    Impressão digital de um gráfico: nome, formatos, versão, código de desenho,
+    paleta, estilo e conteúdo do agregado.
+    """
+    chart = CHARTS[name]
+    digest = hashlib.sha256()
+    digest.update(json.dumps([name, list(formats), chart['version'], chart['figsize'], STEAM_COLORS]).encode())
+    digest.update(repr(sorted((key, repr(value)) for key, value in _style().items())).encode())
+    _update_code(digest, chart['draw'], set())
+    if isinstance(aggregate, pd.Series):
+        aggregate = aggregate.to_frame()
+    if isinstance(aggregate, pd.DataFrame):
+        digest.update(repr([(str(column), str(dtype)) for column, dtype in aggregate.dtypes.items()]).encode())
+        digest.update(pd.util.hash_pandas_object(aggregate).to_numpy().tobytes())
+    else:
+        digest.update(repr(aggregate).encode())
+    return digest.hexdigest()
+
+def _init_worker():
+    """Prepara um processo de desenho: backend Agg e estilo aplicados uma única vez por processo."""
+    matplotlib.use('Agg')
+    matplotlib.rcParams.update(_style())
+
+def _render_chart(name, aggregate, base_path, formats):
+    """Desenha um gráfico registrado em uma figura própria e grava um arquivo por formato."""
+    chart = CHARTS[name]
+    figure = Figure(figsize=chart['figsize'])
+    FigureCanvasAgg(figure)
+    chart['draw'](aggregate, figure.add_subplot(), list(STEAM_COLORS))
+    figure.tight_layout()
+    paths = []
+    for image_format in formats:
+        path = f'{base_path}.{image_format}'
+        figure.savefig(path, format=image_format)
+        paths.append(path)
+    return paths
+
+def render_charts(data, output_dir='../../reports/figures', charts=None, formats=CHART_FORMATS, processes=1,
+                  force=False):
+    """
+    Grava os gráficos registrados, desenhando só os que mudaram.
+
+    Args:
+        data: Cubo de agregados ou DataFrame pré-processado (a partir do qual
+            o cubo é calculado).
+        output_dir: Diretório dos arquivos '<gráfico>.<formato>'.
+        charts: Nomes dos gráficos a gravar; se omitido, todos os de `CHARTS`.
+        formats: Formatos das imagens, como 'png' e 'svg'.
+        processes: Número de processos que desenham gráficos em paralelo;
+            com 1, tudo roda no processo atual, sem alterar o estilo global.
+        force: Se True, desenha todos os gráficos mesmo sem mudanças.
+
+    Returns:
+        Dicionário com, para cada gráfico, True se foi desenhado ou False se
+        os arquivos existentes foram mantidos.
+    """
+    cube = data if isinstance(data, AggregateCube) else build_cube(data)
+    names = list(CHARTS) if charts is None else list(charts)
+    formats = tuple(formats)
+    os.makedirs(output_dir, exist_ok=True)
+
+    fingerprints_path = os.path.join(output_dir, FINGERPRINTS_FILE)
+    fingerprints = {}
+    if os.path.exists(fingerprints_path):
+        with open(fingerprints_path, encoding='utf-8') as file:
+            fingerprints = json.load(file)
+
+    # Os agregados são calculados no processo atual; só os gráficos alterados vão para os processos
+    pending = {}
+    for name in names:
+        aggregate = CHARTS[name]['aggregate'](cube)
+        fingerprint = _fingerprint(name, aggregate, formats)
+        base_path = os.path.join(output_dir, name)
+        unchanged = fingerprints.get(name) == fingerprint and all(
+            os.path.exists(f'{base_path}.{image_format}') for image_format in formats)
+        if force or not unchanged:
+            pending[name] = (aggregate, base_path, fingerprint)
+
+    if processes > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(processes, len(pending)), initializer=_init_worker) as executor:
+            futures = [executor.submit(_render_chart, name, aggregate, base_path, formats)
+                       for name, (aggregate, base_path, _) in pending.items()]
+            for future in futures:
+                future.result()
+    else:
+        with matplotlib.rc_context(_style()):
+            for name, (aggregate, base_path, _) in pending.items():
+                _render_chart(name, aggregate, base_path, formats)
+
+    fingerprints.update((name, fingerprint) for name, (_, _, fingerprint) in pending.items())
+    temporary = fingerprints_path + '.tmp'
+    with open(temporary, 'w', encoding='utf-8') as file:
+        json.dump(fingerprints, file, indent=2, sort_keys=True)
+    os.replace(temporary, fingerprints_path)
+    return {name: name in pending for name in names}
@@ -0,0 +1,354 @@
+"""
+Módulo de instrumentação das etapas de carregamento, análise e pré-processamento.
+
+A instrumentação é opcional: desativada (o padrão), `etapa` devolve um
+contexto vazio compartilhado e nada é medido. Ativada com `ativar`, cada
+etapa registra tempo de relógio, tempo de CPU, pico de memória alocada (via
+`tracemalloc`) e linhas processadas por segundo, e as linhas rejeitadas são
+contadas por tipo de erro.
+
+Exemplo:
+    >>> from src import instrumentacao
+    >>> instrumentacao.ativar()
+    >>> dados = DadosJogos('steam_games.csv')
+    >>> instrumentacao.relatorio()['etapas']['carregar_dados']['linhas_por_segundo']
+    >>> instrumentacao.salvar_json('relatorio.json')
+"""
+
+import json
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# Número de exemplos guardados de linhas rejeitadas, por etapa
+MAXIMO_EXEMPLOS = 5
+
+# Tamanho máximo da mensagem guardada em cada exemplo
+TAMANHO_MAXIMO_MENSAGEM = 200
+
+
+class ContagemRejeicoes:
+    """
+    Contagem das linhas rejeitadas de uma leitura, agregadas por tipo de erro.
+
+    Substitui os avisos linha a linha: apenas a contagem por tipo e alguns
+    exemplos são guardados. Objetos desta classe podem ser enviados entre
+    processos e combinados com `combinar`.
+
+    Atributos:
+        por_tipo (Counter): Número de linhas rejeitadas por nome do tipo de erro.
+        exemplos (List[str]): As primeiras mensagens de erro, resumidas.
+    """
+
+    __slots__ = ('por_tipo', 'exemplos')
+
+    def __init__(self):
+        """Inicializa uma contagem vazia."""
+        self.por_tipo: Counter = Counter()
+        self.exemplos: List[str] = []
+
+    def registrar(self, erro: BaseException) -> None:
+        """
+        Registra uma linha rejeitada.
+
+        O tipo contado é o do erro original quando `erro` o encapsula (por
+        exemplo, um ValueError dentro de um ErroDadosJogos).
+
+        Args:
+            erro (BaseException): Erro que impediu o processamento da linha.
+        """
+        origem = erro.__cause__ or erro.__context__ or erro
+        self.por_tipo[type(origem).__name__] += 1
+        if len(self.exemplos) < MAXIMO_EXEMPLOS:
+            self.exemplos.append(str(erro)[:TAMANHO_MAXIMO_MENSAGEM])
+
+    def combinar(self, outra: 'ContagemRejeicoes') -> None:
+        """
+        Acrescenta a esta contagem as rejeições de outra.
+
+        Args:
+            outra (ContagemRejeicoes): Contagem a ser somada.
+        """
+        self.por_tipo.update(outra.por_tipo)
+        self.exemplos.extend(outra.exemplos[:MAXIMO_EXEMPLOS - len(self.exemplos)])
+
+    @property
+    def total(self) -> int:
+        """Número total de linhas rejeitadas."""
+        return sum(self.por_tipo.values())
+
+    def resumo(self, origem: str) -> str:
+        """
+        Descreve as rejeições em uma única mensagem.
+
+        Args:
+            origem (str): Arquivo ou etapa de onde as linhas vieram.
+
+        Returns:
+            str: Mensagem com o total, a contagem por tipo e o primeiro exemplo.
+        """
+        tipos = ', '.join(f"{tipo}: {quantidade}" for tipo, quantidade in self.por_tipo.most_common())
+        mensagem = f"Aviso: {self.total} linha(s) de {origem} não puderam ser processadas ({tipos})."
+        if self.exemplos:
+            mensagem += f" Primeiro erro: {self.exemplos[0]}"
+        return mensagem
+
+    def __bool__(self) -> bool:
+        """Indica se alguma linha foi rejeitada."""
+        return bool(self.por_tipo)
+
+
+class _MedicaoNula:
+    """Medição usada quando a instrumentação está desativada; ignora tudo."""
+
+    __slots__ = ()
+
+    @property
+    def linhas(self) -> int:
+        """Sempre zero: nada é contado."""
+        return 0
+
+    @linhas.setter
+    def linhas(self, valor: int) -> None:
+        """Ignora o número de linhas informado."""
+
+    def __enter__(self) -> '_MedicaoNula':
+        """Não mede nada."""
+        return self
+
+    def __exit__(self, *excecao: Any) -> None:
+        """Não registra nada."""
+        return None
+
+
+_MEDICAO_NULA = _MedicaoNula()
+
+
+class Medicao:
+    """
+    Medição de uma execução de uma etapa, usada como gerenciador de contexto.
+
+    Atributos:
+        nome (str): Nome da etapa.
+        linhas (int): Linhas processadas; pode ser atualizado dentro do bloco.
+    """
+
+    __slots__ = ('nome', 'linhas', '_instrumentacao', '_inicio', '_inicio_cpu',
+                 '_memoria_inicial', '_pico_filhas')
+
+    def __init__(self, instrumentacao: 'Instrumentacao', nome: str, linhas: int = 0):
+        """
+        Inicializa a medição.
+
+        Args:
+            instrumentacao (Instrumentacao): Onde o resultado será registrado.
+            nome (str): Nome da etapa.
+            linhas (int, opcional): Linhas processadas, se já conhecidas.
+        """
+        self.nome = nome
+        self.linhas = linhas
+        self._instrumentacao = instrumentacao
+        self._pico_filhas = 0
+
+    def __enter__(self) -> 'Medicao':
+        """Começa a medir a etapa."""
+        pilha = self._instrumentacao._pilha
+        self._memoria_inicial = 0
+        if tracemalloc.is_tracing():
+            atual, pico = tracemalloc.get_traced_memory()
+            if pilha:
+                # Preserva o pico já atingido pela etapa externa antes de zerá-lo
+                pilha[-1]._pico_filhas = max(pilha[-1]._pico_filhas, pico)
+            tracemalloc.reset_peak()
+            self._memoria_inicial = atual
+        pilha.append(self)
+        self._inicio_cpu = time.process_time()
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao: Any) -> None:
+        """Termina a medição e a registra, inclusive se a etapa falhou."""
+        segundos = time.perf_counter() - self._inicio
+        segundos_cpu = time.process_time() - self._inicio_cpu
+        pilha = self._instrumentacao._pilha
+        pilha.pop()
+
+        pico_memoria = None
+        if tracemalloc.is_tracing():
+            pico = max(tracemalloc.get_traced_memory()[1], self._pico_filhas)
+            pico_memoria = max(0, pico - self._memoria_inicial)
+            if pilha:
+                pilha[-1]._pico_filhas = max(pilha[-1]._pico_filhas, pico)
+        self._instrumentacao._registrar(self.nome, segundos, segundos_cpu, pico_memoria, self.linhas)
+
+
+class Instrumentacao:
+    """
+    Registro das medições de cada etapa e das linhas rejeitadas.
+
+    Chamadas repetidas de uma mesma etapa são acumuladas: tempos e linhas são
+    somados e o pico de memória é o maior observado.
+
+    Atributos:
+        ativa (bool): Se as etapas estão sendo medidas.
+        etapas (Dict[str, Dict[str, Any]]): Medidas acumuladas por etapa.
+        rejeicoes (Dict[str, ContagemRejeicoes]): Linhas rejeitadas por etapa.
+    """
+
+    def __init__(self):
+        """Inicializa uma instrumentação desativada e vazia."""
+        self.ativa = False
+        self.etapas: Dict[str, Dict[str, Any]] = {}
+        self.rejeicoes: Dict[str, ContagemRejeicoes] = {}
+        self._pilha: List[Medicao] = []
+        self._iniciou_tracemalloc = False
+
+    def ativar(self, memoria: bool = True) -> None:
+        """
+        Ativa as medições.
+
+        Args:
+            memoria (bool, opcional): Se True, mede o pico de memória com
+                `tracemalloc`, o que deixa o código medido mais lento.
+        """
+        self.ativa = True
+        if memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+
+    def desativar(self) -> None:
+        """Desativa as medições, mantendo o que já foi registrado."""
+        self.ativa = False
+        if self._iniciou_tracemalloc:
+            tracemalloc.stop()
+            self._iniciou_tracemalloc = False
+
+    def reiniciar(self) -> None:
+        """Descarta todas as medições e rejeições registradas."""
+        self.etapas = {}
+        self.rejeicoes = {}
+
+    def etapa(self, nome: str, linhas: int = 0) -> Any:
+        """
+        Retorna o gerenciador de contexto que mede uma etapa.
+
+        Args:
+            nome (str): Nome da etapa, por exemplo 'carregar_dados'.
+            linhas (int, opcional): Linhas processadas pela etapa, se já conhecidas.
+
+        Returns:
+            Medicao: A medição (ou um contexto vazio, se desativada), cujo
+            atributo `linhas` pode ser atualizado dentro do bloco.
+        """
+        if not self.ativa:
+            return _MEDICAO_NULA
+        return Medicao(self, nome, linhas)
+
+    def acumular(self, nome: str, segundos: float, linhas: int = 0) -> None:
+        """
+        Registra diretamente o tempo de uma etapa medida pelo chamador.
+
+        Usado para partes de laços internos, em que abrir um contexto por
+        linha custaria caro.
+
+        Args:
+            nome (str): Nome da etapa.
+            segundos (float): Tempo de relógio gasto.
+            linhas (int, opcional): Linhas processadas.
+        """
+        if self.ativa:
+            self._registrar(nome, segundos, None, None, linhas)
+
+    def registrar_rejeicoes(self, nome: str, rejeicoes: ContagemRejeicoes) -> None:
+        """
+        Acrescenta as linhas rejeitadas por uma etapa.
+
+        Args:
+            nome (str): Nome da etapa.
+            rejeicoes (ContagemRejeicoes): Linhas rejeitadas.
+        """
+        if self.ativa and rejeicoes:
+            self.rejeicoes.setdefault(nome, ContagemRejeicoes()).combinar(rejeicoes)
+
+    def _registrar(self, nome: str, segundos: float, segundos_cpu: Optional[float],
+                   pico_memoria: Optional[int], linhas: int) -> None:
+        """Acumula uma medição nas medidas da etapa."""
+        medidas = self.etapas.get(nome)
+        if medidas is None:
+            medidas = self.etapas[nome] = {'chamadas': 0, 'segundos': 0.0, 'segundos_cpu': None,
+                                           'pico_memoria_mb': None, 'linhas': 0}
+        medidas['chamadas'] += 1
+        medidas['segundos'] += segundos
+        medidas['linhas'] += linhas
+        if segundos_cpu is not None:
+            medidas['segundos_cpu'] = (medidas['segundos_cpu'] or 0.0) + segundos_cpu
+        if pico_memoria is not None:
+            pico_mb = pico_memoria / (1024 * 1024)
+            medidas['pico_memoria_mb'] = max(medidas['pico_memoria_mb'] or 0.0, pico_mb)
+
+    def relatorio(self) -> Dict[str, Any]:
+        """
+        Retorna o relatório estruturado das medições.
+
+        Returns:
+            Dict[str, Any]: Um dicionário com:
+                - 'etapas': para cada etapa, 'chamadas', 'segundos', 'segundos_cpu',
+                  'pico_memoria_mb', 'linhas' e 'linhas_por_segundo'
+                - 'rejeicoes': para cada etapa, 'total', 'por_tipo' e 'exemplos'
+        """
+        etapas = {}
+        for nome, medidas in self.etapas.items():
+            etapa = dict(medidas)
+            etapa['linhas_por_segundo'] = (round(medidas['linhas'] / medidas['segundos'], 1)
+                                           if medidas['linhas'] and medidas['segundos'] else None)
+            etapas[nome] = etapa
+        rejeicoes = {
+            nome: {'total': contagem.total, 'por_tipo': dict(contagem.por_tipo), 'exemplos': list(contagem.exemplos)}
+            for nome, contagem in self.rejeicoes.items()
+        }
+        return {'etapas': etapas, 'rejeicoes': rejeicoes}
+
+    def salvar_json(self, caminho_arquivo: str) -> None:
+        """
+        Grava o relatório em um arquivo JSON.
+
+        Args:
+            caminho_arquivo (str): Caminho do arquivo a ser criado.
+        """
+        with open(caminho_arquivo, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.relatorio(), arquivo, indent=2, ensure_ascii=False)
+
+
+# Instrumentação usada por DadosJogos, AnalisadorJogos e preprocessamento
+INSTRUMENTACAO = Instrumentacao()
+
+
+def ativar(memoria: bool = True) -> None:
+    """Ativa a instrumentação global (veja `Instrumentacao.ativar`)."""
+    INSTRUMENTACAO.ativar(memoria)
+
+
+def desativar() -> None:
+    """Desativa a instrumentação global."""
+    INSTRUMENTACAO.desativar()
+
+
+def reiniciar() -> None:
+    """Descarta as medições da instrumentação global."""
+    INSTRUMENTACAO.reiniciar()
+
+
+def etapa(nome: str, linhas: int = 0) -> Any:
+    """Mede uma etapa na instrumentação global (veja `Instrumentacao.etapa`)."""
+    return INSTRUMENTACAO.etapa(nome, linhas)
+
+
+def relatorio() -> Dict[str, Any]:
+    """Retorna o relatório da instrumentação global."""
+    return INSTRUMENTACAO.relatorio()
+
+
+def salvar_json(caminho_arquivo: str) -> None:
+    """Grava o relatório da instrumentação global em JSON."""
+    INSTRUMENTACAO.salvar_json(caminho_arquivo)
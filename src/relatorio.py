@@ -0,0 +1,268 @@
+"""
+Relatório em lote com as análises da fase 1 e as perguntas da Fun Corp (fase 2).
+
+O CSV é lido uma única vez, com pandas (`load_raw_data`), e apenas com as
+colunas usadas pelas análises escolhidas. Como no `csv` da fase 1, só campos
+vazios são valores ausentes. Do mesmo DataFrame saem os dados
+pré-processados da fase 2 e a tabela colunar da fase 1
+(`DadosJogos.carregar_registros`), e o cubo de agregados é calculado uma
+vez para todas as perguntas que o consultam.
+
+As perguntas da fase 2 são independentes entre si e, com mais de um
+processo, são executadas em paralelo por processos que recebem os dados já
+preparados. Enquanto isso, o processo principal monta a tabela da fase 1 e
+executa as análises dela em uma única varredura (`executar_analises`).
+Todos os resultados são gravados em um único arquivo JSON.
+
+Uso:
+    python -m src.relatorio data/raw/steam_games.csv relatorio.json
+    python -m src.relatorio data/raw/steam_games.csv relatorio.json --analises metacritic_top10 linux_por_ano --processos 4
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.fase1.acumuladores import ACUMULADORES, ANALISES_PADRAO
+from src.fase1.analisador_jogos import AnalisadorJogos
+from src.fase1.dados_jogos import ErroDadosJogos
+from src.fase2.cubo import PLATFORM_DIMENSIONS, build_cube
+from src.fase2.empresas import company_stats
+from src.fase2.preprocessamento import PREPROCESS_COLUMNS, contains_pattern, load_raw_data, preprocess_data
+from src.fase2.ranking import top_k
+from src.instrumentacao import etapa
+
+# Colunas do CSV lidas pela fase 1 (as de `TabelaJogos`)
+COLUNAS_FASE1 = ('AppID', 'Name', 'Release date', 'Estimated owners', 'Price', 'Developers', 'Publishers', 'Genres')
+
+
+def metacritic_top10(df: pd.DataFrame) -> pd.DataFrame:
+    """Os dez jogos mais bem avaliados pelo Metacritic, com empates pela data de lançamento (Pergunta 1)."""
+    rated = df.dropna(subset=['metacritic_score'])
+    top_games = top_k(rated, 10, by=['metacritic_score', 'release_date'], ascending=[False, True],
+                      distinct='name')
+    return top_games[['name', 'metacritic_score', 'release_date']]
+
+
+def estatisticas_rpg(df: pd.DataFrame) -> Dict[str, Any]:
+    """Média e máximo de DLCs, avaliações e material de demonstração dos jogos de RPG (Pergunta 2)."""
+    rpg = df[contains_pattern(df['Genres'], 'RPG|role-playing', case=False)]
+    estatisticas: Dict[str, Any] = {'jogos': len(rpg)}
+    for coluna in ('dlc_count', 'positive', 'negative', 'demo_material'):
+        estatisticas[coluna] = {'media': rpg[coluna].mean(), 'maximo': rpg[coluna].max()}
+    return estatisticas
+
+
+def publicadoras_pagas(df: pd.DataFrame) -> pd.DataFrame:
+    """As cinco publicadoras com mais jogos pagos e a média e mediana de avaliações positivas (Pergunta 3)."""
+    stats = company_stats(df[df['is_paid']], 'publisher', values=['positive'], percentiles=(), top=5)
+    return stats.reset_index()
+
+
+def linux_por_ano(cubo: Any) -> Dict[str, Any]:
+    """Jogos com suporte a Linux de 2018 a 2022 e se o número cresceu no período (Pergunta 4)."""
+    por_ano = cubo.share('supports_linux', by=['release_year'], where={'release_year': range(2018, 2023)})
+    jogos = por_ano['matching'].tolist()
+    return {'por_ano': por_ano, 'cresceu': len(jogos) > 1 and jogos[-1] > jogos[0]}
+
+
+def suporte_sistemas(cubo: Any) -> Dict[str, Any]:
+    """Percentual de jogos com suporte a cada sistema operacional (Gráfico 1)."""
+    return {coluna: cubo.share(coluna)['percentage'] for coluna in PLATFORM_DIMENSIONS}
+
+
+def avaliacoes_por_faixa_preco(cubo: Any) -> pd.DataFrame:
+    """Proporção de avaliações positivas dos jogos avaliados, por faixa de preço (Pergunta adicional)."""
+    return cubo.query(['rated_games', 'positive_ratio_mean', 'positive_ratio_std'], by=['price_range'])
+
+
+# Perguntas da fase 2, pelo nome: dados de que dependem ('df' ou 'cubo') e função
+PERGUNTAS_FASE2: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    'metacritic_top10': ('df', metacritic_top10),
+    'estatisticas_rpg': ('df', estatisticas_rpg),
+    'publicadoras_pagas': ('df', publicadoras_pagas),
+    'suporte_sistemas': ('cubo', suporte_sistemas),
+    'linux_por_ano': ('cubo', linux_por_ano),
+    'avaliacoes_por_faixa_preco': ('cubo', avaliacoes_por_faixa_preco),
+}
+
+# Análises executadas quando nenhuma é escolhida: as exatas da fase 1 e todas as da fase 2
+ANALISES_RELATORIO = (*ANALISES_PADRAO, *PERGUNTAS_FASE2)
+
+
+def para_json(valor: Any) -> Any:
+    """
+    Converte um resultado em valores aceitos pelo JSON.
+
+    DataFrames viram listas de registros, Series e dicionários viram objetos
+    (com chaves em texto), datas ficam no formato ISO e valores ausentes ou
+    não finitos viram None.
+    """
+    if isinstance(valor, pd.DataFrame):
+        return [para_json(registro) for registro in valor.to_dict('records')]
+    if isinstance(valor, (pd.Series, dict)):
+        return {str(chave): para_json(item) for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple, np.ndarray)):
+        return [para_json(item) for item in valor]
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if valor is None or valor is pd.NaT or (isinstance(valor, float) and not np.isfinite(valor)):
+        return None
+    if isinstance(valor, date):
+        return valor.isoformat()
+    return valor
+
+
+def _textos(serie: pd.Series) -> List[str]:
+    """Valores de uma coluna em texto, como lidos pelo `csv` na fase 1 ('' para valores ausentes)."""
+    if serie.dtype.kind in 'biuf':
+        return np.where(serie.isna(), '', serie.astype(str).to_numpy(dtype=object)).tolist()
+    return serie.to_numpy(dtype=object, na_value='').tolist()
+
+
+def _registros(df: pd.DataFrame, colunas: Sequence[str]) -> Iterator[Dict[str, str]]:
+    """Linhas de `df` como dicionários de textos, no formato recebido por `DadosJogos.carregar_registros`."""
+    valores = [_textos(df[coluna]) for coluna in colunas]
+    return (dict(zip(colunas, linha)) for linha in zip(*valores))
+
+
+# Dados preparados compartilhados com os processos de trabalho
+_dados_processo: Dict[str, Any] = {}
+
+
+def _iniciar_processo(dados: Dict[str, Any]) -> None:
+    """Guarda os dados preparados no processo de trabalho, recebidos uma única vez por processo."""
+    global _dados_processo
+    _dados_processo = dados
+
+
+def _responder(nome: str) -> Any:
+    """Responde uma pergunta da fase 2 com os dados do processo, já convertida para JSON."""
+    requisito, funcao = PERGUNTAS_FASE2[nome]
+    with etapa(f"relatorio.{nome}"):
+        return para_json(funcao(_dados_processo[requisito]))
+
+
+def _validar(analises: Iterable[str]) -> List[str]:
+    """Confere os nomes das análises, sem repetições e na ordem pedida."""
+    analises = list(dict.fromkeys(analises))
+    desconhecidas = [nome for nome in analises if nome not in ACUMULADORES and nome not in PERGUNTAS_FASE2]
+    if desconhecidas:
+        raise ErroDadosJogos(f"Análise desconhecida: {', '.join(desconhecidas)}. "
+                             f"Disponíveis: {', '.join([*ACUMULADORES, *PERGUNTAS_FASE2])}")
+    return analises
+
+
+def gerar_relatorio(caminho_arquivo: str, analises: Optional[Iterable[str]] = None,
+                    processos: int = 1) -> Dict[str, Any]:
+    """
+    Lê o CSV uma única vez e executa as análises das fases 1 e 2.
+
+    Args:
+        caminho_arquivo (str): Caminho para o CSV bruto da Steam.
+        analises (Iterable[str], opcional): Nomes das análises: as de
+            `ACUMULADORES` (fase 1) e as de `PERGUNTAS_FASE2`. Se omitido, usa
+            `ANALISES_RELATORIO`.
+        processos (int, opcional): Número de processos das perguntas da fase 2.
+            A fase 1 roda no processo principal, ao mesmo tempo; só quando não
+            há perguntas da fase 2 ela usa os processos na própria varredura.
+
+    Returns:
+        Dict[str, Any]: 'arquivo', 'jogos' e 'resultados' (o resultado de cada
+        análise, pelo nome, na ordem pedida e já em valores aceitos pelo JSON).
+
+    Raises:
+        ErroDadosJogos: Se uma análise não existir.
+    """
+    analises = _validar(ANALISES_RELATORIO if analises is None else analises)
+    fase1 = [nome for nome in analises if nome in ACUMULADORES]
+    fase2 = [nome for nome in analises if nome in PERGUNTAS_FASE2]
+
+    colunas = list(COLUNAS_FASE1) if fase1 else []
+    if fase2:
+        colunas += [coluna for coluna in PREPROCESS_COLUMNS if coluna not in colunas]
+    with etapa('relatorio.leitura') as medicao:
+        # Textos como 'NA' ou 'None' são nomes, gêneros ou empresas, como na leitura da fase 1
+        df = load_raw_data(caminho_arquivo, columns=colunas, keep_text=True)
+        medicao.linhas = len(df)
+
+    dados: Dict[str, Any] = {}
+    if fase2:
+        # As colunas novas são acrescentadas ao próprio DataFrame bruto, cujas colunas originais a fase 1 ainda lê
+        dados['df'] = preprocess_data(df, copy=False, list_columns=False)
+        if any(PERGUNTAS_FASE2[nome][0] == 'cubo' for nome in fase2):
+            with etapa('relatorio.cubo', len(df)):
+                dados['cubo'] = build_cube(dados['df'])
+
+    resultados: Dict[str, Any] = {}
+    executor = None
+    if fase2 and processos > 1:
+        executor = ProcessPoolExecutor(max_workers=min(processos, len(fase2)), initializer=_iniciar_processo,
+                                       initargs=(dados,))
+    try:
+        if executor is not None:
+            futuros = {nome: executor.submit(_responder, nome) for nome in fase2}
+        else:
+            _iniciar_processo(dados)
+            resultados.update((nome, _responder(nome)) for nome in fase2)
+
+        if fase1:
+            analisador = AnalisadorJogos()
+            analisador.carregar_registros(_registros(df, COLUNAS_FASE1), caminho_arquivo)
+            with etapa('relatorio.fase1', len(analisador.dados.tabela)):
+                resultados.update(analisador.executar_analises(fase1, processos=1 if fase2 else processos))
+
+        if executor is not None:
+            resultados.update((nome, futuro.result()) for nome, futuro in futuros.items())
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        _iniciar_processo({})
+
+    return {
+        'arquivo': caminho_arquivo,
+        'jogos': len(df),
+        'resultados': {nome: para_json(resultados[nome]) for nome in analises},
+    }
+
+
+def salvar_relatorio(relatorio: Dict[str, Any], caminho_arquivo: str) -> None:
+    """
+    Grava o relatório em um arquivo JSON.
+
+    Args:
+        relatorio (Dict[str, Any]): Resultado de `gerar_relatorio`.
+        caminho_arquivo (str): Caminho do arquivo JSON.
+    """
+    with open(caminho_arquivo, 'w', encoding='utf-8') as arquivo:
+        json.dump(relatorio, arquivo, indent=2, ensure_ascii=False, allow_nan=False)
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """Executa o relatório pela linha de comando e retorna o código de saída."""
+    parser = argparse.ArgumentParser(description="Relatório em lote das análises dos jogos da Steam.")
+    parser.add_argument('dados', help="CSV bruto dos jogos da Steam")
+    parser.add_argument('saida', help="Arquivo JSON onde gravar o relatório")
+    parser.add_argument('--analises', nargs='+', choices=[*ACUMULADORES, *PERGUNTAS_FASE2],
+                        help="Análises executadas (padrão: as exatas da fase 1 e todas as perguntas da fase 2)")
+    parser.add_argument('--processos', type=int, default=1, help="Processos usados nas análises")
+    args = parser.parse_args(argumentos)
+
+    try:
+        relatorio = gerar_relatorio(args.dados, args.analises, args.processos)
+        salvar_relatorio(relatorio, args.saida)
+    except (ErroDadosJogos, OSError) as e:
+        print(f"Erro ao gerar o relatório: {e}", file=sys.stderr)
+        return 1
+    print(f"{len(relatorio['resultados'])} análises de {relatorio['jogos']} jogos gravadas em {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
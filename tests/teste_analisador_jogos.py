@@ -1,6 +1,15 @@
+import csv
+import os
+import random
+import tempfile
 import unittest
+from bisect import bisect_left
+from unittest import mock
+from src.fase1.acumuladores import FAIXAS_PRECO, FaixasPreco
 from src.fase1.analisador_jogos import AnalisadorJogos
-from src.fase1.dados_jogos import ErroDadosJogos
+from src.fase1.dados_jogos import ErroDadosJogos, TabelaJogos
+from src.fase1.esbocos import ContadorDistintos, EsbocoQuantis
+from src.fase1.indices import Termo
 
 class TesteAnalisadorJogos(unittest.TestCase):
     """Testes para a classe AnalisadorJogos."""
@@ -68,5 +77,152 @@ class TesteAnalisadorJogos(unittest.TestCase):
         self.assertTrue(tem_generos, "Não foram encontrados gêneros em nenhuma faixa de preço")
 
 
+class TesteExecucaoUnica(unittest.TestCase):
+    """Testes para a execução de várias análises em uma única varredura."""
+
+    def setUp(self):
+        """Cria um CSV temporário com jogos de vários preços, anos e gêneros."""
+        self.diretorio = tempfile.TemporaryDirectory()
+        caminho = os.path.join(self.diretorio.name, 'jogos.csv')
+        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(['AppID', 'Name', 'Release date', 'Price', 'Genres'])
+            for i in range(30):
+                preco = ['0', '4.99', '19.99', '59.99', '79.99'][i % 5]
+                generos = ['Indie', 'Action,Indie', 'RPG', 'Strategy,RPG'][i % 4]
+                escritor.writerow([i, f'Jogo {i}', f'Jan {i % 28 + 1}, {2015 + i % 4}', preco, generos])
+        self.analisador = AnalisadorJogos(caminho)
+
+    def tearDown(self):
+        """Remove os arquivos temporários."""
+        self.diretorio.cleanup()
+
+    def test_resultados_iguais_aos_metodos_individuais(self):
+        """Testa se a varredura única reproduz os resultados de cada método."""
+        resultados = self.analisador.executar_analises([
+            'gratuitos_vs_pagos', 'ano_com_mais_lancamentos',
+            'generos_por_faixa_preco', 'estatisticas_preco_por_genero'
+        ])
+        self.assertEqual(resultados['gratuitos_vs_pagos'], self.analisador.analisar_gratuitos_vs_pagos())
+        self.assertEqual(resultados['ano_com_mais_lancamentos'], self.analisador.analisar_ano_com_mais_lancamentos())
+        self.assertEqual(list(resultados['generos_por_faixa_preco'].items()),
+                         list(self.analisador.analisar_generos_por_faixa_preco().items()))
+        self.assertEqual(list(resultados['estatisticas_preco_por_genero'].items()),
+                         list(self.analisador.obter_estatisticas_preco_por_genero().items()))
+
+    def test_execucao_paralela_igual_a_sequencial(self):
+        """Testa se a agregação em fatias paralelas reproduz exatamente a execução sequencial."""
+        analises = ['gratuitos_vs_pagos', 'ano_com_mais_lancamentos',
+                    'generos_por_faixa_preco', 'estatisticas_preco_por_genero']
+        sequencial = self.analisador.executar_analises(analises)
+        paralelo = self.analisador.executar_analises(analises, processos=3)
+        self.assertEqual(paralelo, sequencial)
+        for analise in ('generos_por_faixa_preco', 'estatisticas_preco_por_genero'):
+            self.assertEqual(list(paralelo[analise].items()), list(sequencial[analise].items()))
+        # Empate entre 2015 e 2016, com 8 lançamentos cada
+        self.assertEqual(self.analisador.analisar_ano_com_mais_lancamentos(processos=2), ([2015, 2016], 8))
+
+        # Sem `fork`, cada tarefa recebe apenas a sua fatia da tabela
+        with mock.patch('src.fase1.acumuladores.get_start_method', return_value='spawn'), \
+                mock.patch.object(TabelaJogos, 'selecionar', autospec=True,
+                                  side_effect=TabelaJogos.selecionar) as selecionar:
+            self.assertEqual(self.analisador.executar_analises(analises, processos=3), sequencial)
+        self.assertEqual([len(chamada.args[1]) for chamada in selecionar.call_args_list], [10, 10, 10])
+
+    def test_faixas_de_preco_configuraveis(self):
+        """Testa faixas de preço definidas pelo usuário, sem lacunas entre elas."""
+        resultado = self.analisador.analisar_generos_por_faixa_preco([0, 10, 60], ['Grátis', 'Baratos', 'Médios', 'Caros'])
+        self.assertEqual(list(resultado), ['Grátis', 'Baratos', 'Médios', 'Caros'])
+        self.assertEqual(sum(resultado['Médios'].values()), sum(
+            sum(resultado_padrao.values()) for faixa, resultado_padrao
+            in self.analisador.analisar_generos_por_faixa_preco().items() if faixa in ('R$10-30', 'R$30-60')
+        ))
+        self.assertEqual(FaixasPreco([0, 10]).indice(10.005), 2)
+        self.assertEqual(FAIXAS_PRECO.indice(10.005), 2)
+        self.assertIsNone(FAIXAS_PRECO.indice(-1))
+
+    def test_agregados_mantidos_entre_atualizacoes(self):
+        """Testa se os agregados mantidos acompanham as linhas acrescentadas ao CSV."""
+        self.analisador.manter_agregados()
+        with open(self.analisador.dados.caminho_arquivo, 'a', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.writer(arquivo)
+            for i in range(30, 40):
+                escritor.writerow([i, f'Jogo {i}', 'Jan 1, 2018', '0', 'Simulation,Indie'])
+        self.assertEqual(self.analisador.atualizar_dados(), 10)
+
+        completo = AnalisadorJogos(self.analisador.dados.caminho_arquivo, usar_cache=False)
+        self.assertEqual(self.analisador.analisar_gratuitos_vs_pagos(), completo.analisar_gratuitos_vs_pagos())
+        self.assertEqual(self.analisador.analisar_ano_com_mais_lancamentos(), (2018, 17))
+        self.assertEqual(list(self.analisador.analisar_generos_por_faixa_preco().items()),
+                         list(completo.analisar_generos_por_faixa_preco().items()))
+        self.assertEqual(list(self.analisador.obter_estatisticas_preco_por_genero().items()),
+                         list(completo.obter_estatisticas_preco_por_genero().items()))
+
+        # Uma célula por gênero e faixa, também depois de a matriz crescer
+        acumulador = self.analisador.agregados['generos_por_faixa_preco']
+        self.assertEqual(len(acumulador.matriz), len(acumulador.termos) * len(acumulador.faixas))
+        parcial = acumulador.vazio()
+        parcial.combinar(acumulador)
+        self.assertEqual(len(parcial.matriz), len(acumulador.matriz))
+
+    def test_analises_filtradas_por_consulta(self):
+        """Testa análises restritas aos jogos selecionados pelos índices."""
+        resultado = self.analisador.executar_analises(['gratuitos_vs_pagos', 'estatisticas_preco_por_genero'],
+                                                      Termo('generos', 'RPG'))
+        self.assertEqual(resultado['gratuitos_vs_pagos'], {'gratuitos': 14.29, 'pagos': 85.71})
+        self.assertEqual(list(resultado['estatisticas_preco_por_genero']), ['Strategy', 'RPG'])
+        self.assertEqual(resultado['estatisticas_preco_por_genero']['RPG']['total_jogos'], 14)
+        self.assertEqual(self.analisador.obter_estatisticas_preco_por_genero(Termo('generos', 'RPG')),
+                         resultado['estatisticas_preco_por_genero'])
+
+    def test_estatisticas_aproximadas_em_fluxo(self):
+        """Testa se a leitura em fluxo produz as mesmas estimativas que os dados carregados."""
+        em_memoria = self.analisador.estimar_estatisticas_preco()
+        em_fluxo = AnalisadorJogos().estimar_estatisticas_preco(self.analisador.dados.caminho_arquivo)
+        self.assertEqual(em_memoria, em_fluxo)
+        self.assertEqual(em_memoria['por_genero']['RPG']['p50'], 19.99)
+        self.assertEqual(list(em_memoria['por_ano']), [2015, 2016, 2017, 2018])
+        self.assertEqual(em_memoria['por_ano'][2015]['total_jogos'], 8)
+
+    def test_analise_desconhecida(self):
+        """Testa o erro ao pedir uma análise inexistente."""
+        with self.assertRaises(ErroDadosJogos):
+            self.analisador.executar_analises(['inexistente'])
+
+
+
+class TesteEsbocos(unittest.TestCase):
+    """Testes para os esboços de quantis e de valores distintos."""
+
+    def test_quantis_dentro_do_erro_de_posto(self):
+        """Testa se os quantis estimados e combinados respeitam o erro declarado."""
+        gerador = random.Random(7)
+        valores = [gerador.lognormvariate(2, 1) for _ in range(50_000)]
+        ordenados = sorted(valores)
+        esboco, outro = EsbocoQuantis(semente=1), EsbocoQuantis(semente=2)
+        esboco.estender(valores[:30_000])
+        outro.estender(valores[30_000:])
+        esboco.combinar(outro)
+        self.assertEqual(esboco.total, len(valores))
+        self.assertLess(len(esboco), 1_000)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            posto = bisect_left(ordenados, esboco.quantil(q)) / len(valores)
+            self.assertAlmostEqual(posto, q, delta=esboco.erro_posto())
+        self.assertEqual(esboco.quantil(1), max(valores))
+
+    def test_contagem_de_distintos(self):
+        """Testa a estimativa de distintos, inclusive após combinar contadores."""
+        contador, outro = ContadorDistintos(), ContadorDistintos()
+        for i in range(20_000):
+            contador.adicionar(f"Publicadora {i}")
+            outro.adicionar(f"Publicadora {i + 10_000}")
+        contador.combinar(outro)
+        self.assertAlmostEqual(contador.estimar(), 30_000, delta=30_000 * 4 * contador.erro_padrao())
+        pequeno = ContadorDistintos()
+        for nome in ['Valve', 'Valve', 'Ubisoft']:
+            pequeno.adicionar(nome)
+        self.assertEqual(pequeno.estimar(), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
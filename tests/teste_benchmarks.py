@@ -0,0 +1,41 @@
+import filecmp
+import os
+import tempfile
+import unittest
+from benchmarks.executar_benchmarks import comparar
+from benchmarks.gerador_catalogo import COLUNAS, gerar_catalogo
+from src.fase1.dados_jogos import DadosJogos
+
+
+class TesteBenchmarks(unittest.TestCase):
+    """Testes para o gerador de catálogos e a comparação com a linha de base."""
+
+    def test_catalogo_deterministico_e_legivel(self):
+        """Testa se a mesma semente gera o mesmo arquivo e se ele é carregado por completo."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            primeiro = os.path.join(diretorio, 'a.csv')
+            segundo = os.path.join(diretorio, 'b.csv')
+            gerar_catalogo(primeiro, 500, semente=3)
+            gerar_catalogo(segundo, 500, semente=3)
+            self.assertTrue(filecmp.cmp(primeiro, segundo, shallow=False))
+
+            dados = DadosJogos(primeiro, usar_cache=False)
+            self.assertEqual(dados.obter_contagem_jogos(), 500)
+            self.assertEqual(len(COLUNAS), 39)
+            self.assertTrue(any(len(generos) > 1 for generos in dados.tabela.generos))
+            self.assertGreater(len(dados.contar_lancamentos_por_ano()), 10)
+
+    def test_regressao_acima_do_limite(self):
+        """Testa se só pioras acima do limite e da tolerância de ruído são apontadas."""
+        base = {'1000': {'carregar_dados': {'segundos': 1.0, 'pico_memoria_mb': 50.0},
+                         'analisar_gratuitos_vs_pagos': {'segundos': 0.001}}}
+        resultados = {'1000': {'carregar_dados': {'segundos': 1.2, 'pico_memoria_mb': 80.0},
+                               'analisar_gratuitos_vs_pagos': {'segundos': 0.005}}}
+        regressoes = comparar(resultados, base, limite=0.25)
+        self.assertEqual(len(regressoes), 1)
+        self.assertIn('pico_memoria_mb', regressoes[0])
+        self.assertEqual(comparar(resultados, base, limite=1.0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.fase2.cubo import AggregateCube, build_cube
+from src.fase2.preprocessamento import count_values, preprocess_data
+from tests.teste_preprocessamento import criar_df_bruto
+
+
+class TesteCuboAgregados(unittest.TestCase):
+    """Testes para o cubo de agregados dos dados processados."""
+
+    def setUp(self):
+        """Calcula o cubo do DataFrame de teste pré-processado."""
+        self.df = preprocess_data(criar_df_bruto())
+        self.cubo = build_cube(self.df)
+
+    def test_consultas_iguais_ao_dataframe(self):
+        """Testa se agrupamentos e filtros do cubo reproduzem as contas feitas no DataFrame."""
+        linux = self.cubo.share('supports_linux', by=['release_year'], where={'release_year': range(2018, 2023)})
+        self.assertEqual(linux.to_dict('list'), {'release_year': [2022], 'matching': [1], 'total': [2],
+                                                 'percentage': [50.0]})
+        self.assertEqual(self.cubo.share('supports_mac')['percentage'], 25.0)
+
+        generos = self.cubo.query('games', by=['genre'])
+        self.assertEqual(dict(zip(generos['genre'], generos['games'])), count_values(self.df['Genres']).to_dict())
+
+        single_player = self.cubo.query(['games', 'positive', 'avg_price'], by=['genre'],
+                                        where={'genre': ['Indie', 'Casual'], 'category': 'Single-player'})
+        self.assertEqual(single_player['genre'].tolist(), ['Indie', 'Casual'])
+        self.assertEqual(single_player['games'].tolist(), [2, 1])
+        self.assertEqual(single_player['positive'].tolist(), [35, 5])
+        self.assertAlmostEqual(single_player['avg_price'][0], 69.99 / 2)
+
+        faixas = self.cubo.query(['games', 'rated_games', 'positive_ratio_mean'], by=['price_range'])
+        self.assertEqual(faixas['price_range'].tolist(), ['Gratuito', 'Até $5', '$5-10', '$60-100'])
+        self.assertAlmostEqual(faixas['positive_ratio_mean'][2], 100 / 110)
+        with self.assertRaises(ValueError):
+            self.cubo.query('games', where={'genre': ['Indie', 'RPG']})
+
+    def test_gravacao_e_leitura(self):
+        """Testa se o cubo gravado em arquivo responde às consultas como o original."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, 'cubo.npz')
+            self.cubo.save(caminho)
+            lido = AggregateCube.load(caminho)
+        self.assertEqual(lido.labels, self.cubo.labels)
+        pd.testing.assert_frame_equal(lido.query(['games', 'negative'], by=['release_year', 'supports_linux']),
+                                      self.cubo.query(['games', 'negative'], by=['release_year', 'supports_linux']))
+
+
+if __name__ == "__main__":
+    unittest.main()
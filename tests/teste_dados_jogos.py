@@ -0,0 +1,279 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import date
+from src.fase1.cache_tabela import caminho_cache, carregar_cache
+from src.fase1.dados_jogos import DadosJogos, ErroDadosJogos, Jogo
+from src.fase1.datas import ConversorDatas
+from src.fase1.indices import Termo
+from src.instrumentacao import INSTRUMENTACAO
+
+CAMPOS = ['AppID', 'Name', 'Release date', 'Estimated owners', 'Price',
+          'Developers', 'Publishers', 'Genres']
+
+LINHAS = [
+    ['10', 'Counter-Strike', 'Nov 1, 2000', '10000000 - 20000000', '9.99',
+     'Valve', 'Valve', 'Action'],
+    ['20', 'Team Fortress', 'Apr 1, 1999', '5000000 - 10000000', '4.99',
+     'Valve', 'Valve', 'Action'],
+    ['30', 'Jogo Grátis', 'Jan 5, 2022', '0 - 20000', '0',
+     'Estúdio A;Estúdio B', 'Editora X', 'Casual, Indie'],
+    ['40', 'RPG Caro', 'Mar 10, 2022', '0 - 20000', '69.99',
+     'Estúdio B', 'Editora X;Editora Y', 'RPG,Indie'],
+    ['50', 'Sem Data', '', '0 - 20000', '', '', '', ''],
+]
+
+
+def escrever_csv(caminho, linhas, campos=CAMPOS):
+    """Escreve um CSV de teste com os campos e linhas fornecidos."""
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(campos)
+        escritor.writerows(linhas)
+
+
+class TesteDadosJogos(unittest.TestCase):
+    """Testes para as classes DadosJogos e Jogo."""
+
+    def setUp(self):
+        """Cria um CSV temporário com um pequeno conjunto de jogos."""
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, 'jogos.csv')
+        escrever_csv(self.caminho, LINHAS)
+        self.dados = DadosJogos(self.caminho)
+
+    def tearDown(self):
+        """Remove os arquivos temporários."""
+        self.diretorio.cleanup()
+
+    def test_jogos_sao_visoes_sobre_a_tabela(self):
+        """Testa se os atributos lidos pelas visões correspondem ao CSV."""
+        self.assertEqual(len(self.dados.jogos), len(LINHAS))
+        jogo = self.dados.jogos[2]
+        self.assertEqual(jogo.app_id, '30')
+        self.assertEqual(jogo.nome, 'Jogo Grátis')
+        self.assertTrue(jogo.gratuito)
+        self.assertEqual(jogo.desenvolvedores, ['Estúdio A', 'Estúdio B'])
+        self.assertEqual(jogo.generos, ['Casual', 'Indie'])
+        self.assertEqual(jogo.ano_lancamento(), 2022)
+        self.assertIsNone(self.dados.jogos[-1].ano_lancamento())
+        self.assertFalse(hasattr(jogo, '__dict__'))
+
+    def test_termos_repetidos_sao_codificados_uma_vez(self):
+        """Testa se textos repetidos são armazenados uma única vez."""
+        tabela = self.dados.tabela
+        self.assertEqual(tabela.publicadores.termos.valores, ['Valve', 'Editora X', 'Editora Y'])
+        self.assertEqual(len(tabela.donos_estimados.termos), 3)
+
+    def test_jogo_criado_de_dicionario(self):
+        """Testa a criação de um Jogo isolado a partir de um dicionário."""
+        jogo = Jogo(dict(zip(CAMPOS, LINHAS[3])))
+        self.assertEqual(jogo.preco, 69.99)
+        self.assertEqual(jogo.publicadores, ['Editora X', 'Editora Y'])
+        with self.assertRaises(ErroDadosJogos):
+            Jogo({'Name': 'Preço inválido', 'Price': 'abc'})
+
+    def test_datas_convertidas_no_carregamento(self):
+        """Testa se ano e data completa são pré-calculados na carga."""
+        self.assertEqual(self.dados.jogos[0].data_lancamento_convertida(), date(2000, 11, 1))
+        self.assertEqual(self.dados.contar_lancamentos_por_ano(), {2000: 1, 1999: 1, 2022: 2})
+        self.assertEqual(self.dados.obter_ano_com_mais_lancamentos(), 2022)
+
+    def test_carregamento_paralelo_igual_ao_sequencial(self):
+        """Testa a leitura em paralelo com campos que contêm quebras de linha."""
+        linhas = [[str(i), f'Jogo "{i}"\ncom, quebra'] + linha[2:] for i, linha in enumerate(LINHAS * 40)]
+        escrever_csv(self.caminho, linhas)
+        sequencial = DadosJogos(self.caminho)
+        paralelo = DadosJogos()
+        paralelo.carregar_dados(self.caminho, processos=3)
+        self.assertEqual(paralelo.tabela.nomes, sequencial.tabela.nomes)
+        self.assertEqual(list(paralelo.tabela.generos), list(sequencial.tabela.generos))
+        self.assertEqual(list(paralelo.tabela.precos), list(sequencial.tabela.precos))
+
+        em_fluxo = DadosJogos.iterar_jogos(self.caminho, linhas_por_lote=7)
+        self.assertEqual([jogo.app_id for jogo in em_fluxo], sequencial.tabela.app_ids)
+
+    def test_amostra_reproduzivel_e_estratificada(self):
+        """Testa a amostra por reservatório com semente e estratificação por ano."""
+        linhas = [[str(i), f'Jogo {i}', f'Jan 1, {2020 + (i % 4 == 0)}'] + LINHAS[0][3:] for i in range(200)]
+        escrever_csv(self.caminho, linhas)
+        saidas = [os.path.join(self.diretorio.name, f'amostra{i}.csv') for i in range(2)]
+        for saida in saidas:
+            DadosJogos().criar_amostra(20, saida, semente=7, estratificar_por='ano', arquivo_origem=self.caminho)
+
+        with open(saidas[0], encoding='utf-8') as a, open(saidas[1], encoding='utf-8') as b:
+            self.assertEqual(a.read(), b.read())
+        amostra = DadosJogos(saidas[0])
+        self.assertEqual(amostra.contar_lancamentos_por_ano(), {2020: 15, 2021: 5})
+        self.assertEqual(amostra.tabela.app_ids, sorted(amostra.tabela.app_ids, key=int))
+
+    def test_cache_binario_reutilizado_e_invalidado(self):
+        """Testa a gravação, reutilização e invalidação do cache binário."""
+        self.assertTrue(os.path.exists(caminho_cache(self.caminho)))
+        self.assertIsNotNone(carregar_cache(self.caminho))
+        do_cache = DadosJogos(self.caminho)
+        self.assertEqual(do_cache.tabela.nomes, self.dados.tabela.nomes)
+        self.assertEqual(list(do_cache.tabela.generos), list(self.dados.tabela.generos))
+        self.assertEqual(do_cache.jogos[3].data_lancamento_convertida(), date(2022, 3, 10))
+
+        # Sem poder regravar o cache, só com a data de modificação alterada, o cache lido ainda é usado
+        temporario = f"{caminho_cache(self.caminho)}.{os.getpid()}.tmp"
+        os.mkdir(temporario)
+        try:
+            os.utime(self.caminho, (1_000_000_000, 1_000_000_000))
+            self.assertEqual(DadosJogos(self.caminho).tabela.nomes, self.dados.tabela.nomes)
+        finally:
+            os.rmdir(temporario)
+
+        escrever_csv(self.caminho, LINHAS[:2])
+        self.assertIsNone(carregar_cache(self.caminho))
+        self.assertEqual(len(DadosJogos(self.caminho).jogos), 2)
+
+    def test_consultas_pelos_indices_invertidos(self):
+        """Testa consultas E/OU por gênero, publicadora e desenvolvedor e a busca por AppID."""
+        self.assertEqual(list(self.dados.consultar(Termo('generos', 'Indie'))), [2, 3])
+        self.assertEqual(list(self.dados.consultar(Termo('generos', 'Action') | Termo('generos', 'RPG'))), [0, 1, 3])
+        consulta = Termo('publicadores', 'Editora X') & Termo('desenvolvedores', 'Estúdio B') & Termo('generos', 'RPG')
+        self.assertEqual([jogo.nome for jogo in self.dados.filtrar(consulta)], ['RPG Caro'])
+        self.assertEqual(len(self.dados.consultar(Termo('generos', 'Inexistente'))), 0)
+        self.assertEqual(self.dados.indice('publicadores').contagens(), {'Valve': 2, 'Editora X': 2, 'Editora Y': 1})
+        self.assertEqual(self.dados.buscar_jogo('40').nome, 'RPG Caro')
+        self.assertIsNone(self.dados.buscar_jogo('99'))
+        with self.assertRaises(ErroDadosJogos):
+            self.dados.indice('nomes')
+
+        linhas = self.dados.consultar(Termo('generos', 'Indie'))
+        linhas.append(0)
+        self.assertEqual(list(self.dados.consultar(Termo('generos', 'Indie'))), [2, 3])
+
+    def test_busca_por_nome(self):
+        """Testa as buscas exata, por prefixo e aproximada e os nomes repetidos no índice de nomes."""
+        with open(self.caminho, 'a', newline='', encoding='utf-8') as arquivo:
+            csv.writer(arquivo).writerows([['60', 'Counter-Strike', 'Nov 1, 2000', '0 - 20000', '9.99', '', '', ''],
+                                           ['70', 'JOGO  GRATIS', 'Jan 5, 2022', '0 - 20000', '0', '', '', '']])
+        self.dados.atualizar_dados()
+        indice = self.dados.indice_nomes()
+
+        self.assertEqual([jogo.app_id for jogo in self.dados.buscar_por_nome('jogo grátis')], ['30', '70'])
+        self.assertEqual(indice.exato('counter-strike')[0].app_ids, ['10', '60'])
+        self.assertEqual(indice.exato('Inexistente'), [])
+        self.assertEqual([resultado.nome for resultado in indice.prefixo('t')], ['Team Fortress'])
+        self.assertEqual([resultado.nome for resultado in indice.prefixo('')][:2], ['Counter-Strike', 'Jogo Grátis'])
+
+        aproximados = indice.aproximado('conter strike')
+        self.assertEqual(aproximados[0].nome, 'Counter-Strike')
+        self.assertTrue(all(0.3 <= resultado.similaridade < 1 for resultado in aproximados))
+        self.assertEqual(indice.aproximado('Team Fortress')[0].similaridade, 1.0)
+        self.assertEqual(indice.duplicados(), {'Counter-Strike': ['10', '60']})
+
+        indice.exato('counter-strike')[0].linhas.append(1)
+        self.assertEqual(list(indice.exato('counter-strike')[0].linhas), [0, 5])
+
+    def test_atualizacao_le_apenas_linhas_acrescentadas(self):
+        """Testa a leitura incremental de jogos acrescentados ao final do CSV."""
+        self.assertEqual(list(self.dados.consultar(Termo('generos', 'Indie'))), [2, 3])
+        with open(self.caminho, 'a', newline='', encoding='utf-8') as arquivo:
+            csv.writer(arquivo).writerow(['60', 'Novo\nJogo', 'Feb 2, 2023', '0 - 20000', '1.99',
+                                          'Estúdio C', 'Editora Z', 'Indie'])
+            arquivo.write('70,Incompleto,"Mar 3')
+        self.assertEqual(self.dados.atualizar_dados(), len(LINHAS))
+        self.assertEqual(self.dados.tabela.nomes[-1], 'Novo\nJogo')
+        self.assertEqual(list(self.dados.consultar(Termo('generos', 'Indie'))), [2, 3, 5])
+        self.assertEqual(len(self.dados.jogos), len(LINHAS) + 1)
+
+        # O registro incompleto é lido quando terminar de ser escrito
+        with open(self.caminho, 'a', newline='', encoding='utf-8') as arquivo:
+            arquivo.write(', 2023",0 - 20000,5,,,Action\r\n')
+        self.assertEqual(self.dados.atualizar_dados(), len(LINHAS) + 1)
+        completo = DadosJogos(self.caminho, usar_cache=False)
+        self.assertEqual(self.dados.tabela.app_ids, completo.tabela.app_ids)
+        self.assertEqual(list(self.dados.tabela.generos), list(completo.tabela.generos))
+
+        # Um arquivo reescrito é recarregado por completo
+        escrever_csv(self.caminho, LINHAS[1:] + LINHAS[:1])
+        self.assertEqual(self.dados.atualizar_dados(), 0)
+        self.assertEqual(self.dados.tabela.app_ids[0], '20')
+
+
+class TesteConversorDatas(unittest.TestCase):
+    """Testes para a classe ConversorDatas."""
+
+    def test_formato_dominante_passa_a_ser_tentado_primeiro(self):
+        """Testa se o formato mais frequente é promovido na ordem de tentativas."""
+        conversor = ConversorDatas()
+        for dia in range(1, 4):
+            self.assertEqual(conversor.converter(f"2021-05-0{dia}"), (2021, date(2021, 5, dia)))
+        self.assertEqual(conversor.formato_dominante(), "%Y-%m-%d")
+        self.assertEqual(conversor.converter("Oct 21, 2008"), (2008, date(2008, 10, 21)))
+
+    def test_ano_sem_data_completa(self):
+        """Testa a extração apenas do ano quando a data não tem formato conhecido."""
+        conversor = ConversorDatas()
+        self.assertEqual(conversor.converter("Oct 2008"), (2008, None))
+        self.assertEqual(conversor.converter(""), (None, None))
+        self.assertEqual(conversor.converter("em breve"), (None, None))
+
+
+class TesteInstrumentacao(unittest.TestCase):
+    """Testes da instrumentação das etapas e da contagem de linhas rejeitadas."""
+
+    def setUp(self):
+        """Cria um CSV temporário com duas linhas de preço inválido."""
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, 'jogos.csv')
+        invalidas = [['60', 'Preço Inválido', 'Jan 1, 2020', '0 - 20000', 'grátis', '', '', ''],
+                     ['70', 'Outro Inválido', 'Jan 1, 2020', '0 - 20000', 'R$ 5', '', '', '']]
+        escrever_csv(self.caminho, LINHAS + invalidas)
+
+    def tearDown(self):
+        """Desativa a instrumentação e remove os arquivos temporários."""
+        INSTRUMENTACAO.desativar()
+        INSTRUMENTACAO.reiniciar()
+        self.diretorio.cleanup()
+
+    def test_desativada_por_padrao(self):
+        """Testa se nada é medido sem ativar a instrumentação."""
+        with redirect_stdout(io.StringIO()):
+            DadosJogos(self.caminho, usar_cache=False)
+        self.assertFalse(INSTRUMENTACAO.ativa)
+        self.assertEqual(INSTRUMENTACAO.relatorio(), {'etapas': {}, 'rejeicoes': {}})
+
+    def test_rejeicoes_agregadas_em_um_aviso(self):
+        """Testa se as linhas rejeitadas geram um único aviso com a contagem por tipo."""
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            dados = DadosJogos(self.caminho, usar_cache=False)
+        self.assertEqual(len(dados.tabela), len(LINHAS))
+        avisos = saida.getvalue().splitlines()
+        self.assertEqual(len(avisos), 1)
+        self.assertIn("2 linha(s)", avisos[0])
+        self.assertIn("ValueError: 2", avisos[0])
+
+    def test_relatorio_por_etapa_em_json(self):
+        """Testa o relatório estruturado das etapas e sua gravação em JSON."""
+        INSTRUMENTACAO.ativar()
+        with redirect_stdout(io.StringIO()):
+            DadosJogos(self.caminho, usar_cache=False)
+        relatorio = INSTRUMENTACAO.relatorio()
+
+        carga = relatorio['etapas']['carregar_dados']
+        self.assertEqual(carga['chamadas'], 1)
+        self.assertEqual(carga['linhas'], len(LINHAS))
+        self.assertGreaterEqual(carga['segundos_cpu'], 0)
+        self.assertGreater(carga['pico_memoria_mb'], 0)
+        self.assertEqual(relatorio['etapas']['carregar_dados.conversao']['linhas'], len(LINHAS) + 2)
+        self.assertIn('carregar_dados.conversao.datas', relatorio['etapas'])
+        self.assertEqual(relatorio['rejeicoes']['carregar_dados']['por_tipo'], {'ValueError': 2})
+
+        caminho_json = os.path.join(self.diretorio.name, 'relatorio.json')
+        INSTRUMENTACAO.salvar_json(caminho_json)
+        with open(caminho_json, encoding='utf-8') as arquivo:
+            self.assertEqual(json.load(arquivo), relatorio)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.fase2.empresas import company_stats
+from src.fase2.preprocessamento import owners_midpoint
+
+
+class TesteEstatisticasEmpresas(unittest.TestCase):
+    """Testes para as estatísticas por publicadora e desenvolvedora."""
+
+    def setUp(self):
+        """Cria jogos pagos com várias publicadoras por jogo, como no CSV original."""
+        gerador = np.random.default_rng(5)
+        linhas = 400
+        editoras = np.array(['Valve', 'Ubisoft', 'Sega', 'Capcom', 'Indie Co'])
+        self.df = pd.DataFrame({
+            'publisher': pd.Categorical([';'.join(gerador.choice(editoras, gerador.integers(1, 3), replace=False))
+                                         for _ in range(linhas)]),
+            'positive': gerador.integers(0, 1000, linhas),
+            'price': gerador.choice([4.99, 9.99, 19.99, np.nan], linhas),
+            'owners': owners_midpoint(pd.Series(gerador.choice(['0 - 20000', '20000 - 50000'], linhas))),
+        })
+
+    def test_igual_ao_filtro_por_empresa(self):
+        """Testa se as estatísticas de cada empresa são as mesmas do filtro jogo a jogo."""
+        resultado = company_stats(self.df, 'publisher')
+        self.assertEqual(len(resultado), 5)
+        self.assertTrue(resultado['games'].is_monotonic_decreasing)
+        for editora, linha in resultado.iterrows():
+            jogos = self.df[self.df['publisher'].astype(str).str.split(';').map(lambda nomes: editora in nomes)]
+            self.assertEqual(linha['games'], len(jogos))
+            self.assertAlmostEqual(linha['positive_mean'], jogos['positive'].mean())
+            self.assertAlmostEqual(linha['positive_median'], jogos['positive'].median())
+            self.assertAlmostEqual(linha['price_p90'], jogos['price'].quantile(0.9))
+            self.assertAlmostEqual(linha['owners_p25'], jogos['owners'].quantile(0.25))
+
+    def test_maiores_empresas(self):
+        """Testa a seleção das N empresas com mais jogos e a faixa de proprietários."""
+        todas = company_stats(self.df, 'publisher', values=['positive'], percentiles=())
+        maiores = company_stats(self.df, 'publisher', values=['positive'], percentiles=(), top=2)
+        pd.testing.assert_frame_equal(maiores, todas.head(2))
+        self.assertEqual(maiores.columns.tolist(), ['games', 'positive_mean', 'positive_median'])
+        self.assertEqual(owners_midpoint(pd.Series(['0 - 20000', None, 'x'])).tolist()[0], 10000.0)
+
+    def test_sem_empresas(self):
+        """Testa as estatísticas quando nenhum jogo tem publicadora."""
+        sem_editoras = self.df.assign(publisher=pd.Categorical([None] * len(self.df)))
+        resultado = company_stats(sem_editoras, 'publisher', values=['positive'])
+        self.assertTrue(resultado.empty)
+        self.assertEqual(resultado.columns[:2].tolist(), ['games', 'positive_mean'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.fase2.formato_colunar import ProcessedDataset
+from src.fase2.preprocessamento import (PREPROCESS_COLUMNS, contains_pattern, contains_value, count_items,
+                                        count_values, explode_multivalue, load_processed_data, load_raw_data,
+                                        memory_report, multi_hot, preprocess_csv, preprocess_data,
+                                        save_processed_data, split_lists)
+
+
+def criar_df_bruto():
+    """Cria um DataFrame com as colunas do CSV original usadas no pré-processamento."""
+    return pd.DataFrame({
+        'AppID': [10, 20, 30, 40],
+        'Name': ['Counter-Strike', 'Jogo Grátis', 'RPG Caro', 'Sem Gênero'],
+        'Release date': ['Nov 1, 2000', 'Jan 5, 2022', 'Mar 10, 2022', ''],
+        'Estimated owners': ['10000000 - 20000000', '0 - 20000', '20000 - 50000', '0 - 20000'],
+        'Metacritic score': [88, 0, 75, 0],
+        'Positive': [100, 5, 30, 0],
+        'Negative': [10, 1, 3, 0],
+        'Price': [9.99, 0.0, 69.99, 1.99],
+        'DLC count': [0, 1, 2, 0],
+        'Windows': [True, True, True, True],
+        'Mac': [True, False, False, False],
+        'Linux': [True, False, True, False],
+        'Categories': ['Multi-player,PvP', 'Single-player', 'Single-player, Steam Cloud', None],
+        'Genres': ['Action', 'Casual,Indie', 'RPG, Indie', ''],
+        'Screenshots': [None, None, None, None],
+        'Movies': [None, None, None, None],
+        'Publishers': ['Valve', 'Editora X', 'Editora X,Editora Y', ''],
+        'Developers': ['Valve', 'Estúdio A', 'Estúdio B', ''],
+    })
+
+
+class TestePreprocessamento(unittest.TestCase):
+    """Testes para o pré-processamento da fase 2."""
+
+    def setUp(self):
+        """Cria o DataFrame bruto de teste."""
+        self.bruto = criar_df_bruto()
+
+    def test_listas_separadas_por_virgula(self):
+        """Testa se gêneros e categorias usam o mesmo separador do CSV e da fase 1."""
+        df = preprocess_data(self.bruto)
+        self.assertEqual(df['genres_list'].tolist(), [['Action'], ['Casual', 'Indie'], ['RPG', 'Indie'], []])
+        self.assertEqual(df['categories_list'][2], ['Single-player', 'Steam Cloud'])
+        self.assertEqual(split_lists(pd.Series([' a ,b,, ', None])).tolist(), [['a', 'b'], []])
+
+    def test_sem_copia(self):
+        """Testa o pré-processamento no próprio DataFrame, sem listas Python."""
+        df = preprocess_data(self.bruto, copy=False, list_columns=False)
+        self.assertIs(df, self.bruto)
+        self.assertIn('price', self.bruto.columns)
+        self.assertNotIn('genres_list', df.columns)
+
+    def test_material_de_demonstracao(self):
+        """Testa a contagem das URLs de capturas de tela e vídeos em colunas inteiras compactas."""
+        self.bruto['Screenshots'] = ['a.jpg,b.jpg,c.jpg', None, '', 'd.jpg']
+        self.bruto['Movies'] = ['a.mp4', 'b.mp4,c.mp4', None, '']
+        df = preprocess_data(self.bruto)
+        self.assertEqual(df['screenshots'].tolist(), [3, 0, 0, 1])
+        self.assertEqual(df['demo_material'].tolist(), [4, 2, 0, 1])
+        self.assertEqual(df['demo_material'].dtype, np.int16)
+        self.assertEqual(count_items(pd.Series([np.nan, np.nan])).tolist(), [0, 0])
+        self.assertEqual(count_items(pd.Series([None, None], dtype='category')).tolist(), [0, 0])
+        self.assertEqual(count_items(pd.Series(['a,b', None], dtype='category')).tolist(), [2, 0])
+
+    def test_estruturas_multivaloradas(self):
+        """Testa a tabela longa, a matriz multi-hot, as contagens e os filtros por item."""
+        generos = self.bruto['Genres']
+        longa = explode_multivalue(generos)
+        self.assertEqual(longa.index.tolist(), [0, 1, 1, 2, 2])
+        self.assertEqual(longa['value'].tolist(), ['Action', 'Casual', 'Indie', 'RPG', 'Indie'])
+        self.assertEqual(longa['value'].dtype, 'category')
+
+        matriz = multi_hot(generos)
+        self.assertEqual(list(matriz.columns), ['Action', 'Casual', 'Indie', 'RPG'])
+        self.assertEqual(matriz['Indie'].sparse.to_dense().tolist(), [False, True, True, False])
+
+        self.assertEqual(count_values(generos).to_dict(), {'Indie': 2, 'Action': 1, 'Casual': 1, 'RPG': 1})
+        self.assertEqual(contains_value(generos, 'rpg', case=False).tolist(), [False, False, True, False])
+        self.assertFalse(contains_value(pd.Series(['Action RPG']), 'RPG').any())
+
+        textos = pd.Series(['Massively Multiplayer RPG', 'Role-Playing', 'Action,Indie', None, 'Action RPG;Indie'])
+        self.assertEqual(contains_pattern(textos, 'RPG|role-playing', case=False).tolist(),
+                         textos.str.contains('RPG|role-playing', case=False, na=False).tolist())
+        self.assertEqual(contains_pattern(textos.astype('category'), 'rpg').tolist(), [False] * 5)
+
+    def test_multi_hot_esparsa_sem_matriz_densa(self):
+        """Testa se a matriz esparsa é igual à densa e é montada sem alocar a matriz densa inteira."""
+        linhas, itens = 20_000, 500
+        gerador = np.random.default_rng(7)
+        codigos = gerador.integers(0, itens, (linhas, 2))
+        serie = pd.Series([f'Item {a},Item {b}' for a, b in codigos])
+
+        tracemalloc.start()
+        try:
+            esparsa = multi_hot(serie)
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(pico, linhas * itens // 2)
+        densa = multi_hot(serie, sparse=False)
+        self.assertEqual(list(esparsa.columns), list(densa.columns))
+        self.assertTrue(all(isinstance(tipo, pd.SparseDtype) for tipo in esparsa.dtypes))
+        np.testing.assert_array_equal(esparsa.sparse.to_dense().to_numpy(), densa.to_numpy())
+
+    def test_coluna_categorica_sem_valores(self):
+        """Testa as funções multivaloradas em uma coluna categórica só com valores ausentes."""
+        vazia = pd.Series([None, None], dtype='category')
+        self.assertTrue(count_values(vazia).empty)
+        self.assertEqual(contains_value(vazia, 'Valve').tolist(), [False, False])
+        self.assertTrue(explode_multivalue(vazia).empty)
+        self.assertEqual(split_lists(vazia).tolist(), [[], []])
+
+
+class TesteCarregamentoEsquema(unittest.TestCase):
+    """Testes para a leitura do CSV bruto guiada pelo esquema."""
+
+    def setUp(self):
+        """Grava o DataFrame de teste em um CSV temporário, com uma contagem ausente."""
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, 'jogos.csv')
+        bruto = criar_df_bruto()
+        bruto['About the game'] = 'Descrição longa que não é usada no pré-processamento'
+        bruto['DLC count'] = bruto['DLC count'].astype(object)
+        bruto.loc[3, 'DLC count'] = ''
+        bruto.to_csv(self.caminho, index=False)
+
+    def tearDown(self):
+        """Remove os arquivos temporários."""
+        self.diretorio.cleanup()
+
+    def test_colunas_podadas_e_tipos_compactos(self):
+        """Testa a leitura apenas das colunas pedidas, nos tipos do esquema."""
+        df = load_raw_data(self.caminho, columns=PREPROCESS_COLUMNS)
+        self.assertEqual(set(df.columns), set(PREPROCESS_COLUMNS))
+        self.assertEqual(df['Positive'].dtype, 'int32')
+        self.assertEqual(df['Metacritic score'].dtype, 'float32')
+        self.assertEqual(df['DLC count'].dtype, 'float32')
+        self.assertEqual(df['Linux'].tolist(), [True, False, True, False])
+        self.assertEqual(df['Publishers'].dtype, 'category')
+
+        relatorio = memory_report(df)
+        self.assertLessEqual(relatorio['memory_mb'], relatorio['default_memory_mb'])
+        self.assertEqual(relatorio['columns']['Positive']['memory'], 4 * len(df))
+
+    def test_preprocessamento_com_colunas_podadas(self):
+        """Testa se o pré-processamento omite as colunas cuja origem não foi lida."""
+        df = preprocess_data(load_raw_data(self.caminho, columns=['Name', 'Price', 'Genres']))
+        self.assertEqual(df['is_paid'].tolist(), [True, False, True, True])
+        self.assertEqual(df['genres_list'][1], ['Casual', 'Indie'])
+        self.assertNotIn('release_year', df.columns)
+        self.assertNotIn('supports_linux', df.columns)
+
+    def test_preprocessamento_em_blocos_igual_ao_em_memoria(self):
+        """Testa se o processamento em blocos grava os mesmos bytes e dados que o caminho em memória."""
+        em_memoria = os.path.join(self.diretorio.name, 'em_memoria.csv')
+        save_processed_data(preprocess_data(load_raw_data(self.caminho, columns=PREPROCESS_COLUMNS)), em_memoria)
+        with open(em_memoria, 'rb') as arquivo:
+            esperado = arquivo.read()
+
+        for processos in (1, 2):
+            em_blocos = os.path.join(self.diretorio.name, f'em_blocos_{processos}.csv')
+            linhas = preprocess_csv(self.caminho, em_blocos, columns=PREPROCESS_COLUMNS, chunksize=2,
+                                    processes=processos)
+            self.assertEqual(linhas, 4)
+            with open(em_blocos, 'rb') as arquivo:
+                self.assertEqual(arquivo.read(), esperado)
+
+        colunar = os.path.join(self.diretorio.name, 'colunar')
+        preprocess_csv(self.caminho, colunar, columns=PREPROCESS_COLUMNS, chunksize=3)
+        pd.testing.assert_frame_equal(load_processed_data(colunar).sort_index(),
+                                      preprocess_data(load_raw_data(self.caminho, columns=PREPROCESS_COLUMNS)))
+
+
+class TesteFormatoColunar(unittest.TestCase):
+    """Testes para a gravação e leitura dos dados processados no formato colunar."""
+
+    def setUp(self):
+        """Pré-processa o DataFrame de teste e cria um diretório temporário."""
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, 'processados')
+        bruto = criar_df_bruto()
+        bruto['Publishers'] = bruto['Publishers'].astype('category')
+        self.df = preprocess_data(bruto)
+
+    def tearDown(self):
+        """Remove os arquivos temporários."""
+        self.diretorio.cleanup()
+
+    def test_tipos_preservados(self):
+        """Testa se listas, datas, categorias e textos voltam com os tipos originais."""
+        save_processed_data(self.df, self.caminho)
+        lido = load_processed_data(self.caminho)
+        self.assertEqual(lido.index.tolist(), [0, 1, 2, 3])
+        pd.testing.assert_frame_equal(lido.sort_index(), self.df)
+        self.assertEqual(lido['genres_list'][2], ['RPG', 'Indie'])
+        self.assertEqual(lido['Publishers'].dtype, 'category')
+
+    def test_poda_de_colunas_e_particoes(self):
+        """Testa se a consulta lê só as partições pedidas e se as gravações acrescentam partes."""
+        save_processed_data(self.df, self.caminho)
+        novos = self.df.iloc[[2]].copy()
+        novos.index = [4]
+        save_processed_data(novos, self.caminho, append=True)
+
+        conjunto = ProcessedDataset(self.caminho)
+        self.assertEqual(conjunto.partitions, [2000, 2022, None])
+        self.assertEqual(conjunto.num_rows, 5)
+        self.assertEqual([particao['value'] for particao in conjunto.select_partitions(range(2018, 2023))], [2022])
+
+        lido = load_processed_data(self.caminho, columns=['name', 'supports_linux'], partitions=range(2018, 2023))
+        self.assertEqual(list(lido.columns), ['name', 'supports_linux'])
+        self.assertEqual(lido['name'].tolist(), ['Jogo Grátis', 'RPG Caro', 'RPG Caro'])
+        self.assertEqual(lido['supports_linux'].tolist(), [False, True, True])
+        with self.assertRaises(ValueError):
+            save_processed_data(self.df[['name']], self.caminho, append=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.fase2.ranking import top_k
+
+
+class TesteTopK(unittest.TestCase):
+    """Testes para a seleção das K melhores linhas."""
+
+    def setUp(self):
+        """Cria jogos com notas empatadas, nomes repetidos, datas ausentes e publicadoras."""
+        gerador = np.random.default_rng(3)
+        linhas = 500
+        self.df = pd.DataFrame({
+            'name': [f'Jogo {i}' for i in gerador.integers(0, 150, linhas)],
+            'metacritic_score': gerador.integers(60, 100, linhas).astype('float32'),
+            'release_date': pd.to_datetime(gerador.integers(0, 400, linhas), unit='D', origin='2010-01-01'),
+            'publisher': gerador.choice(['Valve', 'Ubisoft', 'Sega', 'Capcom'], linhas),
+        })
+        self.df.loc[self.df.index % 7 == 0, 'release_date'] = pd.NaT
+
+    def test_igual_a_ordenacao_completa(self):
+        """Testa se o top 10 sem repetições reproduz a ordenação seguida de drop_duplicates e head."""
+        esperado = (self.df.sort_values(['metacritic_score', 'release_date'], ascending=[False, True])
+                    .drop_duplicates(subset=['name'], keep='first').head(10))
+        resultado = top_k(self.df, 10, by=['metacritic_score', 'release_date'], ascending=[False, True],
+                          distinct='name')
+        pd.testing.assert_frame_equal(resultado, esperado)
+        self.assertTrue(top_k(self.df, 0, by='metacritic_score').empty)
+
+    def test_melhores_por_grupo(self):
+        """Testa o top 3 de cada publicadora, com nomes repetidos removidos dentro do grupo."""
+        esperado = (self.df.sort_values(['metacritic_score', 'release_date'], ascending=[False, True], kind='stable')
+                    .drop_duplicates(subset=['publisher', 'name']).groupby('publisher', sort=False).head(3))
+        resultado = top_k(self.df, 3, by=['metacritic_score', 'release_date'], ascending=[False, True],
+                          distinct='name', group='publisher')
+        pd.testing.assert_frame_equal(resultado, esperado)
+        self.assertEqual(resultado['publisher'].value_counts().tolist(), [3, 3, 3, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
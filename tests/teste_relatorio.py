@@ -0,0 +1,86 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+import pandas as pd
+from benchmarks.gerador_catalogo import gerar_catalogo
+from src.fase1.analisador_jogos import AnalisadorJogos
+from src.fase1.dados_jogos import ErroDadosJogos
+from src.fase2.preprocessamento import preprocess_data
+from src.relatorio import ANALISES_RELATORIO, gerar_relatorio, main, para_json
+
+
+class TesteRelatorio(unittest.TestCase):
+    """Testes para o relatório em lote das fases 1 e 2."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Gera um catálogo sintético compartilhado pelos testes."""
+        cls.diretorio = tempfile.TemporaryDirectory()
+        cls.caminho = os.path.join(cls.diretorio.name, 'catalogo.csv')
+        gerar_catalogo(cls.caminho, 800, semente=5)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove os arquivos temporários."""
+        cls.diretorio.cleanup()
+
+    def test_resultados_iguais_aos_das_fases(self):
+        """Testa se a leitura única dá os mesmos resultados das fases 1 e 2 lidas separadamente."""
+        analises = ['generos_por_faixa_preco', 'quantis_preco_por_ano', 'metacritic_top10', 'linux_por_ano']
+        relatorio = gerar_relatorio(self.caminho, analises)
+        resultados = relatorio['resultados']
+        self.assertEqual(relatorio['jogos'], 800)
+        self.assertEqual(list(resultados), analises)
+
+        analisador = AnalisadorJogos(self.caminho, usar_cache=False)
+        esperado = para_json(analisador.executar_analises(analises[:2]))
+        self.assertEqual(resultados['generos_por_faixa_preco'], esperado['generos_por_faixa_preco'])
+        self.assertEqual(resultados['quantis_preco_por_ano'], esperado['quantis_preco_por_ano'])
+
+        df = preprocess_data(pd.read_csv(self.caminho))
+        ordenado = df.dropna(subset=['metacritic_score']).sort_values(
+            ['metacritic_score', 'release_date'], ascending=[False, True], kind='stable')
+        self.assertEqual([jogo['name'] for jogo in resultados['metacritic_top10']],
+                         ordenado.drop_duplicates('name')['name'].head(10).tolist())
+        linux = df[df['release_year'].between(2018, 2022)].groupby('release_year')['supports_linux'].sum()
+        self.assertEqual([ano['matching'] for ano in resultados['linux_por_ano']['por_ano']], linux.tolist())
+
+    def test_textos_como_na_sao_mantidos(self):
+        """Testa se textos como 'NA' e 'None' são lidos como na fase 1, e não como valores ausentes."""
+        with open(self.caminho, newline='', encoding='utf-8') as arquivo:
+            linhas = list(csv.reader(arquivo))
+        cabecalho = linhas[0]
+        for linha, coluna, texto in ((1, 'Genres', 'NA'), (2, 'Publishers', 'N/A'), (3, 'Name', 'None'),
+                                     (4, 'Developers', 'NULL'), (5, 'Genres', 'Indie,nan')):
+            linhas[linha][cabecalho.index(coluna)] = texto
+        caminho = os.path.join(self.diretorio.name, 'textos_na.csv')
+        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+            csv.writer(arquivo).writerows(linhas)
+
+        analises = ['estatisticas_preco_por_genero', 'generos_por_faixa_preco',
+                    'publicadores_desenvolvedores_distintos']
+        resultados = gerar_relatorio(caminho, analises)['resultados']
+        esperado = para_json(AnalisadorJogos(caminho, usar_cache=False).executar_analises(analises))
+        self.assertEqual(resultados, esperado)
+        self.assertIn('NA', resultados['estatisticas_preco_por_genero'])
+        self.assertIn('nan', resultados['estatisticas_preco_por_genero'])
+
+    def test_processos_e_arquivo_json(self):
+        """Testa se o relatório em paralelo é igual ao sequencial e se a linha de comando grava o JSON."""
+        sequencial = gerar_relatorio(self.caminho)
+        self.assertEqual(list(sequencial['resultados']), list(ANALISES_RELATORIO))
+        self.assertEqual(gerar_relatorio(self.caminho, processos=2), sequencial)
+
+        saida = os.path.join(self.diretorio.name, 'relatorio.json')
+        self.assertEqual(main([self.caminho, saida]), 0)
+        with open(saida, encoding='utf-8') as arquivo:
+            self.assertEqual(json.load(arquivo), sequencial)
+
+        with self.assertRaises(ErroDadosJogos):
+            gerar_relatorio(self.caminho, ['inexistente'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from src.fase2 import visualizacao
+from src.fase2.cubo import build_cube
+from src.fase2.preprocessamento import preprocess_data
+from src.fase2.visualizacao import (CHARTS, FINGERPRINTS_FILE, density_grid, plot_density, register_chart,
+                                    render_charts)
+from tests.teste_preprocessamento import criar_df_bruto
+
+
+class TesteRenderizacaoGraficos(unittest.TestCase):
+    """Testes para a gravação dos gráficos registrados."""
+
+    def setUp(self):
+        """Calcula o cubo do DataFrame de teste e cria o diretório de saída."""
+        self.df = preprocess_data(criar_df_bruto())
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.diretorio.cleanup)
+
+    def test_graficos_gravados_e_reaproveitados(self):
+        """Testa se todos os gráficos são gravados e se os que não mudaram não são desenhados de novo."""
+        desenhados = render_charts(self.df, self.diretorio.name, processes=2)
+        self.assertEqual(desenhados, {nome: True for nome in CHARTS})
+        arquivos = set(os.listdir(self.diretorio.name))
+        self.assertIn(FINGERPRINTS_FILE, arquivos)
+        self.assertTrue({f'{nome}.{formato}' for nome in CHARTS for formato in ('png', 'svg')} <= arquivos)
+
+        self.assertFalse(any(render_charts(self.df, self.diretorio.name).values()))
+
+        # Um jogo a mais com Linux em 2022 muda só os gráficos que dependem disso
+        self.df.loc[1, 'supports_linux'] = True
+        desenhados = render_charts(build_cube(self.df), self.diretorio.name)
+        self.assertTrue(desenhados['os_support'])
+        self.assertTrue(desenhados['linux_by_year'])
+        self.assertFalse(desenhados['single_player_by_genre'])
+
+    def test_formatos_e_selecao(self):
+        """Testa a gravação de só alguns gráficos, em um único formato."""
+        desenhados = render_charts(self.df, self.diretorio.name, charts=['os_support'], formats=('png',))
+        self.assertEqual(desenhados, {'os_support': True})
+        self.assertEqual(sorted(os.listdir(self.diretorio.name)), [FINGERPRINTS_FILE, 'os_support.png'])
+
+    def test_mudanca_no_desenho_invalida_o_grafico(self):
+        """Testa se textos, versão e funções auxiliares do desenho entram na impressão digital."""
+        self.addCleanup(CHARTS.pop, 'teste_titulo', None)
+
+        def desenhar(titulo, ax, colors):
+            ax.set_title('Ano')
+
+        def desenhar_outro_titulo(titulo, ax, colors):
+            ax.set_title('Year')
+
+        for desenho, versao, esperado in ((desenhar, 1, True), (desenhar, 1, False),
+                                          (desenhar_outro_titulo, 1, True), (desenhar_outro_titulo, 2, True)):
+            register_chart('teste_titulo', lambda cube: 1, version=versao)(desenho)
+            desenhados = render_charts(self.df, self.diretorio.name, charts=['teste_titulo'], formats=('png',))
+            self.assertEqual(desenhados, {'teste_titulo': esperado})
+
+        # O texto do eixo fica em `_draw_os_support`, chamada pela função de desenho registrada
+        render_charts(self.df, self.diretorio.name, charts=['os_support'], formats=('png',))
+        original = visualizacao._draw_os_support
+        self.addCleanup(setattr, visualizacao, '_draw_os_support', original)
+
+        def alterado(os_support, ax, colors):
+            original(os_support, ax, colors)
+            ax.set_ylabel('Jogos (%)')
+
+        alterado.__module__ = visualizacao.__name__
+        visualizacao._draw_os_support = alterado
+        self.assertEqual(render_charts(self.df, self.diretorio.name, charts=['os_support'], formats=('png',)),
+                         {'os_support': True})
+
+
+class TesteDensidade(unittest.TestCase):
+    """Testes para o gráfico de densidade de pontos."""
+
+    def setUp(self):
+        """Cria preços e proporções de avaliações positivas, com preços gratuitos e ausentes."""
+        gerador = np.random.default_rng(11)
+        self.precos = pd.Series(gerador.lognormal(2, 1, 5000), name='price')
+        self.precos[::50] = 0.0
+        self.precos[1::70] = np.nan
+        self.proporcoes = pd.Series(gerador.random(5000), name='pos_ratio')
+
+    def test_grade_igual_ao_histogram2d(self):
+        """Testa se a grade agregada por blocos é a mesma de np.histogram2d, em escala linear e logarítmica."""
+        validos = self.precos.notna().to_numpy()
+        contagens, bordas_x, bordas_y = density_grid(self.precos, self.proporcoes, bins=(30, 20), chunksize=777)
+        esperado, esperado_x, esperado_y = np.histogram2d(self.precos[validos], self.proporcoes[validos],
+                                                          bins=(30, 20))
+        np.testing.assert_array_equal(contagens, esperado)
+        np.testing.assert_allclose(bordas_x, esperado_x)
+
+        pagos = (self.precos > 0).to_numpy()
+        contagens, bordas_x, _ = density_grid(self.precos, self.proporcoes, bins=25, log_x=True,
+                                              range=((0.1, 1000), (0, 1)))
+        esperado, esperado_x, _ = np.histogram2d(np.log10(self.precos[pagos]), self.proporcoes[pagos], bins=25,
+                                                 range=((-1, 3), (0, 1)))
+        np.testing.assert_array_equal(contagens, esperado)
+        np.testing.assert_allclose(np.log10(bordas_x), esperado_x)
+
+    def test_grafico_em_escala_logaritmica(self):
+        """Testa o desenho da grade em eixos próprios, com escala logarítmica e rótulos das Series."""
+        figura = Figure()
+        eixos = figura.add_subplot()
+        self.assertIs(plot_density(self.precos, self.proporcoes, bins=40, log_x=True, ax=eixos), figura)
+        self.assertEqual(eixos.get_xscale(), 'log')
+        self.assertEqual((eixos.get_xlabel(), eixos.get_ylabel()), ('price', 'pos_ratio'))
+        self.assertEqual(eixos.collections[0].get_array().shape, (40, 40))
+
+
+if __name__ == "__main__":
+    unittest.main()